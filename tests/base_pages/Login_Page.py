@@ -1,3 +1,4 @@
+from selenium.common.exceptions import NoAlertPresentException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -8,6 +9,7 @@ class LoginPage:
     email_input_id = "email"
     password_input_id = "password"
     login_button_xpath = "//button[@type='submit']"
+    login_error_id = "loginError"
 
     # constructor
     def __init__(self, driver):
@@ -38,3 +40,21 @@ class LoginPage:
             EC.element_to_be_clickable((By.XPATH, self.login_button_xpath))
         )
         element.click()
+
+    # 4: wait until the login leaves the page (True) or shows an error (False)
+    def wait_for_login_result(self, timeout=20):
+        def outcome(driver):
+            # errors are shown in the page, or in an alert without the error box
+            try:
+                driver.switch_to.alert.accept()
+                return "error"
+            except NoAlertPresentException:
+                pass
+            if "Login.html" not in driver.current_url:
+                return "logged_in"
+            errors = driver.find_elements(By.ID, self.login_error_id)
+            if errors and "hidden" not in (errors[0].get_attribute("class") or ""):
+                return "error"
+            return False
+
+        return WebDriverWait(self.driver, timeout).until(outcome) == "logged_in"
@@ -1,8 +1,10 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
-import os
+from selenium.common.exceptions import TimeoutException
+
+from tests.utilities.download_watcher import DownloadWatcher
+from tests.utilities.waits import wait_for_settled
 
 
 class AnalyticsPage:
@@ -13,6 +15,7 @@ class AnalyticsPage:
     start_date_input_id = "startDate"
     end_date_input_id = "endDate"
     current_filter_text_id = "currentFilterText"
+    kpi_container_id = "kpiContainer"
 
     # constructor
     def __init__(self, driver):
@@ -33,18 +36,25 @@ class AnalyticsPage:
 
     # 2: check if file is downloaded
 
-    def is_file_downloaded(self, download_dir, filename_pattern="ComplaNet"):
-        # wait a bit for download to complete
-        time.sleep(3)
-        # check if any file matching pattern exists in download directory
-        if os.path.exists(download_dir):
-            files = os.listdir(download_dir)
-            for file in files:
-                if filename_pattern in file and file.endswith(".pdf"):
-                    return True
-        return False
+    def is_file_downloaded(self, download_dir, filename_pattern="Analytics_Report", timeout=10):
+        # a finished pdf that is already there or arrives within the timeout
+        watcher = DownloadWatcher(download_dir, filename_pattern).start(ignore_existing=False)
+        try:
+            watcher.wait(timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    # 3: download the report and wait for the new file
+
+    def download_report(self, download_dir, timeout=30):
+        # snapshot the folder first so only the new file counts
+        watcher = DownloadWatcher(download_dir, "Analytics_Report").start()
+        self.click_download_report()
+        # returns path, size and latency; raises TimeoutException
+        return watcher.wait(timeout)
 
-    # 3: click month filter
+    # 4: click month filter
 
     def click_month_filter(self):
         # wait for button to be clickable
@@ -55,9 +65,9 @@ class AnalyticsPage:
         # click the button
         month_btn.click()
         # wait for filter to apply
-        time.sleep(2)
+        wait_for_settled(self.driver, self.kpi_container_id)
 
-    # 4: click reset button
+    # 5: click reset button
 
     def click_reset_button(self):
         # identify reset button
@@ -65,9 +75,9 @@ class AnalyticsPage:
         # click the button
         reset_btn.click()
         # wait for reset to apply
-        time.sleep(2)
+        wait_for_settled(self.driver, self.kpi_container_id)
 
-    # 5: get current filter text
+    # 6: get current filter text
 
     def get_current_filter_text(self):
         # identify the filter text element
@@ -75,7 +85,7 @@ class AnalyticsPage:
         # return the text
         return filter_text.text
 
-    # 6: check if filters are cleared
+    # 7: check if filters are cleared
 
     def are_filters_cleared(self):
         # get current filter text
@@ -83,7 +93,7 @@ class AnalyticsPage:
         # check if it shows "All Time" (default state)
         return "All Time" in filter_text
 
-    # 7: get start date value
+    # 8: get start date value
 
     def get_start_date_value(self):
         # identify start date input
@@ -91,7 +101,7 @@ class AnalyticsPage:
         # return the value
         return start_date.get_attribute("value")
 
-    # 8: get end date value
+    # 9: get end date value
 
     def get_end_date_value(self):
         # identify end date input
@@ -0,0 +1,101 @@
+import re
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True)
+class ComplaintRow:
+    title: str
+    category: str
+    # not shown in the table; always empty
+    description: str
+    date: str
+    lodged_by: str
+    status: str
+    id: str
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class ComplaintsTable:
+    # locators
+    table_body_id = "complaintsTableBody"
+
+    # reads every row of the table in a single WebDriver round trip; cells are
+    # found by their column class (the table has no description column)
+    snapshot_script = """
+    var body = document.getElementById(arguments[0]);
+    if (!body) return [];
+
+    function text(element) {
+        return element ? element.innerText.trim() : '';
+    }
+
+    function cell(row, selector) {
+        return text(row.querySelector(selector));
+    }
+
+    var rows = [];
+    for (var i = 0; i < body.rows.length; i++) {
+        var row = body.rows[i];
+
+        // loading, empty and error messages are a single spanning cell
+        if (row.cells.length < 2 || !text(row)) continue;
+
+        rows.push({
+            id: cell(row, '.col-id'),
+            title: cell(row, '.col-title'),
+            category: cell(row, '.col-category'),
+            date: cell(row, '.col-date'),
+            lodged_by: cell(row, '.complainant-name'),
+            status: cell(row, '.col-status')
+        });
+    }
+    return rows;
+    """
+
+    # constructor
+    def __init__(self, driver):
+        self.driver = driver
+
+    # 1: read all rows at once
+
+    def snapshot(self):
+        raw_rows = self.driver.execute_script(self.snapshot_script, self.table_body_id)
+        return [self.to_row(raw) for raw in raw_rows]
+
+    # 2: number of complaint rows (messages are not counted)
+
+    def count(self):
+        return len(self.snapshot())
+
+    # 3: first complaint row, or None if the table is empty
+
+    def first(self):
+        rows = self.snapshot()
+        return rows[0] if rows else None
+
+    # 4: status of every row
+
+    def statuses(self):
+        return [row.status for row in self.snapshot()]
+
+    # convert the raw script result into a typed row
+
+    @staticmethod
+    def to_row(raw):
+        # the id is shown as "#<id>" or inside the lodged by text as "ID: <id>"
+        complaint_id = raw.get("id", "").lstrip("#")
+        if not complaint_id:
+            match = re.search(r"ID: ([a-f0-9-]+)", raw.get("lodged_by", ""))
+            complaint_id = match.group(1) if match else ""
+
+        return ComplaintRow(
+            title=raw.get("title", ""),
+            category=raw.get("category", ""),
+            description="",
+            date=raw.get("date", ""),
+            lodged_by=raw.get("lodged_by", ""),
+            status=raw.get("status", ""),
+            id=complaint_id,
+        )
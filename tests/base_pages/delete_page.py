@@ -1,7 +1,10 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
+
+from tests.utilities.network_idle import wait_for_network_idle
+from tests.utilities.waits import wait_for_table_ready
 
 
 class DeletePage:
@@ -34,15 +37,8 @@ class DeletePage:
         search_input.send_keys(search_keyword)
 
         # wait for search results to load
-        time.sleep(3)
-
-        # wait for table body to have content
-        wait.until(
-            lambda driver: len(
-                driver.find_elements(By.CSS_SELECTOR, f"#{self.complaints_table_body_id} tr")
-            )
-            > 0
-        )
+        wait_for_network_idle(self.driver)
+        wait_for_table_ready(self.driver)
 
         # find the first delete button in search results
         delete_buttons = self.driver.find_elements(
@@ -54,7 +50,6 @@ class DeletePage:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", delete_button
             )
-            time.sleep(1)
             # use JavaScript click for better reliability
             self.driver.execute_script("arguments[0].click();", delete_button)
         else:
@@ -63,21 +58,10 @@ class DeletePage:
     # 2: click delete button (first one in table)
 
     def click_delete_button(self):
-        # wait for the table body to have content (complaints loaded)
-        wait = WebDriverWait(self.driver, 20)
-        # wait for table body to not be empty and not show loading message
-        wait.until(
-            lambda driver: len(
-                driver.find_elements(By.CSS_SELECTOR, f"#{self.complaints_table_body_id} tr")
-            )
-            > 0
-        )
-        wait.until(
-            lambda driver: "Loading complaints"
-            not in driver.find_element(By.ID, self.complaints_table_body_id).text
-        )
-        # wait a bit more for JavaScript to attach event handlers
-        time.sleep(3)
+        # wait for the supabase queries, then for the table body content
+        # row buttons get their handlers while the row is rendered
+        wait_for_network_idle(self.driver)
+        wait_for_table_ready(self.driver)
         # find the first delete button
         delete_buttons = self.driver.find_elements(
             By.CSS_SELECTOR, self.delete_button_css
@@ -88,7 +72,6 @@ class DeletePage:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", delete_button
             )
-            time.sleep(1)
             # use JavaScript click for better reliability
             self.driver.execute_script("arguments[0].click();", delete_button)
         else:
@@ -121,15 +104,25 @@ class DeletePage:
     # 5: check if modal is displayed
 
     def is_modal_displayed(self):
-        # identify the modal
-        modal = self.driver.find_element(By.ID, self.delete_modal_id)
-        # check if modal is displayed
-        return "hidden" not in modal.get_attribute("class")
+        # wait for the modal to open
+        try:
+            WebDriverWait(self.driver, 5).until(
+                lambda driver: "hidden"
+                not in driver.find_element(By.ID, self.delete_modal_id).get_attribute("class")
+            )
+            return True
+        except TimeoutException:
+            return False
 
     # 6: check if modal is closed
 
     def is_modal_closed(self):
-        # identify the modal
-        modal = self.driver.find_element(By.ID, self.delete_modal_id)
-        # check if modal is closed
-        return "hidden" in modal.get_attribute("class")
+        # wait for the modal to close
+        try:
+            WebDriverWait(self.driver, 5).until(
+                lambda driver: "hidden"
+                in driver.find_element(By.ID, self.delete_modal_id).get_attribute("class")
+            )
+            return True
+        except TimeoutException:
+            return False
@@ -2,7 +2,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+
+from tests.base_pages.complaints_table import ComplaintsTable
+from tests.utilities.network_idle import wait_for_network_idle
+from tests.utilities.waits import wait_for_table_ready
 
 
 class FilterPage:
@@ -51,29 +54,15 @@ class FilterPage:
     # 4: select status filter option
 
     def select_status_filter(self, status):
-        # wait for complaints table to load first
-        wait = WebDriverWait(self.driver, 20)
-        # wait for table body to not be empty and not show loading message
-        wait.until(
-            lambda driver: len(
-                driver.find_elements(By.CSS_SELECTOR, f"#{self.complaints_table_body_id} tr")
-            )
-            > 0
-        )
-        wait.until(
-            lambda driver: "Loading complaints"
-            not in driver.find_element(By.ID, self.complaints_table_body_id).text
-        )
-
-        # wait a bit more for filters to be ready
-        time.sleep(2)
+        # wait for the supabase queries and the table render first
+        wait_for_network_idle(self.driver)
+        wait_for_table_ready(self.driver)
 
         # identify the status filter dropdown
         status_filter = self.driver.find_element(By.ID, self.status_filter_dropdown_id)
 
         # scroll to the filter
         self.driver.execute_script("arguments[0].scrollIntoView(true);", status_filter)
-        time.sleep(1)
 
         # use JavaScript to select the option for better reliability
         self.driver.execute_script(
@@ -90,7 +79,7 @@ class FilterPage:
         )
 
         # wait for filter to apply
-        time.sleep(2)
+        wait_for_table_ready(self.driver)
 
     # 5: set date from
 
@@ -105,7 +94,7 @@ class FilterPage:
         """
         )
         # wait for filter to apply
-        time.sleep(1)
+        wait_for_table_ready(self.driver)
 
     # 6: set date to
 
@@ -120,7 +109,7 @@ class FilterPage:
         """
         )
         # wait for filter to apply
-        time.sleep(1)
+        wait_for_table_ready(self.driver)
 
     # 7: clear date from
 
@@ -135,7 +124,7 @@ class FilterPage:
         """
         )
         # wait for filter to apply
-        time.sleep(1)
+        wait_for_table_ready(self.driver)
 
     # 8: clear date to
 
@@ -150,53 +139,30 @@ class FilterPage:
         """
         )
         # wait for filter to apply
-        time.sleep(1)
+        wait_for_table_ready(self.driver)
 
     # 9: get results count
 
     def get_results_count(self):
-        import time
+        # wait for pending requests and for JavaScript to render
+        wait_for_network_idle(self.driver)
+        wait_for_table_ready(self.driver)
 
-        # identify the table body
-        table_body = self.driver.find_element(By.ID, self.complaints_table_body_id)
-
-        # wait a bit for JavaScript to render
-        time.sleep(1)
-
-        # find all rows in the table body
-        rows = table_body.find_elements(By.TAG_NAME, "tr")
-
-        # check if the only row is the "No complaints found" message
-        if len(rows) == 1:
-            row_text = rows[0].text.strip()
-            # check for empty state messages or empty text
-            if (
-                not row_text
-                or "No complaints found" in row_text
-                or "Loading complaints" in row_text
-            ):
-                return 0
-
-        # return the count of actual complaint rows
-        return len(rows)
+        # count the complaint rows (empty state messages are not counted)
+        return ComplaintsTable(self.driver).count()
 
     # 10: check if results contain status
 
     def results_contain_status(self, status):
         # wait for results to load
-        time.sleep(2)
-        # identify the table body
-        table_body = self.driver.find_element(By.ID, self.complaints_table_body_id)
-        # get all status badges
-        status_badges = table_body.find_elements(By.CLASS_NAME, "col-status")
+        wait_for_network_idle(self.driver)
+        wait_for_table_ready(self.driver)
+        # read every status badge in one call
+        statuses = ComplaintsTable(self.driver).statuses()
 
         # if no badges found, return False
-        if len(status_badges) == 0:
+        if len(statuses) == 0:
             return False
 
         # check if all badges match the status
-        for badge in status_badges:
-            if badge.text.strip() != status:
-                return False
-
-        return True
+        return all(badge_status == status for badge_status in statuses)
@@ -1,7 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
 
 
 class LogoutPage:
@@ -73,7 +73,9 @@ class LogoutPage:
     # 6: check if redirected to login page
 
     def is_on_login_page(self):
-        # wait a bit for redirect
-        time.sleep(2)
-        # check if current URL contains Login.html
-        return "Login.html" in self.driver.current_url
+        # wait for the redirect to Login.html
+        try:
+            WebDriverWait(self.driver, 10).until(EC.url_contains("Login.html"))
+            return True
+        except TimeoutException:
+            return False
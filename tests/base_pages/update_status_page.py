@@ -2,7 +2,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
+
+from tests.utilities.network_idle import wait_for_network_idle
+from tests.utilities.waits import wait_for_table_ready
 
 
 class UpdateStatusPage:
@@ -24,22 +27,10 @@ class UpdateStatusPage:
     # 1: click edit button
 
     def click_edit_button(self):
-        # wait for the table body to have content (complaints loaded)
-        wait = WebDriverWait(self.driver, 20)
-        # wait for table body to not be empty and not show loading message
-        wait.until(
-            lambda driver: len(
-                driver.find_elements(By.CSS_SELECTOR, f"#{self.complaints_table_body_id} tr")
-            )
-            > 0
-        )
-        # wait for the loading message to disappear
-        wait.until(
-            lambda driver: "Loading complaints"
-            not in driver.find_element(By.ID, self.complaints_table_body_id).text
-        )
-        # wait a bit more for JavaScript to attach event handlers
-        time.sleep(3)
+        # wait for the supabase queries, then for the table body content
+        # row buttons get their handlers while the row is rendered
+        wait_for_network_idle(self.driver)
+        wait_for_table_ready(self.driver)
         # find the first edit button
         edit_buttons = self.driver.find_elements(By.CSS_SELECTOR, self.edit_status_button_css)
         if len(edit_buttons) > 0:
@@ -48,7 +39,6 @@ class UpdateStatusPage:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", edit_button
             )
-            time.sleep(1)
             # use JavaScript click for better reliability
             self.driver.execute_script("arguments[0].click();", edit_button)
         else:
@@ -66,7 +56,6 @@ class UpdateStatusPage:
 
         # Make it visible if hidden (often needed for frameworks hiding the real select)
         self.driver.execute_script("arguments[0].style.display = 'block';", select_element)
-        time.sleep(0.5) 
 
         dropdown = Select(select_element)
         dropdown.select_by_visible_text(status)
@@ -107,14 +96,24 @@ class UpdateStatusPage:
 
     # 6: check if modal is displayed
     def is_modal_displayed(self):
-        # identify the modal
-        modal = self.driver.find_element(By.ID, self.status_modal_id)
-        # check if modal is displayed
-        return "hidden" not in modal.get_attribute("class")
+        # wait for the modal to open
+        try:
+            WebDriverWait(self.driver, 5).until(
+                lambda driver: "hidden"
+                not in driver.find_element(By.ID, self.status_modal_id).get_attribute("class")
+            )
+            return True
+        except TimeoutException:
+            return False
 
     # 7: check if modal is closed
     def is_modal_closed(self):
-        # identify the modal
-        modal = self.driver.find_element(By.ID, self.status_modal_id)
-        # check if modal is closed
-        return "hidden" in modal.get_attribute("class")
+        # wait for the modal to close
+        try:
+            WebDriverWait(self.driver, 5).until(
+                lambda driver: "hidden"
+                in driver.find_element(By.ID, self.status_modal_id).get_attribute("class")
+            )
+            return True
+        except TimeoutException:
+            return False
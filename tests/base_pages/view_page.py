@@ -1,7 +1,9 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
+
+from tests.utilities.waits import wait_for_table_ready
 
 
 class ViewPage:
@@ -25,20 +27,8 @@ class ViewPage:
 
     def click_preview_button(self):
         # wait for the table body to have content (complaints loaded)
-        wait = WebDriverWait(self.driver, 20)
-        # wait for table body to not be empty and not show loading message
-        wait.until(
-            lambda driver: len(
-                driver.find_elements(By.CSS_SELECTOR, f"#{self.complaints_table_body_id} tr")
-            )
-            > 0
-        )
-        wait.until(
-            lambda driver: "Loading complaints"
-            not in driver.find_element(By.ID, self.complaints_table_body_id).text
-        )
-        # wait a bit more for JavaScript to attach event handlers
-        time.sleep(3)
+        # row buttons get their handlers while the row is rendered
+        wait_for_table_ready(self.driver)
         # find the first preview button
         preview_buttons = self.driver.find_elements(
             By.CSS_SELECTOR, self.preview_button_css
@@ -49,7 +39,6 @@ class ViewPage:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", preview_button
             )
-            time.sleep(1)
             # use JavaScript click for better reliability
             self.driver.execute_script("arguments[0].click();", preview_button)
         else:
@@ -58,10 +47,14 @@ class ViewPage:
     # 2: check if on complaint details page
 
     def is_on_complaint_details_page(self):
-        # wait a bit for navigation
-        time.sleep(2)
-        # check if current URL contains AdminComplaintDetails.html
-        return "AdminComplaintDetails.html" in self.driver.current_url
+        # wait for navigation to AdminComplaintDetails.html
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.url_contains("AdminComplaintDetails.html")
+            )
+            return True
+        except TimeoutException:
+            return False
 
     # 3: get complaint title
 
@@ -111,10 +104,12 @@ class ViewPage:
     # 7: check if returned to all complaints page
 
     def is_on_all_complaints_page(self):
-        # wait a bit for navigation
-        time.sleep(2)
-        # check if current URL contains AllComplaints.html
-        return "AllComplaints.html" in self.driver.current_url
+        # wait for navigation to AllComplaints.html
+        try:
+            WebDriverWait(self.driver, 10).until(EC.url_contains("AllComplaints.html"))
+            return True
+        except TimeoutException:
+            return False
 
     # 8: check if attachments exist
 
@@ -152,7 +147,11 @@ class ViewPage:
     # 10: check if attachment opened in new tab
 
     def is_attachment_opened_in_new_tab(self):
-        # wait a bit for new tab to open
-        time.sleep(2)
-        # check if there are multiple window handles
-        return len(self.driver.window_handles) > 1
+        # wait for a second window handle to appear
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: len(driver.window_handles) > 1
+            )
+            return True
+        except TimeoutException:
+            return False
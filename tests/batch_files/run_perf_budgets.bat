@@ -0,0 +1,33 @@
+@echo off
+REM ========================================
+REM Run PERFORMANCE BUDGET Check
+REM ========================================
+echo.
+echo ========================================
+echo Running PERFORMANCE BUDGET Check
+echo ========================================
+echo.
+
+REM Switch to project root regardless of where script is run
+cd /d "%~dp0"
+cd ../..
+
+REM Local pages and the 10k stub dataset, every test 5 times; medians are
+REM compared with tests/configurations/perf_budgets.ini
+pytest -c tests/pytest.ini tests/test_cases/test_search.py tests/test_cases/test_filter.py tests/test_cases/test_update_status.py tests/test_cases/test_analytics.py --browser=chrome --headless --base-url=local --backend=stub --seed-complaints=10k --perf-repeat=5 --perf-budgets --run-label=perf-budgets
+set RESULT=%ERRORLEVEL%
+
+REM Dashboard with the page load, web vitals and action tables
+python tests/utilities/generate_dashboard.py
+
+echo.
+echo ========================================
+if %RESULT% EQU 0 (
+    echo Performance Budgets Met!
+) else (
+    echo Performance Budgets EXCEEDED or Tests Failed - see the table above
+)
+echo ========================================
+echo.
+pause
+exit /b %RESULT%
@@ -0,0 +1,22 @@
+@echo off
+REM ========================================
+REM Benchmark the Driver Pool
+REM ========================================
+echo.
+echo ========================================
+echo Benchmarking the Driver Pool
+echo ========================================
+echo.
+
+REM Switch to project root regardless of where script is run
+cd /d "%~dp0"
+cd ../..
+
+REM tests/test_cases 3 times with a fresh browser per test (--max-driver-uses=1)
+REM and 3 times with the default pool; timings go to tests/reports/pool_benchmark.json
+python tests/utilities/pool_benchmark.py --rounds 3 --browser chrome
+set RESULT=%ERRORLEVEL%
+
+echo.
+pause
+exit /b %RESULT%
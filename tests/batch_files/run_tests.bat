@@ -14,17 +14,19 @@ echo 2. Run Tests by Feature
 echo 3. Run Tests by Priority
 echo 4. Run Smoke Tests
 echo 5. Run Regression Tests
-echo 6. View Allure Report
-echo 7. Exit
+echo 6. Run Performance Budget Check
+echo 7. View Allure Report
+echo 8. Exit
 echo.
-set /p choice="Enter your choice (1-7): "
+set /p choice="Enter your choice (1-8): "
 
 if "%choice%"=="1" call run_all_tests.bat
 if "%choice%"=="2" call run_tests_by_feature.bat
 if "%choice%"=="3" call run_tests_by_priority.bat
 if "%choice%"=="4" call run_smoke_tests.bat
 if "%choice%"=="5" call run_regression_tests.bat
-if "%choice%"=="6" call view_allure_report.bat
-if "%choice%"=="7" exit
+if "%choice%"=="6" call run_perf_budgets.bat
+if "%choice%"=="7" call view_allure_report.bat
+if "%choice%"=="8" exit
 
 goto menu
@@ -1,8 +1,38 @@
 import pytest
-import os
 from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
 from pytest_metadata.plugin import metadata_key
 
+from tests.base_pages.Login_Page import LoginPage
+from tests.utilities.artifacts import (
+    artifact_dir,
+    clean_worker_artifacts,
+    merge_worker_dirs,
+    merge_worker_logs,
+)
+from tests.utilities.browser_trace import start_trace, trace_options
+from tests.utilities.custom_logger import LogMaker
+from tests.utilities.excel_utils import discard_results, flush_results
+from tests.utilities.driver_pool import DriverPool
+from tests.utilities.network_idle import install_network_tracker
+from tests.utilities.page_metrics import install_page_metrics
+from tests.utilities.read_properties import ReadConfig
+from tests.utilities.session_state import SessionState
+from tests.utilities.throttling import apply_throttling
+from tests.utilities.webdriver_profiler import install_command_profiler
+
+# options and hooks of each optional feature
+pytest_plugins = [
+    "tests.utilities.backend_plugin",
+    "tests.utilities.scheduling_plugin",
+    "tests.utilities.step_timing_plugin",
+    "tests.utilities.webdriver_profiler_plugin",
+    "tests.utilities.page_metrics_plugin",
+    "tests.utilities.browser_trace_plugin",
+    "tests.utilities.throttling_plugin",
+    "tests.utilities.run_history_plugin",
+]
+
 
 # browser and headless mode options
 def pytest_addoption(parser):
@@ -18,6 +48,19 @@ def pytest_addoption(parser):
         default=False,
         help="Run tests in headless mode",
     )
+    parser.addoption(
+        "--max-driver-uses",
+        action="store",
+        type=int,
+        default=20,
+        help="Number of tests a pooled browser serves before it is replaced (1 = fresh browser per test)",
+    )
+    parser.addoption(
+        "--fresh-login",
+        action="store_true",
+        default=False,
+        help="Ignore the saved admin session and log in through the UI again",
+    )
 
 
 @pytest.fixture()
@@ -30,10 +73,8 @@ def headless(request):
     return request.config.getoption("--headless")
 
 
-@pytest.fixture()
-def setup(browser, headless):
-    global driver
-
+# launch a new configured browser
+def launch_driver(browser, headless, trace=False, net_profile=None, cpu_throttle=None):
     if browser == "chrome":
         from selenium.webdriver.chrome.options import Options
 
@@ -49,10 +90,8 @@ def setup(browser, headless):
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--force-device-scale-factor=1")
 
-        # download directory
-        download_dir = os.path.join(os.getcwd(), "tests", "downloads")
-        if not os.path.exists(download_dir):
-            os.makedirs(download_dir)
+        # download directory (one per xdist worker)
+        download_dir = artifact_dir("downloads")
 
         prefs = {
             "download.default_directory": download_dir,
@@ -62,8 +101,15 @@ def setup(browser, headless):
         }
         chrome_options.add_experimental_option("prefs", prefs)
 
+        # devtools timeline trace, read back per test or action
+        if trace:
+            trace_options(chrome_options)
+
         driver = webdriver.Chrome(options=chrome_options)
 
+        # slower network / cpu profile (--net-profile, --cpu-throttle)
+        apply_throttling(driver, net_profile, cpu_throttle)
+
     elif browser == "firefox":
         from selenium.webdriver.firefox.options import Options
 
@@ -74,6 +120,15 @@ def setup(browser, headless):
             firefox_options.add_argument("--width=1920")
             firefox_options.add_argument("--height=1080")
 
+        # bidi session so scripts can be preloaded into every page
+        firefox_options.enable_bidi = True
+
+        # download directory (one per xdist worker)
+        firefox_options.set_preference("browser.download.folderList", 2)
+        firefox_options.set_preference("browser.download.dir", artifact_dir("downloads"))
+        firefox_options.set_preference("browser.helperApps.neverAsk.saveToDisk", "application/pdf")
+        firefox_options.set_preference("pdfjs.disabled", True)
+
         driver = webdriver.Firefox(options=firefox_options)
 
     elif browser == "edge":
@@ -85,6 +140,15 @@ def setup(browser, headless):
             edge_options.add_argument("--headless=new")
             edge_options.add_argument("--window-size=1920,1080")
 
+        # download directory (one per xdist worker)
+        edge_options.add_experimental_option(
+            "prefs",
+            {
+                "download.default_directory": artifact_dir("downloads"),
+                "download.prompt_for_download": False,
+            },
+        )
+
         driver = webdriver.Edge(options=edge_options)
     else:
         raise ValueError("Unsupported browser")
@@ -97,17 +161,129 @@ def setup(browser, headless):
 
     driver.implicitly_wait(10)
 
+    # count in-flight fetch/XHR requests from the start of every page
+    install_network_tracker(driver)
+
+    return driver
+
+
+# one browser pool per worker (session scope is per process under xdist)
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    browser = request.config.getoption("--browser")
+    headless = request.config.getoption("--headless")
+    max_uses = request.config.getoption("--max-driver-uses")
+    trace = request.config.getoption("--trace-browser") is not None
+    net_profile = request.config.getoption("--net-profile")
+    cpu_throttle = request.config.getoption("--cpu-throttle")
+
+    def factory():
+        driver = launch_driver(browser, headless, trace, net_profile, cpu_throttle)
+        if request.config.getoption("--profile-webdriver"):
+            install_command_profiler(driver)
+        if request.config.getoption("--page-metrics"):
+            install_page_metrics(driver)
+        return driver
+
+    pool = DriverPool(factory, max_uses=max_uses)
+    yield pool
+    pool.close()
+
+
+# clean browser for each test, taken from the worker's pool
+@pytest.fixture()
+def setup(request, driver_pool):
+    driver = driver_pool.acquire()
+    if request.config.getoption("--trace-browser") == "test":
+        start_trace(driver)
     yield driver
-    driver.quit()
+    driver_pool.release(driver)
+
+
+# empty download folder for this test only
+@pytest.fixture()
+def download_dir(request, setup):
+    path = artifact_dir("downloads", request.node.nodeid)
+    try:
+        # chrome and edge can switch folders on a running browser
+        setup.execute_cdp_cmd(
+            "Browser.setDownloadBehavior", {"behavior": "allow", "downloadPath": path}
+        )
+    except Exception:
+        # firefox keeps the worker folder it was started with
+        path = artifact_dir("downloads")
+    return path
+
+
+# admin session: logged in through the UI once, then reused from disk
+@pytest.fixture(scope="session")
+def admin_session(request, driver_pool):
+    state = SessionState(ReadConfig.get_email())
+
+    # stub tokens only work against the stub, so they are never saved
+    use_saved = request.config.getoption("--backend") == "supabase"
+
+    storage = None
+    if use_saved and not request.config.getoption("--fresh-login"):
+        storage = state.load()
+
+    if storage is None:
+        driver = driver_pool.acquire()
+        try:
+            driver.get(ReadConfig.get_login_page_url())
+            login = LoginPage(driver)
+            login.enter_email(ReadConfig.get_email())
+            login.enter_password(ReadConfig.get_password())
+            login.click_login()
+
+            # wait for supabase to store the session
+            storage = WebDriverWait(driver, 20).until(SessionState.capture)
+            if use_saved:
+                state.save(storage)
+        finally:
+            driver_pool.release(driver)
+
+    return storage
+
+
+# clean browser that is already logged in as the admin
+@pytest.fixture()
+def admin_setup(setup, admin_session):
+    driver = setup
+    # sessionStorage is per origin, so open an app page before injecting
+    driver.get(ReadConfig.get_login_page_url())
+    SessionState.inject(driver, admin_session)
+    return driver
+
+
+# folders that get one subfolder per xdist worker
+ARTIFACT_KINDS = ["downloads", "screenshots", "traces"]
 
 
 # report metadata
 def pytest_configure(config):
+    # the controller (or a plain run) clears what an earlier parallel run left
+    if not hasattr(config, "workerinput"):
+        clean_worker_artifacts(ARTIFACT_KINDS)
+        discard_results()
     config.stash[metadata_key]["Project Name"] = "ComplaNet"
     config.stash[metadata_key]["Test Module Name"] = "Automated Tests"
     config.stash[metadata_key]["Tester"] = "Admin"
 
 
+# collect the worker folders and logs once every worker has finished
+def pytest_sessionfinish(session):
+    # drain the log queue so the worker files are complete before the merge
+    LogMaker.stop()
+    if hasattr(session.config, "workerinput"):
+        return
+    for kind in ARTIFACT_KINDS:
+        merge_worker_dirs(kind)
+    merge_worker_logs()
+    # every Excel result of the run in one save per workbook
+    flush_results()
+
+
 # cleanup hooks
 @pytest.mark.optionalhook
 def pytest_metadata(metadata):
@@ -0,0 +1,39 @@
+import pytest
+
+from tests.base_pages.complaints_table import ComplaintsTable
+from tests.utilities.custom_logger import LogMaker
+from tests.utilities.dataset_generator import TIERS
+from tests.utilities.read_properties import ReadConfig
+from tests.utilities.waits import wait_for_table_ready
+
+
+class TestComplaintsScale:
+
+    logger = LogMaker.log_gen()
+    all_complaints_page_url = ReadConfig.get_all_complaints_page_url()
+
+    # the stub backend reseeded with the 100k tier for one test, then put
+    # back to the --seed-complaints size the rest of the run uses
+    @pytest.fixture
+    def stub_100k(self, request, supabase_stub):
+        supabase_stub.seed(complaints=TIERS["100k"])
+        yield supabase_stub
+        size = request.config.getoption("--seed-complaints")
+        supabase_stub.seed(complaints=TIERS[size] if size in TIERS else int(size))
+
+    # the page looks every complainant up in one users?id=in.(...) request,
+    # ~390 KB of url at this size
+    def test_complainant_names_resolve(self, stub_100k, admin_setup):
+        self.logger.info("********** Complainant Names at 100k Started **********")
+        driver = admin_setup
+        driver.get(self.all_complaints_page_url)
+        wait_for_table_ready(driver, timeout=60)
+
+        users = {user["id"]: f"{user['first_name']} {user['last_name']}" for user in stub_100k.tables["users"]}
+        complainants = {row["complaintid"]: row["complainantid"] for row in stub_100k.tables["complaint"]}
+
+        rows = ComplaintsTable(driver).snapshot()
+        assert rows, "no complaints shown"
+        for row in rows:
+            assert row.lodged_by == users[complainants[row.id]], f"complaint {row.id} shows '{row.lodged_by}'"
+        self.logger.info(f"********** {len(rows)} Complainant Names Resolved **********")
@@ -2,11 +2,13 @@ import pytest
 import time
 from selenium import webdriver
 from selenium.webdriver.common.alert import Alert
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 
-from tests.base_pages.login_page import LoginPage
 from tests.base_pages.delete_page import DeletePage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestDelete:
@@ -20,33 +22,17 @@ class TestDelete:
     delete_complaint_keyword = ReadConfig.get_delete_complaint_keyword()
 
     # verify title of the all complaints page
-    def test_all_complaints_page_title_verification(self, setup):
+    def test_all_complaints_page_title_verification(self, admin_setup):
         self.logger.info("********** Test 06 Delete Complaint Started **********")
         self.logger.info(
             "********** All Complaints Page Title Verification Test Started **********"
         )
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(2)
-
         # fetch the title
         actual_complaints_title = driver.title
         expected_complaints_title = "All Complaints — ComplaNet Admin"
@@ -57,20 +43,17 @@ class TestDelete:
         if actual_complaints_title == expected_complaints_title:
             self.logger.info("********** All Complaints Page Title Matched  **********")
             assert True
-            # close the browser
-            driver.close()
 
         # however, if the title does not match, the test fails
         else:
             # capture the screenshot
             # store the screenshot in the screenshots folder
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_all_complaints_page_title_verification_delete.png"
+                screenshot_path("test_all_complaints_page_title_verification_delete.png")
             )
             self.logger.info(
                 "********** All Complaints Page Title Not Matched **********"
             )
-            driver.close()
             assert False
 
     # delete complaint with required fields
@@ -159,7 +142,7 @@ class TestDelete:
     #             # capture the screenshot
     #             # save the screenshot in the screenshots folder
     #             driver.save_screenshot(
-    #                 ".\\tests\\screenshots\\test_delete_complaint_with_required_fields.png"
+    #                 screenshot_path("test_delete_complaint_with_required_fields.png")
     #             )
     #             # close the browser
     #             driver.close()
@@ -170,47 +153,28 @@ class TestDelete:
     #         )
     #         # capture the screenshot
     #         driver.save_screenshot(
-    #             ".\\tests\\screenshots\\test_delete_complaint_with_required_fields.png"
+    #             screenshot_path("test_delete_complaint_with_required_fields.png")
     #         )
     #         # close the browser
     #         driver.close()
     #         assert False
 
     # cancel button functionality
-    def test_cancel_button_functionality(self, setup):
+    def test_cancel_button_functionality(self, admin_setup):
         self.logger.info(
             "********** Cancel Button Functionality Test Started **********"
         )
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(3)
-
         # object for DeletePage class
         self.delete_page = DeletePage(driver)
         # click the delete button
         self.delete_page.click_delete_button()
 
-        # wait for the modal to appear
-        time.sleep(2)
-
         # verify that the modal is displayed
         modal_displayed = self.delete_page.is_modal_displayed()
 
@@ -222,9 +186,6 @@ class TestDelete:
             # click the cancel button
             self.delete_page.click_cancel_button()
 
-            # wait for the modal to close
-            time.sleep(2)
-
             # verify that the modal is closed
             modal_closed = self.delete_page.is_modal_closed()
 
@@ -236,8 +197,6 @@ class TestDelete:
                     "********** Delete Complaint Modal Closed Successfully **********"
                 )
                 assert True
-                # close the browser
-                driver.close()
 
             # however, if modal is still displayed, the test fails
             else:
@@ -247,10 +206,8 @@ class TestDelete:
                 # capture the screenshot
                 # save the screenshot in the screenshots folder
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_cancel_button_functionality_delete.png"
+                    screenshot_path("test_cancel_button_functionality_delete.png")
                 )
-                # close the browser
-                driver.close()
                 assert False
         else:
             self.logger.info(
@@ -258,45 +215,24 @@ class TestDelete:
             )
             # capture the screenshot
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_cancel_button_functionality_delete.png"
+                screenshot_path("test_cancel_button_functionality_delete.png")
             )
-            # close the browser
-            driver.close()
             assert False
 
     # empty field handling
-    def test_empty_field_handling(self, setup):
+    def test_empty_field_handling(self, admin_setup):
         self.logger.info("********** Empty Field Handling Test Started **********")
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(3)
-
         # object for DeletePage class
         self.delete_page = DeletePage(driver)
         # click the delete button
         self.delete_page.click_delete_button()
 
-        # wait for the modal to appear
-        time.sleep(2)
-
         # verify that the modal is displayed
         modal_displayed = self.delete_page.is_modal_displayed()
 
@@ -307,7 +243,7 @@ class TestDelete:
             self.delete_page.click_confirm_delete()
 
             # wait for the alert to appear
-            time.sleep(3)
+            WebDriverWait(driver, 10).until(EC.alert_is_present())
 
             # switch to alert
             alert = Alert(driver)
@@ -326,8 +262,6 @@ class TestDelete:
                 assert True
                 # accept the alert
                 alert.accept()
-                # close the browser
-                driver.close()
 
             # however, if the message does not match, the test fails
             else:
@@ -339,10 +273,8 @@ class TestDelete:
                 # capture the screenshot
                 # save the screenshot in the screenshots folder
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_empty_field_handling_delete.png"
+                    screenshot_path("test_empty_field_handling_delete.png")
                 )
-                # close the browser
-                driver.close()
                 assert False
         else:
             self.logger.info(
@@ -350,8 +282,6 @@ class TestDelete:
             )
             # capture the screenshot
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_empty_field_handling_delete.png"
+                screenshot_path("test_empty_field_handling_delete.png")
             )
-            # close the browser
-            driver.close()
             assert False
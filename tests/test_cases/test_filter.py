@@ -1,36 +1,23 @@
 import pytest
-import time
-from tests.base_pages.login_page import LoginPage
 from tests.base_pages.filter_page import FilterPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestFilter:
 
     logger = LogMaker.log_gen()
-    login_page_url = ReadConfig.get_login_page_url()
     all_complaints_page_url = ReadConfig.get_all_complaints_page_url()
-    email = ReadConfig.get_email()
-    password = ReadConfig.get_password()
     filter_status = ReadConfig.get_filter_status()
     filter_date_from = ReadConfig.get_filter_date_from()
     filter_date_to = ReadConfig.get_filter_date_to()
 
-    # Fixture for login and navigation
+    # Fixture for navigation (admin session is reused)
     @pytest.fixture
-    def setup_filter(self, setup):
-        driver = setup
-        driver.get(self.login_page_url)
-
-        login = LoginPage(driver)
-        login.enter_email(self.email)
-        login.enter_password(self.password)
-        login.click_login()
-
-        time.sleep(3)
+    def setup_filter(self, admin_setup):
+        driver = admin_setup
         driver.get(self.all_complaints_page_url)
-        time.sleep(2)
 
         return driver
 
@@ -43,7 +30,7 @@ class TestFilter:
             assert True
         else:
             self.logger.info("********** Title Not Matched **********")
-            driver.save_screenshot(".\\tests\\screenshots\\test_filter_title.png")
+            driver.save_screenshot(screenshot_path("test_filter_title.png"))
             assert False
 
     def test_filter_dropdown_clickable(self, setup_filter):
@@ -57,7 +44,7 @@ class TestFilter:
         else:
             self.logger.info("********** Filter Not Clickable **********")
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_filter_not_clickable.png"
+                screenshot_path("test_filter_not_clickable.png")
             )
             assert False
 
@@ -85,7 +72,6 @@ class TestFilter:
         filter_page = FilterPage(driver)
 
         filter_page.select_status_filter(self.filter_status)
-        time.sleep(3)
 
         count = filter_page.get_results_count()
         self.logger.info(f"********** Results found: {count} **********")
@@ -98,9 +84,7 @@ class TestFilter:
 
         filter_page.set_date_from(self.filter_date_from)
         filter_page.set_date_to(self.filter_date_to)
-        time.sleep(2)
         filter_page.select_status_filter(self.filter_status)
-        time.sleep(3)
 
         count = filter_page.get_results_count()
         self.logger.info(f"********** Results found: {count} **********")
@@ -113,11 +97,9 @@ class TestFilter:
 
         filter_page.set_date_from(self.filter_date_from)
         filter_page.set_date_to(self.filter_date_to)
-        time.sleep(2)
 
         filter_page.clear_date_from()
         filter_page.clear_date_to()
-        time.sleep(3)
 
         assert True
 
@@ -129,11 +111,9 @@ class TestFilter:
         # First filter
         filter_page.set_date_from(self.filter_date_from)
         filter_page.set_date_to(self.filter_date_to)
-        time.sleep(2)
 
         # Change filter
         filter_page.set_date_from("2025-11-01")
         filter_page.set_date_to("2025-11-30")
-        time.sleep(2)
 
         assert True
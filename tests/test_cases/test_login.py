@@ -5,6 +5,7 @@ from selenium.webdriver.common.by import By
 from tests.base_pages.login_page import LoginPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestLogin:
@@ -29,7 +30,7 @@ class TestLogin:
             self.logger.info(
                 f"********** Title Not Matched. Got: {driver.title} **********"
             )
-            driver.save_screenshot(".\\tests\\screenshots\\test_title_verification.png")
+            driver.save_screenshot(screenshot_path("test_title_verification.png"))
             assert False
 
     def test_valid_login(self, setup):
@@ -48,7 +49,7 @@ class TestLogin:
             assert True
         else:
             self.logger.info("********** Valid Login Failed **********")
-            driver.save_screenshot(".\\tests\\screenshots\\test_valid_login.png")
+            driver.save_screenshot(screenshot_path("test_valid_login.png"))
             assert False
 
     @pytest.mark.parametrize(
@@ -100,7 +101,7 @@ class TestLogin:
                 f"********** {scenario} Failed - No Alert Found **********"
             )
             driver.save_screenshot(
-                f".\\tests\\screenshots\\test_{scenario.replace(' ','_')}_no_alert.png"
+                screenshot_path(f"test_{scenario.replace(' ','_')}_no_alert.png")
             )
             assert False
 
@@ -148,6 +149,6 @@ class TestLogin:
             )
             # Note: Screenshots of validation messages are tricky as they are native browser UI
             driver.save_screenshot(
-                f".\\tests\\screenshots\\test_{scenario.replace(' ','_')}_validation.png"
+                screenshot_path(f"test_{scenario.replace(' ','_')}_validation.png")
             )
             assert False
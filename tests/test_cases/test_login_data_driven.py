@@ -1,11 +1,11 @@
+import os
+
 import pytest
-import time
-from selenium import webdriver
-from selenium.webdriver.common.alert import Alert
 
 from tests.base_pages.login_page import LoginPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 from tests.utilities import excel_utils
 
 
@@ -14,99 +14,50 @@ class TestLoginDataDriven:
     login_page_url = ReadConfig.get_login_page_url()
     logger = LogMaker.log_gen()
 
-    import os
-
     # Get absolute path dynamically
     # assumes file is in tests/test_cases/test_login_data_driven.py
     # we want tests/test_data/admin_login_data.xlsx
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     path = os.path.join(base_dir, "test_data", "admin_login_data.xlsx")
-
-    # valid admin login
-    # def test_valid_login_data_driven(self, setup):
-    #     self.logger.info("********** Valid Data Driven Login Test Started **********")
-    #     # launch the chrome browser
-    #     driver = setup
-    #     driver.implicitly_wait(10)
-    #     # open the login page
-    #     # object for LoginPage class
-    #     self.login_page = LoginPage(driver)
-
-    #     self.rows = excel_utils.get_row_count(self.path, "Sheet1")
-
-    #     status_list = []
-
-    #     # fetch the data using iteration and store it in a variable
-    #     for row_index in range(2, self.rows + 1):
-    #         driver.get(self.login_page_url)
-    #         time.sleep(3)
-    #         self.login_page = LoginPage(driver)
-    #         time.sleep(2)
-            
-    #         self.email = excel_utils.read_data(self.path, "Sheet1", row_index, 1)
-    #         self.password = excel_utils.read_data(self.path, "Sheet1", row_index, 2)
-    #         self.expected_login = excel_utils.read_data(self.path, "Sheet1", row_index, 3)
-
-    #         # pass the email
-    #         self.login_page.enter_email(self.email)
-    #         time.sleep(1)
-    #         # pass the password
-    #         self.login_page.enter_password(self.password)
-    #         # perform click action
-    #         self.login_page.click_login()
-
-    #         # wait for the admin dashboard page to load
-    #         time.sleep(5)
-
-    #         try:
-    #             # Switch to alert
-    #             alert = Alert(driver)
-    #             # fetch the alert message
-    #             actual_alert_message = alert.text
-    #             expected_alert_message = "Login failed: Invalid login credentials"
-
-    #             # check whether actual and expected message matches
-    #             # check whether login was expected
-    #             if actual_alert_message == expected_alert_message:
-    #                 self.logger.info("********** Error Message Matched **********")
-    #                 # accept the alert
-    #                 alert.accept()
-    #                 if self.expected_login == "No":
-    #                     self.logger.info("********** Test Data Passed **********")
-    #                     status_list.append("Pass")
-    #                 else:
-    #                     self.logger.info("********** Test Data Failed **********")
-    #                     status_list.append("Fail")
-    #                 continue
-
-    #         except:
-    #             pass
-
-    #         # fetch the title
-    #         actual_dashboard_title = driver.title
-    #         expected_dashboard_title = "ComplaNet — Admin Dashboard"
-
-    #         # check whether actual and expected title matches
-    #         # check whether login was expected
-    #         if actual_dashboard_title == expected_dashboard_title:
-    #             if self.expected_login == "Yes":
-    #                 self.logger.info("********** Test Data Passed **********")
-    #                 status_list.append("Pass")
-    #             elif self.expected_login == "No":
-    #                 self.logger.info("********** Test Data Failed **********")
-    #                 status_list.append("Fail")
-    #         elif actual_dashboard_title != expected_dashboard_title:
-    #             if self.expected_login == "Yes":
-    #                 self.logger.info("********** Test Data Failed **********")
-    #                 status_list.append("Fail")
-    #             elif self.expected_login == "No":
-    #                 self.logger.info("********** Test Data Passed **********")
-    #                 status_list.append("Pass")
-
-    #     if "Fail" in status_list:
-    #         self.logger.info("********** Data Driven Login Test Failed **********")
-    #         assert False
-    #     else:
-    #         self.logger.info("********** Data Driven Login Test Passed **********")
-    #         assert True
-    pass
+    # copy of the sheet with a "result" column, written at session end
+    results_path = os.path.join(base_dir, "reports", "admin_login_data_results.xlsx")
+
+    # one test case per sheet row (columns: email, password, expected_login)
+    @pytest.mark.parametrize(
+        *excel_utils.parametrize_args(path, "Sheet1", id_column="email", row_arg="row_num")
+    )
+    def test_login_data_driven(self, setup, email, password, expected_login, row_num):
+        self.logger.info(f"********** Data Driven Login Test Started: {email} **********")
+        driver = setup
+
+        # open the login page
+        driver.get(self.login_page_url)
+
+        # object for LoginPage class
+        login_page = LoginPage(driver)
+
+        # pass the email and password
+        login_page.enter_email(email)
+        login_page.enter_password(password)
+        # perform click action
+        login_page.click_login()
+
+        # wait until the login either opens a dashboard or shows an error
+        logged_in = login_page.wait_for_login_result()
+
+        # check whether login was expected
+        passed = logged_in == (expected_login == "Yes")
+        excel_utils.record_result(
+            self.path, "Sheet1", row_num, "result", "Pass" if passed else "Fail",
+            output_file=self.results_path,
+        )
+        if passed:
+            self.logger.info("********** Test Data Passed **********")
+            assert True
+        else:
+            self.logger.info(
+                f"********** Test Data Failed. Expected login: {expected_login}, "
+                f"Logged in: {logged_in} **********"
+            )
+            driver.save_screenshot(screenshot_path("test_login_data_driven.png"))
+            assert False
@@ -6,6 +6,7 @@ from tests.base_pages.login_page import LoginPage
 from tests.base_pages.logout_page import LogoutPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestLogout:
@@ -87,34 +88,29 @@ class TestLogout:
                             "********** Successfully Logged Out and Redirected to Login Page **********"
                         )
                         assert True
-                        driver.close()
                     else:
                         self.logger.info(
                             f"********** Not Redirected to Login Page. Current URL: {driver.current_url} **********"
                         )
                         driver.save_screenshot(
-                            ".\\tests\\screenshots\\test_successful_logout.png"
+                            screenshot_path("test_successful_logout.png")
                         )
-                        driver.close()
                         assert False
                 else:
                     self.logger.info("********** Logout Modal Not Displayed **********")
                     driver.save_screenshot(
-                        ".\\tests\\screenshots\\test_successful_logout.png"
+                        screenshot_path("test_successful_logout.png")
                     )
-                    driver.close()
                     assert False
             else:
                 self.logger.info("********** Profile Dropdown Not Displayed **********")
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_successful_logout.png"
+                    screenshot_path("test_successful_logout.png")
                 )
-                driver.close()
                 assert False
         else:
             self.logger.info("********** Admin Dashboard Not Displayed **********")
-            driver.save_screenshot(".\\tests\\screenshots\\test_successful_logout.png")
-            driver.close()
+            driver.save_screenshot(screenshot_path("test_successful_logout.png"))
             assert False
 
     # back button after logout test
@@ -188,7 +184,7 @@ class TestLogout:
                         f"********** SECURITY FLAW DETECTED: Admin can access dashboard via back button. Current URL: {driver.current_url} **********"
                     )
                     driver.save_screenshot(
-                        ".\\tests\\screenshots\\test_back_button_after_logout_SECURITY_ISSUE.png"
+                        screenshot_path("test_back_button_after_logout_SECURITY_ISSUE.png")
                     )
                     # assert False
             else:
@@ -196,12 +192,12 @@ class TestLogout:
                     f"********** Not Redirected to Login Page. Current URL: {driver.current_url} **********"
                 )
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_back_button_after_logout.png"
+                    screenshot_path("test_back_button_after_logout.png")
                 )
                 assert False
         else:
             self.logger.info("********** Admin Dashboard Not Displayed **********")
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_back_button_after_logout.png"
+                screenshot_path("test_back_button_after_logout.png")
             )
             assert False
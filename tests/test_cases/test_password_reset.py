@@ -8,6 +8,7 @@ from tests.base_pages.login_page import LoginPage
 from tests.base_pages.password_reset_page import PasswordResetPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestPasswordReset:
@@ -49,20 +50,17 @@ class TestPasswordReset:
         if actual_reset_title == expected_reset_title:
             self.logger.info("********** Reset Password Page Title Matched  **********")
             assert True
-            # close the browser
-            driver.close()
 
         # however, if the title does not match, the test fails
         else:
             # capture the screenshot
             # store the screenshot in the screenshots folder
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_reset_password_page_title_verification.png"
+                screenshot_path("test_reset_password_page_title_verification.png")
             )
             self.logger.info(
                 "********** Reset Password Page Title Not Matched **********"
             )
-            driver.close()
             assert False
 
     # valid email password reset
@@ -119,8 +117,6 @@ class TestPasswordReset:
             assert True
             # accept the alert
             alert.accept()
-            # close the browser
-            driver.close()
 
         # however, if the message does not match, the test fails
         else:
@@ -130,10 +126,8 @@ class TestPasswordReset:
             # capture the screenshot
             # save the screenshot in the screenshots folder
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_valid_email_password_reset.png"
+                screenshot_path("test_valid_email_password_reset.png")
             )
-            # close the browser
-            driver.close()
             assert False
 
     # invalid email password reset
@@ -182,8 +176,6 @@ class TestPasswordReset:
             assert True
             # accept the alert
             alert.accept()
-            # close the browser
-            driver.close()
 
         # however, if the message does not match, the test fails
         else:
@@ -193,10 +185,8 @@ class TestPasswordReset:
             # capture the screenshot
             # save the screenshot in the screenshots folder
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_invalid_email_password_reset.png"
+                screenshot_path("test_invalid_email_password_reset.png")
             )
-            # close the browser
-            driver.close()
             assert False
 
 
@@ -1,34 +1,20 @@
 import pytest
-import time
 from tests.base_pages.search_page import SearchPage
-from tests.base_pages.login_page import LoginPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestSearch:
 
     logger = LogMaker.log_gen()
-    login_page_url = ReadConfig.get_login_page_url()
     search_page_url = ReadConfig.get_search_page_url()
-    email = ReadConfig.get_email()
-    password = ReadConfig.get_password()
 
-    # Fixture to handle login and navigation for each test
+    # Fixture to handle navigation for each test (admin session is reused)
     @pytest.fixture
-    def setup_search(self, setup):
-        # launch browser
-        driver = setup
-        driver.get(self.login_page_url)
-
-        # login
-        login = LoginPage(driver)
-        login.enter_email(self.email)
-        login.enter_password(self.password)
-        login.click_login()
-
-        # wait for login to complete
-        time.sleep(3)
+    def setup_search(self, admin_setup):
+        # launch browser already logged in as admin
+        driver = admin_setup
 
         # navigate to search page
         driver.get(self.search_page_url)
@@ -48,7 +34,7 @@ class TestSearch:
         else:
             self.logger.info("********** Title Not Matched **********")
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_search_page_title_parametrized.png"
+                screenshot_path("test_search_page_title_parametrized.png")
             )
             assert False
 
@@ -104,8 +90,9 @@ class TestSearch:
                     else:
                         search_term = word
                 elif test_case_name == "Description":
-                    # Description: full description
-                    search_term = complaint_data["description"]
+                    # Description: full description (the table does not show it,
+                    # so the config value is kept)
+                    search_term = complaint_data["description"] or search_term
                 elif test_case_name == "Title":
                      search_term = complaint_data["title"]
                 elif test_case_name == "Complainant Name":
@@ -116,7 +103,6 @@ class TestSearch:
 
         self.logger.info(f"Using search term: {search_term}")
         search.enter_search_term(search_term)
-        time.sleep(3)  # Wait for search/filtering
 
         # Verification
         results_count = search.get_results_count()
@@ -133,7 +119,7 @@ class TestSearch:
                     f"********** {test_case_name} Search Failed - No Results **********"
                 )
                 driver.save_screenshot(
-                    f".\\tests\\screenshots\\test_search_{test_case_name.replace(' ', '_')}.png"
+                    screenshot_path(f"test_search_{test_case_name.replace(' ', '_')}.png")
                 )
                 assert False
         elif expectation == "empty":
@@ -147,6 +133,6 @@ class TestSearch:
                     f"********** {test_case_name} Search Failed - Unexpected Results **********"
                 )
                 driver.save_screenshot(
-                    f".\\tests\\screenshots\\test_search_{test_case_name.replace(' ', '_')}.png"
+                    screenshot_path(f"test_search_{test_case_name.replace(' ', '_')}.png")
                 )
                 assert False
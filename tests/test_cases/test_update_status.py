@@ -1,51 +1,33 @@
 import pytest
-import time
 from selenium import webdriver
 from selenium.webdriver.common.alert import Alert
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 
-from tests.base_pages.login_page import LoginPage
 from tests.base_pages.update_status_page import UpdateStatusPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestUpdateStatus:
 
     logger = LogMaker.log_gen()
-    login_page_url = ReadConfig.get_login_page_url()
     all_complaints_page_url = ReadConfig.get_all_complaints_page_url()
-    email = ReadConfig.get_email()
-    password = ReadConfig.get_password()
     status_update_reason = ReadConfig.get_status_update_reason()
 
     # verify title of the all complaints page
-    def test_all_complaints_page_title_verification(self, setup):
+    def test_all_complaints_page_title_verification(self, admin_setup):
         self.logger.info("********** Test 04 Update Status Started **********")
         self.logger.info(
             "********** All Complaints Page Title Verification Test Started **********"
         )
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(2)
-
         # fetch the title
         actual_complaints_title = driver.title
         expected_complaints_title = "All Complaints — ComplaNet Admin"
@@ -56,57 +38,35 @@ class TestUpdateStatus:
         if actual_complaints_title == expected_complaints_title:
             self.logger.info("********** All Complaints Page Title Matched  **********")
             assert True
-            # close the browser
-            driver.close()
 
         # however, if the title does not match, the test fails
         else:
             # capture the screenshot
             # store the screenshot in the screenshots folder
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_all_complaints_page_title_verification.png"
+                screenshot_path("test_all_complaints_page_title_verification.png")
             )
             self.logger.info(
                 "********** All Complaints Page Title Not Matched **********"
             )
-            driver.close()
             assert False
 
     # update status with required fields
-    def test_update_status_with_required_fields(self, setup):
+    def test_update_status_with_required_fields(self, admin_setup):
         self.logger.info(
             "********** Update Status With Required Fields Test Started **********"
         )
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(3)
-
         # object for UpdateStatusPage class
         self.update_status_page = UpdateStatusPage(driver)
         # click the edit button
         self.update_status_page.click_edit_button()
 
-        # wait for the modal to appear
-        time.sleep(2)
-
         # verify that the modal is displayed
         modal_displayed = self.update_status_page.is_modal_displayed()
 
@@ -121,7 +81,7 @@ class TestUpdateStatus:
             self.update_status_page.click_update_button()
 
             # wait for the alert to appear
-            time.sleep(3)
+            WebDriverWait(driver, 10).until(EC.alert_is_present())
 
             # switch to alert
             alert = Alert(driver)
@@ -138,8 +98,6 @@ class TestUpdateStatus:
                 assert True
                 # accept the alert
                 alert.accept()
-                # close the browser
-                driver.close()
 
             # however, if the message does not match, the test fails
             else:
@@ -149,56 +107,33 @@ class TestUpdateStatus:
                 # capture the screenshot
                 # save the screenshot in the screenshots folder
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_update_status_with_required_fields.png"
+                    screenshot_path("test_update_status_with_required_fields.png")
                 )
-                # close the browser
-                driver.close()
                 assert False
         else:
             self.logger.info("********** Update Status Modal Not Displayed **********")
             # capture the screenshot
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_update_status_with_required_fields.png"
+                screenshot_path("test_update_status_with_required_fields.png")
             )
-            # close the browser
-            driver.close()
             assert False
 
     # cancel button functionality
-    def test_cancel_button_functionality(self, setup):
+    def test_cancel_button_functionality(self, admin_setup):
         self.logger.info(
             "********** Cancel Button Functionality Test Started **********"
         )
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(3)
-
         # object for UpdateStatusPage class
         self.update_status_page = UpdateStatusPage(driver)
         # click the edit button
         self.update_status_page.click_edit_button()
 
-        # wait for the modal to appear
-        time.sleep(2)
-
         # verify that the modal is displayed
         modal_displayed = self.update_status_page.is_modal_displayed()
 
@@ -212,9 +147,6 @@ class TestUpdateStatus:
             # click the cancel button
             self.update_status_page.click_cancel_button()
 
-            # wait for the modal to close
-            time.sleep(2)
-
             # verify that the modal is closed
             modal_closed = self.update_status_page.is_modal_closed()
 
@@ -226,8 +158,6 @@ class TestUpdateStatus:
                     "********** Update Status Modal Closed Successfully **********"
                 )
                 assert True
-                # close the browser
-                driver.close()
 
             # however, if modal is still displayed, the test fails
             else:
@@ -235,54 +165,31 @@ class TestUpdateStatus:
                 # capture the screenshot
                 # save the screenshot in the screenshots folder
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_cancel_button_functionality.png"
+                    screenshot_path("test_cancel_button_functionality.png")
                 )
-                # close the browser
-                driver.close()
                 assert False
         else:
             self.logger.info("********** Update Status Modal Not Displayed **********")
             # capture the screenshot
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_cancel_button_functionality.png"
+                screenshot_path("test_cancel_button_functionality.png")
             )
-            # close the browser
-            driver.close()
             assert False
 
     # empty field handling
-    def test_empty_field_handling(self, setup):
+    def test_empty_field_handling(self, admin_setup):
         self.logger.info("********** Empty Field Handling Test Started **********")
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-        # object for LoginPage class
-        self.login_page = LoginPage(driver)
-        # pass the email
-        self.login_page.enter_email(self.email)
-        # pass the password
-        self.login_page.enter_password(self.password)
-        # perform click action
-        self.login_page.click_login()
-
-        # wait for the admin dashboard page to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # open the all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for the page to load
-        time.sleep(3)
-
         # object for UpdateStatusPage class
         self.update_status_page = UpdateStatusPage(driver)
         # click the edit button
         self.update_status_page.click_edit_button()
 
-        # wait for the modal to appear
-        time.sleep(2)
-
         # verify that the modal is displayed
         modal_displayed = self.update_status_page.is_modal_displayed()
 
@@ -293,7 +200,7 @@ class TestUpdateStatus:
             self.update_status_page.click_update_button()
 
             # wait for the alert to appear
-            time.sleep(3)
+            WebDriverWait(driver, 10).until(EC.alert_is_present())
 
             # switch to alert
             alert = Alert(driver)
@@ -312,8 +219,6 @@ class TestUpdateStatus:
                 assert True
                 # accept the alert
                 alert.accept()
-                # close the browser
-                driver.close()
 
             # however, if the message does not match, the test fails
             else:
@@ -325,17 +230,13 @@ class TestUpdateStatus:
                 # capture the screenshot
                 # save the screenshot in the screenshots folder
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_empty_field_handling.png"
+                    screenshot_path("test_empty_field_handling.png")
                 )
-                # close the browser
-                driver.close()
                 assert False
         else:
             self.logger.info("********** Update Status Modal Not Displayed **********")
             # capture the screenshot
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_empty_field_handling.png"
+                screenshot_path("test_empty_field_handling.png")
             )
-            # close the browser
-            driver.close()
             assert False
@@ -1,54 +1,33 @@
 import pytest
-import time
 from selenium import webdriver
 
-from tests.base_pages.login_page import LoginPage
 from tests.base_pages.view_page import ViewPage
 from tests.utilities.read_properties import ReadConfig
 from tests.utilities.custom_logger import LogMaker
+from tests.utilities.artifacts import screenshot_path
 
 
 class TestView:
 
     logger = LogMaker.log_gen()
-    login_page_url = ReadConfig.get_login_page_url()
     all_complaints_page_url = ReadConfig.get_all_complaints_page_url()
-    email = ReadConfig.get_email()
-    password = ReadConfig.get_password()
 
     # view complaint details test
-    def test_view_complaint_details(self, setup):
+    def test_view_complaint_details(self, admin_setup):
         self.logger.info("********** Test 09 View Complaint Started **********")
         self.logger.info("********** View Complaint Details Test Started **********")
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-
-        # login first
-        self.login_page = LoginPage(driver)
-        self.login_page.enter_email(self.email)
-        self.login_page.enter_password(self.password)
-        self.login_page.click_login()
-
-        # wait for dashboard to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # navigate to all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for page to load
-        time.sleep(3)
-
         # object for ViewPage class
         self.view_page = ViewPage(driver)
 
         # click preview button
         self.view_page.click_preview_button()
 
-        # wait for navigation
-        time.sleep(3)
-
         # verify navigated to complaint details page
         on_details_page = self.view_page.is_on_complaint_details_page()
 
@@ -66,58 +45,38 @@ class TestView:
                     f"********** Complaint Details Displayed: {complaint_title} **********"
                 )
                 assert True
-                driver.close()
             else:
                 self.logger.info(
                     "********** Complaint Details Not Displayed Properly **********"
                 )
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_view_complaint_details.png"
+                    screenshot_path("test_view_complaint_details.png")
                 )
-                driver.close()
                 assert False
         else:
             self.logger.info(
                 f"********** Not Navigated to Details Page. Current URL: {driver.current_url} **********"
             )
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_view_complaint_details.png"
+                screenshot_path("test_view_complaint_details.png")
             )
-            driver.close()
             assert False
 
     # back arrow navigation test
-    def test_back_arrow_navigation(self, setup):
+    def test_back_arrow_navigation(self, admin_setup):
         self.logger.info("********** Back Arrow Navigation Test Started **********")
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-
-        # login first
-        self.login_page = LoginPage(driver)
-        self.login_page.enter_email(self.email)
-        self.login_page.enter_password(self.password)
-        self.login_page.click_login()
-
-        # wait for dashboard to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # navigate to all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for page to load
-        time.sleep(3)
-
         # object for ViewPage class
         self.view_page = ViewPage(driver)
 
         # click preview button
         self.view_page.click_preview_button()
 
-        # wait for navigation
-        time.sleep(3)
-
         # verify on complaint details page
         on_details_page = self.view_page.is_on_complaint_details_page()
 
@@ -127,9 +86,6 @@ class TestView:
             # click back arrow
             self.view_page.click_back_arrow()
 
-            # wait for navigation
-            time.sleep(3)
-
             # verify returned to all complaints page
             back_to_complaints = self.view_page.is_on_all_complaints_page()
 
@@ -138,56 +94,36 @@ class TestView:
                     "********** Successfully Returned to All Complaints Page **********"
                 )
                 assert True
-                driver.close()
             else:
                 self.logger.info(
                     f"********** Not Returned to All Complaints Page. Current URL: {driver.current_url} **********"
                 )
                 driver.save_screenshot(
-                    ".\\tests\\screenshots\\test_back_arrow_navigation.png"
+                    screenshot_path("test_back_arrow_navigation.png")
                 )
-                driver.close()
                 assert False
         else:
             self.logger.info("********** Failed to Navigate to Details Page **********")
             driver.save_screenshot(
-                ".\\tests\\screenshots\\test_back_arrow_navigation.png"
+                screenshot_path("test_back_arrow_navigation.png")
             )
-            driver.close()
             assert False
 
     # attachment view test
-    def test_attachment_view(self, setup):
+    def test_attachment_view(self, admin_setup):
         self.logger.info("********** Attachment View Test Started **********")
-        # launch the chrome browser
-        driver = setup
-        # open the login page
-        driver.get(self.login_page_url)
-
-        # login first
-        self.login_page = LoginPage(driver)
-        self.login_page.enter_email(self.email)
-        self.login_page.enter_password(self.password)
-        self.login_page.click_login()
-
-        # wait for dashboard to load
-        time.sleep(3)
+        # launch the browser already logged in as admin
+        driver = admin_setup
 
         # navigate to all complaints page
         driver.get(self.all_complaints_page_url)
 
-        # wait for page to load
-        time.sleep(3)
-
         # object for ViewPage class
         self.view_page = ViewPage(driver)
 
         # click preview button
         self.view_page.click_preview_button()
 
-        # wait for navigation
-        time.sleep(3)
-
         # verify on complaint details page
         on_details_page = self.view_page.is_on_complaint_details_page()
 
@@ -206,9 +142,6 @@ class TestView:
                 # click first attachment
                 attachment_url = self.view_page.click_first_attachment()
 
-                # wait for new tab to open
-                time.sleep(3)
-
                 # check if attachment opened in new tab
                 opened_in_new_tab = self.view_page.is_attachment_opened_in_new_tab()
 
@@ -226,15 +159,13 @@ class TestView:
                     # switch back to original window
                     driver.switch_to.window(original_window)
                     assert True
-                    driver.close()
                 else:
                     self.logger.info(
                         "********** Attachment Did Not Open in New Tab **********"
                     )
                     driver.save_screenshot(
-                        ".\\tests\\screenshots\\test_attachment_view.png"
+                        screenshot_path("test_attachment_view.png")
                     )
-                    driver.close()
                     assert False
             else:
                 self.logger.info(
@@ -242,9 +173,7 @@ class TestView:
                 )
                 # Test passes because no attachments is a valid state
                 assert True
-                driver.close()
         else:
             self.logger.info("********** Failed to Navigate to Details Page **********")
-            driver.save_screenshot(".\\tests\\screenshots\\test_attachment_view.png")
-            driver.close()
+            driver.save_screenshot(screenshot_path("test_attachment_view.png"))
             assert False
@@ -0,0 +1,134 @@
+import pytest
+
+from tests.utilities.perf_budgets import base_nodeid, check_budgets, load_budgets
+
+BUDGETS_INI = """
+[page AllComplaints.html]
+lcp = 2500
+cls = 0.1
+
+[page AllComplaints.html 10k]
+lcp = 1500
+
+[page AllComplaints.html 100k]
+lcp = 4000
+
+[action ComplaintsTable.search]
+elapsed = 300
+"""
+
+
+def budget(kind, name, metric, value):
+    return {"kind": kind, "name": name, "tier": None, "metric": metric, "budget": value}
+
+
+def summary(pages=(), actions=()):
+    return {"pages": list(pages), "actions": list(actions)}
+
+
+class TestPerfBudgets:
+
+    # --perf-repeat ids are stripped so the K samples of a test stay together
+    @pytest.mark.parametrize(
+        "nodeid, expected",
+        [
+            # a test without parameters gets the repeat id alone
+            ("test_search.py::TestSearch::test_a[perf2]", "test_search.py::TestSearch::test_a"),
+            # pytest puts the repeat id first in a parametrized test's id
+            ("test_login_data_driven.py::test_b[perf1-1]", "test_login_data_driven.py::test_b[1]"),
+            ("test_login_data_driven.py::test_b[perf12-row-3]", "test_login_data_driven.py::test_b[row-3]"),
+            ("test_search.py::test_c[perfect-match]", "test_search.py::test_c[perfect-match]"),
+        ],
+    )
+    def test_base_nodeid(self, nodeid, expected):
+        assert base_nodeid(nodeid) == expected
+
+
+class TestLoadBudgets:
+
+    @pytest.fixture
+    def budgets_file(self, tmp_path):
+        path = tmp_path / "perf_budgets.ini"
+        path.write_text(BUDGETS_INI, encoding="utf-8")
+        return str(path)
+
+    # sections with a tier only apply to runs seeded with that tier
+    @pytest.mark.parametrize(
+        "seed, expected",
+        [
+            (None, {(None, "lcp"), (None, "cls")}),
+            ("10k", {(None, "lcp"), (None, "cls"), ("10k", "lcp")}),
+            # the size and the tier name are the same dataset
+            ("10000", {(None, "lcp"), (None, "cls"), ("10k", "lcp")}),
+            ("100k", {(None, "lcp"), (None, "cls"), ("100k", "lcp")}),
+            ("1k", {(None, "lcp"), (None, "cls")}),
+        ],
+    )
+    def test_tier_sections(self, budgets_file, seed, expected):
+        budgets = load_budgets(budgets_file, seed)
+        pages = {(row["tier"], row["metric"]) for row in budgets if row["kind"] == "page"}
+        assert pages == expected
+        assert [row["name"] for row in budgets if row["kind"] == "action"] == ["ComplaintsTable.search"]
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[pages Login.html]\nlcp = 1\n",
+            "[page Login.html 10k extra]\nlcp = 1\n",
+            "[page Login.html]\nLCP = 1\n",
+            "[action ComplaintsTable.search]\nlcp = 1\n",
+        ],
+    )
+    def test_invalid_sections(self, tmp_path, content):
+        path = tmp_path / "perf_budgets.ini"
+        path.write_text(content, encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_budgets(str(path))
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_budgets(str(tmp_path / "missing.ini"))
+
+
+class TestCheckBudgets:
+
+    @pytest.mark.parametrize(
+        "stats, status",
+        [
+            ({"p50": 2400}, "ok"),
+            # at the budget is still within it
+            ({"p50": 2500}, "ok"),
+            ({"p50": 2501}, "over"),
+            # the page was loaded but the metric never reported
+            ({"p50": None}, "missing"),
+            (None, "missing"),
+        ],
+    )
+    def test_page_status(self, stats, status):
+        row = {"page": "AllComplaints.html", "count": 5}
+        if stats is not None:
+            row["lcp"] = stats
+        checks = check_budgets(summary(pages=[row]), [budget("page", "AllComplaints.html", "lcp", 2500)])
+        assert [check["status"] for check in checks] == [status]
+        assert checks[0]["samples"] == 5
+
+    def test_not_measured(self):
+        checks = check_budgets(
+            summary(pages=[{"page": "Login.html", "count": 3, "lcp": {"p50": 900}}]),
+            [budget("page", "AllComplaints.html", "lcp", 2500), budget("action", "ComplaintsTable.search", "elapsed", 300)],
+        )
+        assert [(check["status"], check["median"], check["samples"]) for check in checks] == [
+            ("missing", None, 0),
+            ("missing", None, 0),
+        ]
+
+    # pages and actions with the same name are kept apart
+    def test_action_status(self):
+        checks = check_budgets(
+            summary(
+                pages=[{"page": "ComplaintsTable.search", "count": 1, "elapsed": {"p50": 10}}],
+                actions=[{"action": "ComplaintsTable.search", "count": 4, "elapsed": {"p50": 450}}],
+            ),
+            [budget("action", "ComplaintsTable.search", "elapsed", 300)],
+        )
+        assert [(check["status"], check["median"], check["samples"]) for check in checks] == [("over", 450, 4)]
@@ -0,0 +1,111 @@
+import itertools
+
+import pytest
+
+from tests.utilities.run_history import REGRESSION_WINDOW, RunHistory, mann_whitney_greater, u_distribution
+
+TEST_A = "test_search.py::TestSearch::test_a"
+TEST_B = "test_filter.py::TestFilter::test_b"
+
+
+class TestMannWhitney:
+
+    # exact p-values: the share of the C(n1+n2, n1) orderings with U at least as large
+    @pytest.mark.parametrize(
+        "x, y, p_value",
+        [
+            ([4, 5, 6], [1, 2, 3], 1 / 20),
+            ([1, 2, 3], [4, 5, 6], 1.0),
+            ([5, 6, 7, 8], [1, 2, 3, 4], 1 / 70),
+            ([2, 4, 6], [1, 3, 5], 7 / 20),
+        ],
+    )
+    def test_exact(self, x, y, p_value):
+        assert mann_whitney_greater(x, y) == pytest.approx(p_value)
+
+    # u_distribution against every split of n1 + n2 distinct values
+    @pytest.mark.parametrize("n1, n2", [(1, 1), (2, 3), (3, 2), (4, 4), (5, 3)])
+    def test_u_distribution(self, n1, n2):
+        counts = [0] * (n1 * n2 + 1)
+        for chosen in itertools.combinations(range(n1 + n2), n1):
+            others = [value for value in range(n1 + n2) if value not in chosen]
+            counts[sum(x > y for x in chosen for y in others)] += 1
+        assert u_distribution(n1, n2) == counts
+
+    # ties use the normal approximation: U = 17.5, z = 4.5 / 4.6248
+    def test_ties(self):
+        assert mann_whitney_greater([2, 2, 3, 5, 6], [1, 2, 2, 3, 4]) == pytest.approx(0.1653, abs=1e-4)
+
+    @pytest.mark.parametrize(
+        "x, y",
+        [
+            ([1.0] * 5, [1.0] * 5),
+            ([1, 2, 3, 4], [1, 2, 3, 4]),
+        ],
+    )
+    def test_same_samples(self, x, y):
+        assert mann_whitney_greater(x, y) >= 0.5
+
+    # over 30 values, also without ties
+    def test_large_samples(self):
+        assert mann_whitney_greater(list(range(20, 40)), list(range(20))) < 1e-6
+        assert mann_whitney_greater(list(range(20)), list(range(20, 40))) > 0.99
+
+
+class TestRegressions:
+
+    @pytest.fixture
+    def history(self, tmp_path):
+        return RunHistory(str(tmp_path / "run_history.db"))
+
+    def record(self, history, durations, status="passed"):
+        results = [(nodeid, status, seconds) for nodeid, samples in durations.items() for seconds in samples]
+        return history.record_run(results, {"browser": "chrome"}, started=0.0, finished=1.0)
+
+    def test_slower_test_is_found(self, history):
+        base = self.record(history, {TEST_A: [1.0, 1.1, 0.9], TEST_B: [2.0, 2.1, 1.9]})
+        head = self.record(history, {TEST_A: [2.0, 2.2, 1.8], TEST_B: [2.0, 2.1, 1.9]})
+        found = history.regressions([base], [head])
+        assert [row["nodeid"] for row in found] == [TEST_A]
+        assert found[0]["change"] == 100.0
+        assert found[0]["p_value"] == 0.05
+        assert found[0]["samples"] == [3, 3]
+
+    @pytest.mark.parametrize(
+        "base, head",
+        [
+            # significant, but under REGRESSION_MIN_RATIO
+            ([1.00, 1.01, 1.02], [1.05, 1.06, 1.07]),
+            # slower median, but not significant
+            ([1.0, 1.5, 2.0], [0.9, 1.8, 2.1]),
+            # fewer than MIN_SAMPLES
+            ([1.0, 1.1], [3.0, 3.1]),
+            # faster
+            ([2.0, 2.1, 2.2], [1.0, 1.1, 1.2]),
+        ],
+    )
+    def test_not_a_regression(self, history, base, head):
+        base_id = self.record(history, {TEST_A: base})
+        head_id = self.record(history, {TEST_A: head})
+        assert history.regressions([base_id], [head_id]) == []
+
+    # failed runs of a test say nothing about its duration
+    def test_failed_results_ignored(self, history):
+        base = self.record(history, {TEST_A: [1.0, 1.1, 0.9]})
+        head = self.record(history, {TEST_A: [5.0, 5.1, 4.9]}, status="failed")
+        assert history.regressions([base], [head]) == []
+
+    @pytest.mark.parametrize(
+        "runs, windows",
+        [
+            (2, ([1], [2])),
+            (
+                2 * REGRESSION_WINDOW + 1,
+                (list(range(2, REGRESSION_WINDOW + 2)), list(range(REGRESSION_WINDOW + 2, 2 * REGRESSION_WINDOW + 2))),
+            ),
+        ],
+    )
+    def test_default_windows(self, history, runs, windows):
+        for _ in range(runs):
+            self.record(history, {TEST_A: [1.0]})
+        assert history.default_windows() == windows
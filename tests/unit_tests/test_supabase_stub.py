@@ -0,0 +1,101 @@
+import http.client
+import json
+import socket
+import urllib.parse
+
+import pytest
+
+from tests.utilities.dataset_generator import TIERS
+from tests.utilities.static_server import MAX_REQUEST_LINE, StaticServer
+from tests.utilities.supabase_stub import StubError, SupabaseStub
+
+
+def stub_get(stub, table, **params):
+    status, body, _ = stub.handle_rest("GET", table, urllib.parse.urlencode(params), {}, b"")
+    return status, body
+
+
+@pytest.fixture(scope="module")
+def stub():
+    stub = SupabaseStub("admin@example.edu", "secret")
+    stub.tables["users"] = [
+        {"id": "u1", "first_name": "Ada", "last_name": "Reed", "age": 30, "active": True},
+        {"id": "u2", "first_name": "Ben", "last_name": "O'Neil, Jr", "age": 25, "active": False},
+        {"id": "u3", "first_name": "Cy", "last_name": None, "age": 41, "active": True},
+    ]
+    return stub
+
+
+# the local server in front of the 100k tier
+@pytest.fixture(scope="module")
+def server_100k():
+    stub = SupabaseStub("admin@example.edu", "secret")
+    stub.seed(complaints=TIERS["100k"])
+    server = StaticServer(backend=stub)
+    server.start()
+    yield server, stub
+    server.stop()
+
+
+class TestSupabaseStubFilters:
+
+    @pytest.mark.parametrize(
+        "column, expression, expected",
+        [
+            ("id", "eq.u2", ["u2"]),
+            ("id", "neq.u2", ["u1", "u3"]),
+            ("id", "in.(u1,u3)", ["u1", "u3"]),
+            ("id", "not.in.(u1,u3)", ["u2"]),
+            # quoted values may hold commas
+            ("last_name", 'in.("O\'Neil, Jr",Reed)', ["u1", "u2"]),
+            ("last_name", "is.null", ["u3"]),
+            ("last_name", "not.is.null", ["u1", "u2"]),
+            ("first_name", "ilike.*a*", ["u1"]),
+            ("age", "gte.30", ["u1", "u3"]),
+            ("age", "lt.30", ["u2"]),
+            ("active", "eq.true", ["u1", "u3"]),
+        ],
+    )
+    def test_filter(self, stub, column, expression, expected):
+        status, rows = stub_get(stub, "users", select="id", **{column: expression})
+        assert status == 200
+        assert sorted(row["id"] for row in rows) == expected
+
+    def test_in_list_is_parsed_once(self):
+        column, negate, operator, value = SupabaseStub.parse_filter("id", "not.in.(a, b,c)")
+        assert (column, negate, operator) == ("id", True, "in")
+        assert value == frozenset({"a", "b", "c"})
+
+    def test_unknown_operator(self, stub):
+        with pytest.raises(StubError):
+            stub_get(stub, "users", id="near.u1")
+
+
+class TestSupabaseStubServer:
+
+    # all-complaints.js looks every complainant up in one request
+    def test_user_lookup_at_100k(self, server_100k):
+        server, stub = server_100k
+        user_ids = sorted({row["complainantid"] for row in stub.tables["complaint"]})
+        query = urllib.parse.urlencode(
+            {"select": "id,first_name,last_name,email", "id": f"in.({','.join(user_ids)})"}
+        )
+        assert len(query) > 65536
+
+        host, port = server.httpd.server_address[:2]
+        connection = http.client.HTTPConnection(host, port, timeout=60)
+        try:
+            connection.request("GET", f"/rest/v1/users?{query}")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert sorted(user["id"] for user in json.loads(response.read())) == user_ids
+        finally:
+            connection.close()
+
+    # answered with a status, not a dropped connection; exactly one byte over
+    # the limit, so the server has read everything that was sent
+    def test_request_line_over_the_limit(self, server_100k):
+        server, _ = server_100k
+        with socket.create_connection(server.httpd.server_address[:2], timeout=60) as connection:
+            connection.sendall(b"G" * (MAX_REQUEST_LINE + 1))
+            assert connection.makefile("rb").readline().split()[1] == b"414"
@@ -0,0 +1,157 @@
+import glob
+import gzip
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TESTS_DIR = os.path.join(base_dir, "tests")
+
+
+# 1: xdist worker name ("gw0", "gw1", ...) or None outside xdist
+
+def worker_id():
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+# 2: nodeid of the running test, e.g. test_cases/test_search.py::TestSearch::test_x[a]
+
+def current_nodeid():
+    current = os.environ.get("PYTEST_CURRENT_TEST", "")
+    return current.rsplit(" (", 1)[0]
+
+
+# 3: nodeid turned into a folder name
+
+def safe_name(nodeid):
+    name = nodeid.split("/")[-1].replace("::", "__")
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_.")
+    return name[:150] or "session"
+
+
+# 4: folder for one kind of artifact (downloads, screenshots, ...), private to
+#    this worker and, when a nodeid is given, to one test
+
+def artifact_dir(kind, nodeid=None):
+    parts = [TESTS_DIR, kind]
+    if worker_id():
+        parts.append(worker_id())
+    if nodeid:
+        parts.append(safe_name(nodeid))
+    path = os.path.join(*parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+# 5: where the running test saves a screenshot
+
+def screenshot_path(filename):
+    return os.path.join(artifact_dir("screenshots", current_nodeid()), filename)
+
+
+# 6: log file of this process
+
+def log_path():
+    logs_dir = os.path.join(TESTS_DIR, "logs")
+    os.makedirs(logs_dir, exist_ok=True)
+    if worker_id():
+        return os.path.join(logs_dir, f"complanet-{worker_id()}.log")
+    return os.path.join(logs_dir, "complanet.log")
+
+
+# 7: move a log written before the json lines format out of the way, so
+#    the two formats never share a file
+
+def retire_plain_log(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            first_line = file.readline()
+    except OSError:
+        return None
+    if not first_line.strip():
+        return None
+    try:
+        json.loads(first_line)
+        return None
+    except ValueError:
+        pass
+    # own folder, so the worker log globs never pick it up
+    stamp = datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y%m%d-%H%M%S")
+    name, extension = os.path.splitext(os.path.basename(path))
+    legacy_dir = os.path.join(os.path.dirname(path), "legacy")
+    os.makedirs(legacy_dir, exist_ok=True)
+    legacy_path = os.path.join(legacy_dir, f"{name}-{stamp}{extension}")
+    os.replace(path, legacy_path)
+    return legacy_path
+
+
+# ------------------------
+#  SESSION START / END (controller only)
+# ------------------------
+
+def worker_dirs(kind):
+    return sorted(glob.glob(os.path.join(TESTS_DIR, kind, "gw*")))
+
+
+# worker log files, rotated .gz parts included
+def worker_logs():
+    return sorted(glob.glob(os.path.join(TESTS_DIR, "logs", "complanet-gw*.log*")))
+
+
+# 1: drop what workers of an earlier run left behind
+
+def clean_worker_artifacts(kinds):
+    for kind in kinds:
+        for path in worker_dirs(kind):
+            shutil.rmtree(path, ignore_errors=True)
+    for path in worker_logs():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# 2: move every worker's files up into the shared folder (the per-test
+#    subfolders keep the names unique)
+
+def merge_worker_dirs(kind):
+    target_root = os.path.join(TESTS_DIR, kind)
+    moved = 0
+    for worker_root in worker_dirs(kind):
+        for folder, _, files in os.walk(worker_root):
+            relative = os.path.relpath(folder, worker_root)
+            target = os.path.normpath(os.path.join(target_root, relative))
+            os.makedirs(target, exist_ok=True)
+            for name in files:
+                os.replace(os.path.join(folder, name), os.path.join(target, name))
+                moved += 1
+        shutil.rmtree(worker_root, ignore_errors=True)
+    return moved
+
+
+# 3: append the worker logs (json lines) to complanet.log in time order
+
+def merge_worker_logs():
+    entries = []
+    for path in worker_logs():
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8", errors="replace") as file:
+            for line in file:
+                try:
+                    created = json.loads(line)["created"]
+                except (ValueError, KeyError, TypeError):
+                    # a line cut off by a killed worker
+                    continue
+                entries.append((created, line if line.endswith("\n") else f"{line}\n"))
+        os.remove(path)
+
+    if not entries:
+        return 0
+
+    entries.sort(key=lambda entry: entry[0])
+    retire_plain_log(log_path())
+    with open(log_path(), "a", encoding="utf-8") as file:
+        file.writelines(line for _, line in entries)
+    return len(entries)
@@ -0,0 +1,86 @@
+import pytest
+from pytest_metadata.plugin import metadata_key
+
+from tests.utilities.dataset_generator import TIERS
+from tests.utilities.read_properties import ReadConfig
+from tests.utilities.static_server import StaticServer
+from tests.utilities.supabase_stub import SupabaseStub
+
+
+# where pages and data come from: --base-url, --backend, --seed-complaints
+def pytest_addoption(parser):
+    parser.addoption(
+        "--base-url",
+        action="store",
+        default=None,
+        help="Load pages from this url instead of the deployed site ('local' = serve this checkout)",
+    )
+    parser.addoption(
+        "--backend",
+        action="store",
+        default="supabase",
+        choices=["supabase", "stub"],
+        help="Data backend: the hosted supabase project or the local in-memory stub",
+    )
+    parser.addoption(
+        "--seed-complaints",
+        action="store",
+        default="100",
+        help="Number of generated complaints the stub backend starts with (a number or a tier: 1k, 10k, 100k)",
+    )
+
+
+# rebase page urls before collection (test classes read them at import)
+def pytest_configure(config):
+    base_url = config.getoption("--base-url")
+    backend = None
+    if config.getoption("--backend") == "stub":
+        # the stub is reached through the local server, so pages must come from it
+        if base_url not in (None, "local"):
+            raise pytest.UsageError("--backend stub needs the pages served locally (--base-url local)")
+        size = config.getoption("--seed-complaints")
+        complaints = TIERS[size] if size in TIERS else int(size)
+        base_url = "local"
+
+    # the xdist controller runs no tests: every worker seeds and serves its own
+    if base_url == "local" and xdist_controller(config):
+        ReadConfig.set_base_url(base_url)
+        config.stash[metadata_key]["Base URL"] = base_url
+        return
+
+    if config.getoption("--backend") == "stub":
+        backend = SupabaseStub(ReadConfig.get_email(), ReadConfig.get_password())
+        backend.seed(complaints=complaints)
+        config._supabase_stub = backend
+
+    if base_url == "local":
+        config._static_server = StaticServer(backend=backend)
+        base_url = config._static_server.start()
+    if base_url:
+        ReadConfig.set_base_url(base_url)
+        config.stash[metadata_key]["Base URL"] = base_url
+
+
+def xdist_controller(config):
+    return not hasattr(config, "workerinput") and bool(getattr(config.option, "numprocesses", None))
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_static_server", None)
+    if server is not None:
+        server.stop()
+
+
+# local copy of the site, available to tests that need the server itself
+@pytest.fixture(scope="session")
+def static_server(request):
+    return getattr(request.config, "_static_server", None)
+
+
+# local data backend, e.g. supabase_stub.seed(complaints=10000)
+@pytest.fixture(scope="session")
+def supabase_stub(request):
+    stub = getattr(request.config, "_supabase_stub", None)
+    if stub is None:
+        pytest.skip("needs --backend stub")
+    return stub
@@ -0,0 +1,23 @@
+from selenium.common.exceptions import WebDriverException
+
+
+# 1: run a script in every new document before the page's own scripts
+
+def add_init_script(driver, source):
+    # chrome and edge: devtools protocol
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+            )
+            return True
+        except WebDriverException:
+            return False
+
+    # firefox: webdriver bidi preload script (needs the session started with
+    # enable_bidi, older selenium versions do not have it at all)
+    try:
+        driver.script.add_preload_script(f"() => {{ {source} }}")
+        return True
+    except Exception:
+        return False
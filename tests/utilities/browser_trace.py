@@ -0,0 +1,97 @@
+import functools
+import gzip
+import json
+import os
+
+import allure
+
+from tests.utilities.artifacts import artifact_dir, current_nodeid
+
+# timeline categories the chrome performance panel reads: tasks, scripting,
+# style/layout/paint, frames, user timing and the js sampling profile
+TRACE_CATEGORIES = ",".join([
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "disabled-by-default-devtools.timeline.stack",
+    "disabled-by-default-v8.cpu_profiler",
+    "blink.user_timing",
+    "loading",
+    "v8.execute",
+])
+
+# allure attachment names start with this; the dashboard links them
+TRACE_ATTACHMENT = "browser trace"
+
+
+# 1: chromedriver records the trace and hands it out through the
+#    performance log (the driver cannot receive Tracing.dataCollected itself)
+
+def trace_options(options):
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option(
+        "perfLoggingPrefs",
+        {"enableNetwork": False, "enablePage": False, "traceCategories": TRACE_CATEGORIES},
+    )
+    return options
+
+
+# 2: trace events since the last call; reading the log ends chromedriver's
+#    trace and starts the next one
+
+def collect_trace_events(driver):
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+    events = []
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        if message.get("method") != "Tracing.dataCollected":
+            continue
+        params = message.get("params") or {}
+        # one event per entry, or a batch under "value"
+        if isinstance(params.get("value"), list):
+            events.extend(params["value"])
+        else:
+            events.append(params)
+    return events
+
+
+# 3: drop what earlier tests of this pooled browser left in the buffer
+
+def start_trace(driver):
+    collect_trace_events(driver)
+
+
+# 4: gzipped trace file (loads in the performance panel), attached to the
+#    allure result of the running test
+
+def save_trace(driver, nodeid, label="test"):
+    events = collect_trace_events(driver)
+    if not events:
+        return None
+    folder = artifact_dir("traces", nodeid)
+    path = os.path.join(folder, f"{label}-{len(os.listdir(folder)) + 1}.json.gz")
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        json.dump({"traceEvents": events, "metadata": {"test": nodeid, "label": label}}, file)
+    allure.attach.file(path, name=f"{TRACE_ATTACHMENT}: {label}", extension="json.gz")
+    return path
+
+
+# 5: one trace per page-object action (page_metrics.ACTIONS) instead of
+#    per test
+
+def traced_action(name, function):
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        start_trace(self.driver)
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            save_trace(self.driver, current_nodeid(), name)
+
+    return wrapper
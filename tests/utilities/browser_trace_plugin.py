@@ -0,0 +1,39 @@
+import pytest
+
+from tests.utilities.browser_trace import save_trace, traced_action
+from tests.utilities.page_metrics import instrument_actions
+
+
+# chromedriver records the trace (conftest's launch_driver), the setup
+# fixture starts it per test
+def pytest_addoption(parser):
+    parser.addoption(
+        "--trace-browser",
+        action="store",
+        nargs="?",
+        const="test",
+        default=None,
+        choices=["test", "actions"],
+        help="Save a chrome performance trace per test, or per search/filter/status/analytics action ('actions')",
+    )
+
+
+# after the page metrics wrap the actions, so a trace covers their measuring too
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if not config.getoption("--trace-browser"):
+        return
+    if config.getoption("--browser") != "chrome":
+        raise pytest.UsageError("--trace-browser needs --browser chrome")
+    if config.getoption("--trace-browser") == "actions":
+        instrument_actions(traced_action)
+
+
+# trace of the test (setup included) as an allure attachment, taken after
+# the page metrics read the final page
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_call(item):
+    yield
+    driver = item.funcargs.get("setup")
+    if item.config.getoption("--trace-browser") == "test" and driver is not None:
+        save_trace(driver, item.nodeid)
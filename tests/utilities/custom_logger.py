@@ -1,17 +1,138 @@
+import atexit
+import copy
+import gzip
+import json
 import logging
+import os
+import queue
+import shutil
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from tests.utilities.artifacts import current_nodeid, log_path, retire_plain_log, worker_id
+
+# a log file is rotated at this size and kept gzipped as .1.gz ... .5.gz
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
 
 
 class LogMaker:
+    # one queue per process: tests only enqueue records, a background thread
+    # formats them and writes the file
+    listener = None
+    file_handler = None
+    queue_handler = None
+
     @staticmethod
     def log_gen():
-        # date format
-        # timestamp
-        logging.basicConfig(
-            filename=".\\tests\\logs\\complanet.log",
-            format="%(asctime)s: %(levelname)s: %(message)s",
-            datefmt="%d/%m/%Y %H:%M:%S",
-            force=True,
-        )
+        if LogMaker.listener is None and LogMaker.file_handler is None:
+            LogMaker.configure()
         logger = logging.getLogger()
         logger.setLevel(logging.INFO)
         return logger
+
+    @staticmethod
+    def configure():
+        # one file per xdist worker, merged into complanet.log at the end; a
+        # plain-text log from before the json format is moved aside first
+        retire_plain_log(log_path())
+        file_handler = RotatingFileHandler(
+            log_path(), maxBytes=MAX_LOG_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True
+        )
+        file_handler.namer = lambda name: f"{name}.gz"
+        file_handler.rotator = compress_log
+        file_handler.setFormatter(JsonFormatter())
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = JsonQueueHandler(log_queue)
+        # nodeid and timing are only known in the test's own thread
+        queue_handler.addFilter(ContextFilter())
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+
+        LogMaker.file_handler = file_handler
+        LogMaker.queue_handler = queue_handler
+        LogMaker.listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        LogMaker.listener.start()
+        atexit.register(LogMaker.stop)
+
+    # write out everything queued; later records go straight to the file
+    @staticmethod
+    def stop():
+        if LogMaker.listener is None:
+            return
+        LogMaker.listener.stop()
+        LogMaker.listener = None
+        root = logging.getLogger()
+        root.removeHandler(LogMaker.queue_handler)
+        LogMaker.file_handler.addFilter(ContextFilter())
+        root.addHandler(LogMaker.file_handler)
+
+
+class JsonQueueHandler(QueueHandler):
+    # QueueHandler.prepare() glues the traceback onto the message and drops
+    # exc_info; keep the message plain and the traceback in exc_text, so
+    # JsonFormatter can write it as its own field
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class ContextFilter(logging.Filter):
+    # adds worker, nodeid and seconds since that test logged its first line
+
+    def __init__(self):
+        super().__init__()
+        self.nodeid = None
+        self.started = time.monotonic()
+
+    def filter(self, record):
+        nodeid = current_nodeid()
+        if nodeid != self.nodeid:
+            self.nodeid = nodeid
+            self.started = time.monotonic()
+        record.nodeid = nodeid or None
+        record.worker = worker_id() or "main"
+        record.elapsed = round(time.monotonic() - self.started, 3)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    # one json object per line
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "created": record.created,
+            "level": record.levelname,
+            "worker": getattr(record, "worker", worker_id() or "main"),
+            "nodeid": getattr(record, "nodeid", None),
+            "elapsed": getattr(record, "elapsed", None),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # formatted by JsonQueueHandler before the record was queued
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def compress_log(source, dest):
+    with open(source, "rb") as file, gzip.open(dest, "wb") as archive:
+        shutil.copyfileobj(file, archive)
+    os.remove(source)
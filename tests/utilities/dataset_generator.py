@@ -0,0 +1,272 @@
+import gzip
+import json
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, time, timedelta, timezone
+
+from tests.utilities.read_properties import ReadConfig
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATASET_DIR = os.path.join(base_dir, "tests", "test_data", "datasets")
+
+# dataset sizes used by the scaling benchmarks
+TIERS = {"1k": 1000, "10k": 10000, "100k": 100000}
+
+# role -> category, as in trend-alerts-api.js
+ADMIN_ROLES = {
+    "Facility Admin": "Facility",
+    "Academic Admin": "Academic",
+    "Technical Admin": "Technical",
+    "Student Disciplinary Admin": "Student Disciplinary",
+    "Administrative Admin": "Administrative",
+    "General Admin": "Other",
+}
+CATEGORIES = list(ADMIN_ROLES.values())
+STATUSES = ["Pending", "In-Progress", "Resolved", "Deleted"]
+STATUS_WEIGHTS = [45, 25, 25, 5]
+PRIORITIES = ["High", "Medium", "Low", None]
+
+# sub table holding the category specific fields of a complaint
+DETAIL_TABLES = {
+    "Technical": "technicalcomplaint",
+    "Student Disciplinary": "studentbehaviorcomplaint",
+    "Facility": "facilitycomplaint",
+    "Administrative": "administrativecomplaint",
+    "Academic": "academiccomplaint",
+    "Other": "othercomplaint",
+}
+
+FIRST_NAMES = ["Amal", "Ben", "Chloe", "Dinuka", "Emma", "Farah", "George", "Hana", "Ishan", "Julia",
+               "Kasun", "Lina", "Malik", "Nadia", "Omar", "Priya", "Ravi", "Sara", "Tom", "Yasmin"]
+LAST_NAMES = ["Perera", "Smith", "Silva", "Khan", "Brown", "Fernando", "Lee", "Jones", "Wong", "Reed",
+              "Patel", "Garcia", "Dias", "Martin", "Nguyen", "Ali", "Cooper", "Ward", "Hughes", "Bandara"]
+
+# title parts per category (never contain the special characters search case)
+ISSUES = {
+    "Technical": ["Wi-Fi outage", "Projector fault", "Login portal error", "Printer jam", "Lab PC crash"],
+    "Academic": ["Late results", "Missing lecture notes", "Timetable clash", "Unfair grading", "Module registration issue"],
+    "Facility": ["Broken taps", "Leaking roof", "Faulty lights", "Blocked drain", "Broken chairs"],
+    "Administrative": ["Fee query", "ID card delay", "Transcript request", "Hostel allocation", "Refund pending"],
+    "Student Disciplinary": ["Noisy classroom", "Harassment report", "Cheating suspicion", "Vandalism", "Bullying report"],
+    "Other": ["Parking problem", "Canteen hygiene", "Lost property", "Event noise", "Shuttle delay"],
+}
+PLACES = ["level 1 lab", "level 2 lab", "level 3 corridor", "level 5 bathroom", "library",
+          "main hall", "canteen", "lecture room 5", "sports complex", "car park"]
+DETAILS = ["since last week", "for two days", "every morning", "after the storm",
+           "during lectures", "since the semester began"]
+
+# share of complaints submitted inside the filter date range of config.ini
+IN_RANGE_SHARE = 0.85
+
+# one user lodges this many complaints on average
+COMPLAINTS_PER_USER = 10
+
+# one complaint in this many has an attachment
+ATTACHMENT_EVERY = 5
+
+
+class DatasetGenerator:
+    # reproducible complaint datasets; every table is produced as a stream
+
+    def __init__(self, seed=0):
+        self.seed = seed
+
+    # 1: every row of a dataset with the given number of complaints, in
+    #    insert order, as (table, row) pairs
+
+    def rows(self, complaints):
+        rng = random.Random(self.seed)
+
+        def new_id():
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+        # categories
+        category_ids = {}
+        for category_id, name in enumerate(CATEGORIES, start=1):
+            category_ids[name] = category_id
+            yield "category", {"categoryid": category_id, "categoryname": name}
+
+        # admins: the configured admin sees everything, one admin per category
+        master_id = new_id()
+        yield "admin", self.admin_row(master_id, "Laura", "Reed", "Master Admin", ReadConfig.get_email())
+        admin_ids = {}
+        for role, category in ADMIN_ROLES.items():
+            admin_ids[category] = new_id()
+            yield "admin", self.admin_row(admin_ids[category], category, "Admin", role, None)
+
+        # users (only their ids are kept to pick complainants)
+        user_ids = []
+        for index in range(max(1, complaints // COMPLAINTS_PER_USER)):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            user_ids.append(new_id())
+            yield "users", {
+                "id": user_ids[-1],
+                "first_name": first,
+                "last_name": last,
+                "username": f"{first.lower()}{index}",
+                "email": f"{first.lower()}.{last.lower()}{index}@student.university.edu",
+                "profile_image_url": None,
+            }
+
+        # the complaints the config.ini search cases look for come first
+        anchors = self.anchor_complaints()
+        date_from, date_to = self.date_range()
+
+        for index in range(complaints):
+            if index < len(anchors):
+                complaint = anchors[index]
+                category = complaint["category"]
+                complaint_id = complaint["complaintid"] or new_id()
+                title = complaint["title"]
+                description = complaint["description"]
+                status = complaint["status"]
+            else:
+                category = rng.choice(CATEGORIES)
+                complaint_id = new_id()
+                title = f"{rng.choice(ISSUES[category])} in {rng.choice(PLACES)}"
+                description = f"{title} {rng.choice(DETAILS)}. Reported as case {index}."
+                status = rng.choices(STATUSES, weights=STATUS_WEIGHTS)[0]
+
+            submitted = self.random_date(rng, date_from, date_to)
+            yield "complaint", {
+                "complaintid": complaint_id,
+                "complainttitle": title,
+                "complaintdescription": description,
+                "complaintstatus": status,
+                "priority": rng.choice(PRIORITIES),
+                "submitteddate": submitted.isoformat(),
+                "dateofincident": submitted.date().isoformat(),
+                "categoryid": category_ids[category],
+                "complainantid": rng.choice(user_ids),
+                "adminid": admin_ids[category],
+                "admin_feedback": None,
+                "resolveddate": (submitted + timedelta(days=3)).isoformat() if status == "Resolved" else None,
+                "resolvedby": admin_ids[category] if status == "Resolved" else None,
+            }
+            yield DETAIL_TABLES[category], {"complaintid": complaint_id}
+
+            if index % ATTACHMENT_EVERY == 0:
+                yield "complaintattachment", {
+                    "id": new_id(),
+                    "complaintid": complaint_id,
+                    "fileurl": f"https://example.invalid/attachments/{complaint_id}.jpg",
+                    "description": "Photo of the issue",
+                    "filename": f"evidence_{index}.jpg",
+                }
+
+    # 2: complaints matching every keyword of the [search information] cases
+
+    @staticmethod
+    def anchor_complaints():
+        exact = ReadConfig.get_exact_match()
+        return [
+            {
+                # exact match, description, title, partial, numeric, complainant text
+                "complaintid": ReadConfig.get_complaint_id(),
+                "category": "Facility",
+                "title": exact,
+                "description": ReadConfig.get_description_keyword(),
+                "status": "Pending",
+            },
+            {
+                # multiple keywords must appear as one phrase
+                "complaintid": "",
+                "category": "Facility",
+                "title": f"{ReadConfig.get_title_keyword()} and leaking pipes",
+                "description": f"{ReadConfig.get_multiple_keywords()} water on the floor",
+                "status": ReadConfig.get_filter_status(),
+            },
+            {
+                # single keyword, category and status words inside the text
+                "complaintid": "",
+                "category": ReadConfig.get_category_keyword(),
+                "title": f"{ReadConfig.get_single_keyword()} portal {ReadConfig.get_category_keyword()} issue",
+                "description": f"{ReadConfig.get_status_keyword()} once, came back in {ReadConfig.get_complainant_name()} lab",
+                "status": ReadConfig.get_status_keyword(),
+            },
+        ]
+
+    # 3: submitted dates, mostly inside the FilterPage range
+
+    @staticmethod
+    def date_range():
+        date_from = datetime.strptime(ReadConfig.get_filter_date_from(), "%Y-%m-%d")
+        date_to = datetime.strptime(ReadConfig.get_filter_date_to(), "%Y-%m-%d")
+        return (
+            datetime.combine(date_from, time.min, timezone.utc),
+            datetime.combine(date_to, time.max, timezone.utc),
+        )
+
+    @staticmethod
+    def random_date(rng, date_from, date_to):
+        span = date_to - date_from
+        if rng.random() < IN_RANGE_SHARE:
+            offset = span * rng.random()
+        else:
+            # the rest falls in the same span before the range
+            offset = -span * rng.random() - timedelta(days=1)
+        return (date_from + offset).replace(microsecond=0)
+
+    @staticmethod
+    def admin_row(admin_id, first_name, last_name, role, email):
+        return {
+            "id": admin_id,
+            "adminfirstname": first_name,
+            "adminlastname": last_name,
+            "adminrole": role,
+            "email": email,
+            "profile_pic": None,
+        }
+
+    # 4: write a dataset as gzipped json lines, column names stored once per table
+
+    def write(self, path, complaints):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        columns = {}
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as file:
+            for table, row in self.rows(complaints):
+                if table not in columns:
+                    columns[table] = list(row)
+                    file.write(json.dumps({"table": table, "columns": columns[table]}) + "\n")
+                file.write(json.dumps([table, *row.values()], separators=(",", ":")) + "\n")
+        os.replace(temp_path, path)
+        return path
+
+    # 5: path of a tier file, generated on first use
+
+    def tier(self, name):
+        path = os.path.join(DATASET_DIR, f"complaints_{name}_seed{self.seed}.jsonl.gz")
+        if not os.path.exists(path):
+            self.write(path, TIERS[name])
+        return path
+
+
+# read a written dataset back as (table, row) pairs, one line at a time
+def read_dataset(path):
+    columns = {}
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            record = json.loads(line)
+            if isinstance(record, dict):
+                columns[record["table"]] = record["columns"]
+            else:
+                table = record[0]
+                yield table, dict(zip(columns[table], record[1:]))
+
+
+if __name__ == "__main__":
+    # python -m tests.utilities.dataset_generator [1k|10k|100k ...] [--seed=N]
+    seed = 0
+    names = []
+    for argument in sys.argv[1:]:
+        if argument.startswith("--seed="):
+            seed = int(argument.split("=", 1)[1])
+        else:
+            names.append(argument)
+
+    generator = DatasetGenerator(seed)
+    for name in names or list(TIERS):
+        print(generator.tier(name))
@@ -0,0 +1,82 @@
+import os
+import time
+from dataclasses import dataclass
+
+from selenium.common.exceptions import TimeoutException
+
+# names browsers give a download while it is still being written
+# (chrome/edge: .crdownload, firefox: .part next to an empty final file)
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".download", ".tmp")
+
+# how often the folder is checked while waiting
+POLL_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    path: str
+    size: int
+    # seconds from start() until the file was complete
+    latency: float
+
+
+class DownloadWatcher:
+    # waits for a new, finished file in a download folder
+
+    def __init__(self, download_dir, filename_pattern="", extension=".pdf"):
+        self.download_dir = download_dir
+        self.filename_pattern = filename_pattern
+        self.extension = extension
+        self.existing = set()
+        self.started = None
+
+    # 1: remember what is already there (call right before the click)
+
+    def start(self, ignore_existing=True):
+        self.existing = set(self.list_files()) if ignore_existing else set()
+        self.started = time.monotonic()
+        return self
+
+    # 2: wait for a completed matching file that was not there before
+
+    def wait(self, timeout=30):
+        if self.started is None:
+            self.start()
+        deadline = self.started + timeout
+        while True:
+            result = self.find_completed()
+            if result is not None:
+                return result
+            if time.monotonic() >= deadline:
+                raise TimeoutException(
+                    f"No completed {self.extension} download in {self.download_dir} within {timeout}s"
+                )
+            time.sleep(POLL_SECONDS)
+
+    def find_completed(self):
+        names = self.list_files()
+        partial = {name for name in names if name.endswith(PARTIAL_SUFFIXES)}
+
+        for name in names:
+            if name in self.existing or name in partial:
+                continue
+            if self.filename_pattern not in name or not name.endswith(self.extension):
+                continue
+            # firefox keeps the final name empty until the .part file is renamed
+            if any(other.startswith(name) for other in partial):
+                continue
+
+            path = os.path.join(self.download_dir, name)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            if size > 0:
+                return DownloadResult(path, size, time.monotonic() - self.started)
+        return None
+
+    def list_files(self):
+        try:
+            return os.listdir(self.download_dir)
+        except FileNotFoundError:
+            return []
@@ -0,0 +1,168 @@
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+
+class DriverPool:
+    # keeps launched browsers alive for the whole worker session and hands
+    # out a cleaned one to every test instead of starting a new process
+
+    def __init__(self, factory, max_uses=20):
+        # factory: callable that launches a new configured driver
+        # max_uses: replace a browser after it has served this many tests
+        self.factory = factory
+        self.max_uses = max_uses
+        self.idle = []
+        self.uses = {}
+        self.launched = 0
+        self.recycled = 0
+
+    # 1: get a clean, healthy browser
+
+    def acquire(self):
+        while self.idle:
+            driver = self.idle.pop()
+            if self.is_alive(driver):
+                self.uses[id(driver)] += 1
+                return driver
+            # browser crashed or lost its session while idle
+            self.discard(driver)
+
+        driver = self.factory()
+        self.track_origins(driver)
+        self.launched += 1
+        self.uses[id(driver)] = 1
+        return driver
+
+    # 2: give the browser back after a test
+
+    def release(self, driver):
+        if self.uses.get(id(driver), 0) >= self.max_uses:
+            self.discard(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except Exception:
+            # anything that fails while cleaning means the browser is unusable
+            self.discard(driver)
+            return
+
+        self.idle.append(driver)
+
+    # 3: wipe the state a test may have left behind
+
+    def reset(self, driver):
+        # a test that closed its last window leaves no session to clean
+        handles = driver.window_handles
+        if not handles:
+            raise WebDriverException("Browser has no open windows")
+
+        # dismiss a leftover alert, otherwise every command below fails
+        try:
+            driver.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
+
+        # close every tab except the first one, noting the origins they show
+        origins = set(getattr(driver, "visited_origins", ()))
+        main_handle = handles[0]
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            origins.add(origin_of(driver.current_url))
+            driver.close()
+        driver.switch_to.window(main_handle)
+        current = origin_of(driver.current_url)
+        origins.add(current)
+        origins.discard(None)
+
+        # storage and cookies are per origin and only reachable from a page of
+        # that origin: clear the current page first, then load a light page
+        # of every other origin the test visited (usually there is none)
+        for origin in sorted(origins, key=lambda origin: (origin != current, origin)):
+            if origin != current:
+                navigate(driver, f"{origin}/robots.txt")
+            self.clear_page_storage(driver)
+
+        # chrome and edge: indexeddb, cache storage and service workers of
+        # those origins too, and the cookies of every domain (also ones only
+        # reached by requests). Firefox keeps those between tests.
+        if hasattr(driver, "execute_cdp_cmd"):
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+        navigate(driver, "about:blank")
+        driver.visited_origins = set()
+        driver.implicitly_wait(10)
+
+    @staticmethod
+    def clear_page_storage(driver):
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except WebDriverException:
+            # about:blank, data: and error pages have no storage
+            pass
+        driver.delete_all_cookies()
+
+    # remember the origin of every driver.get, so reset() can clear them all
+    @staticmethod
+    def track_origins(driver):
+        get = driver.get
+        driver.visited_origins = set()
+
+        def tracked_get(url):
+            origin = origin_of(url)
+            if origin:
+                driver.visited_origins.add(origin)
+            return get(url)
+
+        driver.get = tracked_get
+        return driver
+
+    # 4: check that the browser still answers
+
+    @staticmethod
+    def is_alive(driver):
+        try:
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    # 5: quit a browser and forget it
+
+    def discard(self, driver):
+        self.uses.pop(id(driver), None)
+        self.recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    # 6: quit every browser at the end of the session
+
+    def close(self):
+        while self.idle:
+            driver = self.idle.pop()
+            self.uses.pop(id(driver), None)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+# "https://host:port" of a page url, None for about:, data: and file: pages
+def origin_of(url):
+    parsed = urlparse(url or "")
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+# load a page without the wrappers around driver.get (page metrics, origin
+# tracking): the pool's own navigations are not part of any test
+def navigate(driver, url):
+    driver.execute(Command.GET, {"url": url})
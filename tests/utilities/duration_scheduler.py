@@ -0,0 +1,251 @@
+import glob
+import heapq
+import json
+import os
+import statistics
+import time
+from itertools import cycle
+
+from xdist.scheduler import LoadScheduling
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALLURE_RESULTS_DIR = os.path.join(base_dir, "tests", "reports", "allure-results")
+
+# durations of earlier runs, kept because the batch files empty allure-results
+DURATIONS_FILE = os.path.join(base_dir, "tests", "reports", "durations.json")
+
+# samples kept per test in DURATIONS_FILE
+MAX_SAMPLES = 5
+
+# estimate (seconds) for a test when nothing is known about its file either
+DEFAULT_DURATION = 15.0
+
+
+# ------------------------
+#  DURATION HISTORY
+# ------------------------
+
+# 1: nodeid -> list of past durations (seconds)
+
+def load_history(results_dir=ALLURE_RESULTS_DIR, durations_file=DURATIONS_FILE):
+    history = {}
+
+    try:
+        with open(durations_file, "r", encoding="utf-8") as file:
+            for nodeid, samples in json.load(file).items():
+                history.setdefault(nodeid, []).extend(samples)
+    except (OSError, ValueError):
+        pass
+
+    for path in glob.glob(os.path.join(results_dir, "*-result.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                result = json.load(file)
+            nodeid = allure_nodeid(result)
+            duration = (result["stop"] - result["start"]) / 1000
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        if nodeid and duration >= 0:
+            history.setdefault(nodeid, []).append(duration)
+
+    return history
+
+
+# titlePath ["test_cases", "test_search.py", "TestSearch"] + name -> pytest nodeid
+def allure_nodeid(result):
+    title_path = result.get("titlePath") or []
+    name = result.get("name")
+    modules = [index for index, part in enumerate(title_path) if part.endswith(".py")]
+    if not name or not modules:
+        return None
+    path = "/".join(title_path[: modules[0] + 1])
+    return "::".join([path, *title_path[modules[0] + 1:], name])
+
+
+# 2: remember this run's durations for the next one (nodeid -> seconds of
+#    each time the test ran)
+
+def save_history(durations, durations_file=DURATIONS_FILE):
+    try:
+        with open(durations_file, "r", encoding="utf-8") as file:
+            stored = json.load(file)
+    except (OSError, ValueError):
+        stored = {}
+
+    for nodeid, runs in durations.items():
+        samples = stored.get(nodeid, []) + [round(duration, 3) for duration in runs]
+        stored[nodeid] = samples[-MAX_SAMPLES:]
+
+    os.makedirs(os.path.dirname(durations_file), exist_ok=True)
+    temp_path = f"{durations_file}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(stored, file, indent=1, sort_keys=True)
+    os.replace(temp_path, durations_file)
+
+
+class DurationEstimator:
+    # expected duration of a test: its own median, else the median of its
+    # file, else the median of everything known, else DEFAULT_DURATION
+
+    def __init__(self, history):
+        self.known = {
+            nodeid: statistics.median(samples) for nodeid, samples in history.items() if samples
+        }
+        by_file = {}
+        for nodeid, duration in self.known.items():
+            by_file.setdefault(nodeid.split("::")[0], []).append(duration)
+        self.file_medians = {path: statistics.median(values) for path, values in by_file.items()}
+        self.overall = statistics.median(self.known.values()) if self.known else DEFAULT_DURATION
+
+    def estimate(self, nodeid):
+        if nodeid in self.known:
+            return self.known[nodeid]
+        # parametrized variants share the history of their siblings
+        base = nodeid.split("[", 1)[0]
+        siblings = [value for key, value in self.known.items() if key.split("[", 1)[0] == base]
+        if siblings:
+            return statistics.median(siblings)
+        return self.file_medians.get(nodeid.split("::")[0], self.overall)
+
+
+# ------------------------
+#  SCHEDULER
+# ------------------------
+
+class LongestFirstScheduling(LoadScheduling):
+    # hands out tests longest first, two at a time, to whichever worker is free
+    # (greedy LPT); the estimated makespan against "load" is kept in .report
+
+    # a worker holds one running test and one queued test
+    queue_depth = 2
+
+    def __init__(self, config, log=None):
+        super().__init__(config, log)
+        self.estimator = DurationEstimator(load_history(allure_results_dir(config)))
+        self.report = None
+        self.started = None
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # later calls (new nodes) only top the workers up
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        durations = [self.estimator.estimate(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: -durations[index])
+        if not self.collection:
+            return
+
+        self.report = {
+            "workers": len(self.nodes),
+            "tests": len(self.collection),
+            "with_history": sum(1 for nodeid in self.collection if nodeid in self.estimator.known),
+            "longest_first": simulate_makespan(durations, len(self.nodes), "longest"),
+            "load": simulate_makespan(durations, len(self.nodes), "load", self.maxschedchunk),
+        }
+
+        # deal the longest tests out first, one per worker per round
+        self.started = time.monotonic()
+        for _ in range(self.queue_depth):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        if self.pending:
+            missing = self.queue_depth - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
+
+
+def allure_results_dir(config):
+    configured = getattr(config.option, "allure_report_dir", None)
+    if not configured:
+        return ALLURE_RESULTS_DIR
+    return configured if os.path.isabs(configured) else os.path.join(base_dir, configured)
+
+
+# ------------------------
+#  MAKESPAN ESTIMATE
+# ------------------------
+
+# wall time of a run with the given per-test durations (collection order) on
+# `workers` workers, replaying the "longest" or xdist's "load" hand-out rules
+
+def simulate_makespan(durations, workers, scheduler="longest", maxschedchunk=None):
+    count = len(durations)
+    if count == 0 or workers <= 0:
+        return 0.0
+
+    if scheduler == "longest":
+        pending = sorted(range(count), key=lambda index: -durations[index])
+    else:
+        pending = list(range(count))
+    queues = [[] for _ in range(workers)]
+    maxschedchunk = maxschedchunk or count
+
+    def send(worker, number):
+        queues[worker].extend(pending[:number])
+        del pending[:number]
+
+    # initial hand-out
+    if scheduler == "longest":
+        for _ in range(LongestFirstScheduling.queue_depth):
+            for worker in range(workers):
+                send(worker, 1)
+    elif count < 2 * workers:
+        nodes = cycle(range(workers))
+        for _ in range(count):
+            send(next(nodes), 1)
+    else:
+        chunk = max(min(count // workers // 4, maxschedchunk), 2)
+        for worker in range(workers):
+            send(worker, chunk)
+
+    # refill rules after each finished test (see LoadScheduling.check_schedule)
+    def refill(worker, duration):
+        if not pending:
+            return
+        queue = queues[worker]
+        if scheduler == "longest":
+            send(worker, max(0, LongestFirstScheduling.queue_depth - len(queue)))
+            return
+        minimum = max(2, len(pending) // workers // 4)
+        maximum = max(2, len(pending) // workers // 2)
+        if len(queue) < minimum:
+            if duration >= 0.1 and len(queue) >= 2:
+                return
+            send(worker, min(maximum - len(queue), max(2 - len(queue), maxschedchunk)))
+
+    events = []
+    for worker in range(workers):
+        if queues[worker]:
+            heapq.heappush(events, (durations[queues[worker][0]], worker))
+
+    # a worker only runs dry once nothing is pending any more
+    makespan = 0.0
+    while events:
+        now, worker = heapq.heappop(events)
+        makespan = max(makespan, now)
+        finished = queues[worker].pop(0)
+        refill(worker, durations[finished])
+        if queues[worker]:
+            heapq.heappush(events, (now + durations[queues[worker][0]], worker))
+
+    return round(makespan, 1)
@@ -1,31 +1,213 @@
+import glob
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
 import openpyxl
+import pytest
 from openpyxl.styles import PatternFill
 
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# results recorded during the run, one journal file per process
+JOURNAL_DIR = os.path.join(base_dir, "tests", ".excel-journal")
+
+# a lock older than this belongs to a process that died
+STALE_LOCK_SECONDS = 120
+
+# parsed sheets: (absolute path, sheet name) -> (file mtime, rows as tuples)
+sheet_cache = {}
+
+
+# read a whole sheet once; later calls reuse it until the file changes
+def load_sheet(file, sheetname):
+    path = os.path.abspath(file)
+    mtime = os.path.getmtime(path)
+    cached = sheet_cache.get((path, sheetname))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # read_only streams the rows instead of building the full cell model
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = tuple(workbook[sheetname].iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+    sheet_cache[(path, sheetname)] = (mtime, rows)
+    return rows
+
+
+# rows as tuples (header row included)
+def iter_rows(file, sheetname):
+    yield from load_sheet(file, sheetname)
+
+
+# data rows as dicts keyed by the header row, empty rows skipped
+def iter_dicts(file, sheetname):
+    rows = iter_rows(file, sheetname)
+    header = next(rows, ())
+    for row in rows:
+        if any(value is not None for value in row):
+            yield dict(zip(header, row))
+
+
+# arguments for pytest.mark.parametrize: one case per data row, the header
+# row gives the argument names (row_arg adds the sheet row number)
+def parametrize_args(file, sheetname, id_column=None, row_arg=None):
+    rows = iter_rows(file, sheetname)
+    header = list(next(rows, ()))
+    cases = []
+    for number, row in enumerate(rows, start=2):
+        if all(value is None for value in row):
+            continue
+        values = dict(zip(header, row))
+        case_id = f"row{number}"
+        if id_column is not None:
+            case_id = f"{case_id}-{values[id_column]}"
+        if row_arg is not None:
+            values[row_arg] = number
+        cases.append(pytest.param(*values.values(), id=case_id))
+    argnames = header + ([row_arg] if row_arg is not None else [])
+    return ",".join(argnames), cases
+
 
 # number of rows
 def get_row_count(file, sheetname):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetname]
-    return sheet.max_row
+    return len(load_sheet(file, sheetname))
 
 
 # number of columns
 def get_column_count(file, sheetname):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetname]
-    return sheet.max_column
+    return max((len(row) for row in load_sheet(file, sheetname)), default=0)
 
 
 # read data
 def read_data(file, sheetname, row_num, column_num):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetname]
-    return sheet.cell(row_num, column_num).value
+    rows = load_sheet(file, sheetname)
+    if row_num > len(rows) or column_num > len(rows[row_num - 1]):
+        return None
+    return rows[row_num - 1][column_num - 1]
 
 
 # write data
 def write_data(file, sheetname, row_num, column_num, data):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetname]
-    sheet.cell(row_num, column_num).value = data
-    workbook.save(file)
+    with file_lock(file):
+        workbook = openpyxl.load_workbook(file)
+        sheet = workbook[sheetname]
+        sheet.cell(row_num, column_num).value = data
+        workbook.save(file)
+    # the mtime can stay the same within one clock tick
+    sheet_cache.pop((os.path.abspath(file), sheetname), None)
+
+
+# only one process at a time may save a workbook
+@contextmanager
+def file_lock(file, timeout=60):
+    lock_path = f"{os.path.abspath(file)}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            handle = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{lock_path} is held by another process")
+            time.sleep(0.1)
+
+    try:
+        os.write(handle, str(os.getpid()).encode("ascii"))
+        os.close(handle)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+# ------------------------
+#  BUFFERED RESULTS
+# ------------------------
+
+# 1: note a cell to write at session end (cheap, safe from any xdist worker);
+#    column is a number or a header name (added as a new column if missing),
+#    output_file receives a copy of the sheet instead of changing the input
+
+def record_result(file, sheetname, row_num, column, data, output_file=None):
+    os.makedirs(JOURNAL_DIR, exist_ok=True)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    entry = {
+        "file": os.path.abspath(file),
+        "output": os.path.abspath(output_file) if output_file else None,
+        "sheet": sheetname,
+        "row": row_num,
+        "column": column,
+        "data": data,
+    }
+    journal = os.path.join(JOURNAL_DIR, f"{worker}-{os.getpid()}.jsonl")
+    with open(journal, "a", encoding="utf-8") as file:
+        file.write(json.dumps(entry) + "\n")
+
+
+# 2: apply every recorded result, one load and one save per workbook
+
+def flush_results():
+    journals = sorted(glob.glob(os.path.join(JOURNAL_DIR, "*.jsonl")))
+    workbooks = {}
+    for journal in journals:
+        with open(journal, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a worker killed mid-write leaves half a line
+                    continue
+                workbooks.setdefault((entry["file"], entry["output"]), []).append(entry)
+
+    written = 0
+    for (source, output), entries in workbooks.items():
+        target = output or source
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with file_lock(target):
+            if output:
+                shutil.copyfile(source, output)
+            workbook = openpyxl.load_workbook(target)
+            for entry in entries:
+                sheet = workbook[entry["sheet"]]
+                sheet.cell(entry["row"], column_number(sheet, entry["column"])).value = entry["data"]
+                written += 1
+            workbook.save(target)
+        for sheetname in {entry["sheet"] for entry in entries}:
+            sheet_cache.pop((target, sheetname), None)
+
+    for journal in journals:
+        os.remove(journal)
+    return written
+
+
+# 3: forget results of a run that never reached its flush
+
+def discard_results():
+    for journal in glob.glob(os.path.join(JOURNAL_DIR, "*.jsonl")):
+        os.remove(journal)
+
+
+def column_number(sheet, column):
+    if isinstance(column, int):
+        return column
+    for cell in sheet[1]:
+        if cell.value == column:
+            return cell.column
+    # new header at the end of the first row
+    number = sheet.max_column + 1
+    sheet.cell(1, number).value = column
+    return number
@@ -1,25 +1,173 @@
+import argparse
+import base64
 import os
 import json
-import glob
+import re
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from html import escape
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# run as a script (python tests/utilities/generate_dashboard.py)
+if base_dir not in sys.path:
+    sys.path.insert(0, base_dir)
+
+from tests.utilities.browser_trace import TRACE_ATTACHMENT
+from tests.utilities.run_history import HISTORY_DB, RunHistory
+from tests.utilities.page_metrics import PAGE_METRICS_FILE, read_summary
+from tests.utilities.step_timing import STEP_TIMINGS_FILE, read_table
 
 # Define where test results are stored
-RESULTS_DIR = os.path.join("tests", "reports", "allure-results")
+RESULTS_DIR = os.path.join(base_dir, "tests", "reports", "allure-results")
 # Define where the final report will be saved
-OUTPUT_FILE = os.path.join("tests", "reports", "report.html")
+OUTPUT_FILE = os.path.join(base_dir, "tests", "reports", "report.html")
+# Parsed summaries of earlier runs, keyed by file name, size and mtime
+INDEX_FILE = os.path.join(base_dir, "tests", "reports", "dashboard_index.json")
+
+# bump when summarize() changes so old index entries are parsed again
+INDEX_VERSION = 2
+
+# below this many files to parse, a process pool costs more than it saves
+POOL_THRESHOLD = 500
+
+
+# ------------------------
+#  RESULT FILES
+# ------------------------
+
+# 1: the fields the report needs from one allure result file
+
+def summarize(path):
+    with open(path, "r", encoding="utf-8") as file:
+        result = json.load(file)
+    details = result.get("statusDetails") or {}
+    return {
+        "uuid": result.get("uuid"),
+        "name": result.get("name"),
+        "status": result.get("status", "skipped"),
+        "start": result.get("start", 0),
+        "stop": result.get("stop", 0),
+        "statusDetails": {
+            "message": details.get("message"),
+            "trace": details.get("trace"),
+        },
+        "browserTraces": browser_traces(result),
+    }
+
+
+# [name, file] of the --trace-browser attachments, steps included
+def browser_traces(node):
+    traces = [
+        [attachment["name"][len(TRACE_ATTACHMENT) + 2:], attachment["source"]]
+        for attachment in node.get("attachments") or []
+        if attachment.get("name", "").startswith(TRACE_ATTACHMENT) and attachment.get("source")
+    ]
+    for step in node.get("steps") or []:
+        traces.extend(browser_traces(step))
+    return traces
+
+
+# (name, summary, error) for one file; errors are reported, not raised
+def parse_file(path):
+    try:
+        return os.path.basename(path), summarize(path), None
+    except Exception as error:
+        return os.path.basename(path), None, f"{type(error).__name__}: {error}"
+
+
+# 2: summaries of every result file, parsing only files that are new or
+#    changed since the index was written
+
+def load_results(results_dir=RESULTS_DIR, index_file=INDEX_FILE):
+    started = time.perf_counter()
+
+    files = {}
+    if os.path.isdir(results_dir):
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith("-result.json"):
+                    stat = entry.stat()
+                    files[entry.name] = [stat.st_size, stat.st_mtime_ns]
+
+    index = {}
+    try:
+        with open(index_file, "r", encoding="utf-8") as file:
+            stored = json.load(file)
+        if stored.get("version") == INDEX_VERSION and stored.get("results_dir") == os.path.abspath(results_dir):
+            index = stored["entries"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    # entries of deleted files drop out here
+    index = {name: entry for name, entry in index.items() if entry.get("stat") == files.get(name)}
+    stale = [os.path.join(results_dir, name) for name in files if name not in index]
 
+    if len(stale) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor() as pool:
+            parsed = list(pool.map(parse_file, stale, chunksize=max(1, len(stale) // (4 * (os.cpu_count() or 1)))))
+    else:
+        parsed = [parse_file(path) for path in stale]
 
-def generate():
-    results = []
+    for name, summary, error in parsed:
+        index[name] = {"stat": files[name], "summary": summary, "error": error}
 
-    # Load all JSON result files from the results directory
-    if os.path.exists(RESULTS_DIR):
-        for f in glob.glob(os.path.join(RESULTS_DIR, "*-result.json")):
-            try:
-                with open(f, "r", encoding="utf-8") as file:
-                    results.append(json.load(file))
-            except:
-                pass  # Ignore files that can't be read
+    if stale or len(index) != len(files) or not os.path.exists(index_file):
+        save_index(index_file, results_dir, index)
+
+    results = [entry["summary"] for entry in index.values() if entry["summary"] is not None]
+    errors = sorted((name, entry["error"]) for name, entry in index.items() if entry["error"])
+    stats = {
+        "files": len(files),
+        "parsed": len(stale),
+        "cached": len(files) - len(stale),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    return results, errors, stats
+
+
+def save_index(index_file, results_dir, entries):
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    temp_path = f"{index_file}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(
+            {"version": INDEX_VERSION, "results_dir": os.path.abspath(results_dir), "entries": entries},
+            file,
+            separators=(",", ":"),
+        )
+    os.replace(temp_path, index_file)
+
+
+# ------------------------
+#  REPORT
+# ------------------------
+
+# failure details per lazily loaded file
+DETAILS_CHUNK_SIZE = 200
+
+# rows are fixed height so the list can be virtualized (matches h-14)
+ROW_HEIGHT = 56
+
+
+def generate(
+    results_dir=RESULTS_DIR,
+    output_file=OUTPUT_FILE,
+    index_file=INDEX_FILE,
+    self_contained=False,
+    history_db=HISTORY_DB,
+    step_timings_file=STEP_TIMINGS_FILE,
+    page_metrics_file=PAGE_METRICS_FILE,
+):
+    results, errors, stats = load_results(results_dir, index_file)
+
+    # unreadable files used to vanish from the report without a trace
+    for name, error in errors:
+        print(f"Skipped unreadable result file {name}: {error}")
 
     # Sort results: Failed/Broken first, then by start time
     status_prio = {"failed": 0, "broken": 1, "passed": 2, "skipped": 3}
@@ -30,46 +178,167 @@ def generate():
         )
     )
 
+    # light rows for the page, messages and traces in chunk files (kept
+    # inside the page itself in self-contained mode)
+    rows, chunks = split_details(results)
+    data_dir = f"{os.path.splitext(output_file)[0]}_data"
+    if not self_contained:
+        write_detail_chunks(data_dir, chunks)
+
+    passed = sum(1 for test in results if test["status"] == "passed")
+    failed = sum(1 for test in results if test["status"] in ("failed", "broken"))
+    pass_rate = round(passed / len(results) * 100) if results else 0
+
+    report_data = {
+        "tests": rows,
+        "index": build_name_index([row[0] for row in rows]),
+        "dataDir": os.path.basename(data_dir),
+        # trace attachments are linked where allure wrote them
+        "resultsDir": os.path.relpath(results_dir, os.path.dirname(os.path.abspath(output_file))).replace(os.sep, "/"),
+        "rowHeight": ROW_HEIGHT,
+    }
+
+    # duration regressions from the run history, when there is one
+    regressions = None
+    if history_db and os.path.exists(history_db):
+        regressions = RunHistory(history_db).regressions()
+
+    # page-object latency table of the last --step-timing run
+    step_timings = read_table(step_timings_file) if step_timings_file else None
+
+    # browser timings of the last --page-metrics run
+    page_metrics = read_summary(page_metrics_file) if page_metrics_file else None
+
+    html = render_html(
+        report_data,
+        len(results),
+        passed,
+        failed,
+        pass_rate,
+        self_contained,
+        regressions,
+        step_timings,
+        page_metrics,
+        chunks if self_contained else None,
+    )
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(
+        f"Generated: {output_file} ({len(results)} tests; {stats['parsed']} parsed, "
+        f"{stats['cached']} from index in {stats['seconds']}s)"
+    )
+    return stats
+
+
+# [name, status, duration ms, details chunk or -1] per test, and the chunks
+# as {test position: {message, trace, browserTraces}}
+def split_details(results):
+    rows = []
+    chunks = []
+    for position, test in enumerate(results):
+        chunk = -1
+        details = dict(test.get("statusDetails") or {}, browserTraces=test.get("browserTraces") or [])
+        if test["status"] in ("failed", "broken") and (
+            details["message"] or details["trace"] or details["browserTraces"]
+        ):
+            if not chunks or len(chunks[-1]) >= DETAILS_CHUNK_SIZE:
+                chunks.append({})
+            chunk = len(chunks) - 1
+            chunks[chunk][position] = details
+        rows.append([test.get("name") or "", test["status"], max(0, test["stop"] - test["start"]), chunk])
+    return rows, chunks
+
+
+# details-<n>.js files; script tags load them, so the report also works
+# when opened from disk where fetch() is blocked
+def write_detail_chunks(data_dir, chunks):
+    os.makedirs(data_dir, exist_ok=True)
+    for name in os.listdir(data_dir):
+        if name.startswith("details-") and name.endswith(".js"):
+            os.remove(os.path.join(data_dir, name))
+    for number, details in enumerate(chunks):
+        with open(os.path.join(data_dir, f"details-{number}.js"), "w", encoding="utf-8") as file:
+            file.write(f"reportDetails({number}, {script_json(details)});\n")
+
+
+# sorted name tokens and the tests holding each one; the page finds a
+# query word by binary search over the tokens (prefix match)
+def build_name_index(names):
+    postings = {}
+    for position, name in enumerate(names):
+        for token in set(re.findall(r"[a-z0-9]+", name.lower())):
+            postings.setdefault(token, []).append(position)
+    tokens = sorted(postings)
+    return {"tokens": tokens, "postings": [postings[token] for token in tokens]}
+
+
+# json that is safe inside a <script> element
+def script_json(value):
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
+
+
+def render_html(
+    report_data,
+    total,
+    passed,
+    failed,
+    pass_rate,
+    self_contained=False,
+    regressions=None,
+    step_timings=None,
+    page_metrics=None,
+    inline_chunks=None,
+):
+    # detail chunks as inert json elements, parsed on first use like the files
+    inline_details = "".join(
+        f'<script type="application/json" id="report-details-{number}">{script_json(details)}</script>'
+        for number, details in enumerate(inline_chunks or [])
+    )
+
     # Define logo paths
-    logo_path = "../../public/images/BGlessLogo.png"
-    logo_dark_path = "../../public/images/BGlessLogoDark.png"
+    logo_path = logo_source("BGlessLogo.png", self_contained)
+    logo_dark_path = logo_source("BGlessLogoDark.png", self_contained)
 
-    # Start building the HTML string
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="en" class="dark">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>ComplaNet — Automated Test Report</title>
-        <!-- Use Tailwind CSS for styling -->
+    if self_contained:
+        # no network: precompiled utilities, svg icons, system fonts
+        assets = f"<style>{OFFLINE_CSS}</style>"
+    else:
+        assets = """<!-- Use Tailwind CSS for styling -->
         <script src="https://cdn.tailwindcss.com"></script>
-        <!-- Use Alpine.js for interactivity -->
-        <script defer src="https://cdn.jsdelivr.net/npm/alpinejs@3.x.x/dist/cdn.min.js"></script>
         <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
         <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap" rel="stylesheet">
         
         <script>
             // Configure Tailwind to support dark mode and custom colors
-            tailwind.config = {{
+            tailwind.config = {
                 darkMode: 'class',
-                theme: {{
-                    extend: {{
-                        colors: {{
+                theme: {
+                    extend: {
+                        colors: {
                             'bg-light': '#F5F6F8',
                             'bg-dark': '#1E1E1E',
                             'eco-light': '#E3F2FD',
                             'eco': '#a6e3ff',
                             'eco-dark': '#2b88ba',
                             'greenvine': '#1d4ed8'
-                        }},
-                        fontFamily: {{
+                        },
+                        fontFamily: {
                             sans: ['Poppins', 'sans-serif'],
-                        }}
-                    }}
-                }}
-            }}
-        </script>
+                        }
+                    }
+                }
+            }
+        </script>"""
+
+    # Start building the HTML string
+    return f"""
+    <!DOCTYPE html>
+    <html lang="en" class="dark">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>ComplaNet — Automated Test Report</title>
+        {assets}
         <style>
             /* Custom styles for dashboard cards and scrollbar */
             :root {{
@@ -79,7 +348,7 @@ def generate():
                 --card-resolved-from: #22c55e; --card-resolved-to: #10b981;
             }}
             body {{ font-family: 'Poppins', sans-serif; }}
-            [x-cloak] {{ display: none !important; }}
+            [hidden] {{ display: none !important; }}
             .dashboard-card-total {{ background: linear-gradient(to bottom right, var(--card-total-from), var(--card-total-to)); }}
             .dashboard-card-resolved {{ background: linear-gradient(to bottom right, var(--card-resolved-from), var(--card-resolved-to)); }}
             ::-webkit-scrollbar {{ width: 8px; }}
@@ -87,7 +356,7 @@ def generate():
             ::-webkit-scrollbar-thumb {{ background: #424242; border-radius: 4px; }}
         </style>
     </head>
-    <body class="flex flex-col min-h-screen bg-[#F5F6F8] text-[#2B2B2B] dark:bg-[#1E1E1E] dark:text-white transition-all duration-300 font-sans" x-data="app()">
+    <body class="flex flex-col min-h-screen bg-[#F5F6F8] text-[#2B2B2B] dark:bg-[#1E1E1E] dark:text-white transition-all duration-300 font-sans">
 
         <!-- Header Section -->
         <header class="flex items-center justify-between px-3 md:px-6 py-4 bg-pink dark:bg-gray-800 shadow-md">
@@ -117,9 +386,9 @@ def generate():
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-blue-100 text-sm font-medium mb-1">Total Tests</p>
-                            <h3 class="text-3xl font-bold" x-text="stats.total"></h3>
+                            <h3 class="text-3xl font-bold">{total}</h3>
                         </div>
-                        <div class="bg-white bg-opacity-20 rounded-full p-3"><i class="fas fa-clipboard-list text-2xl"></i></div>
+                        <div class="bg-white bg-opacity-20 rounded-full p-3">{icon("fa-clipboard-list", "text-2xl", self_contained)}</div>
                     </div>
                 </div>
                 <!-- Passed Tests -->
@@ -127,9 +396,9 @@ def generate():
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-green-100 text-sm font-medium mb-1">Passed</p>
-                            <h3 class="text-3xl font-bold" x-text="stats.passed"></h3>
+                            <h3 class="text-3xl font-bold">{passed}</h3>
                         </div>
-                        <div class="bg-white bg-opacity-20 rounded-full p-3"><i class="fas fa-check-circle text-2xl"></i></div>
+                        <div class="bg-white bg-opacity-20 rounded-full p-3">{icon("fa-check-circle", "text-2xl", self_contained)}</div>
                     </div>
                 </div>
                 <!-- Failed Tests -->
@@ -137,9 +406,9 @@ def generate():
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-red-100 text-sm font-medium mb-1">Failed</p>
-                            <h3 class="text-3xl font-bold" x-text="stats.failed"></h3>
+                            <h3 class="text-3xl font-bold">{failed}</h3>
                         </div>
-                        <div class="bg-white bg-opacity-20 rounded-full p-3"><i class="fas fa-exclamation-triangle text-2xl"></i></div>
+                        <div class="bg-white bg-opacity-20 rounded-full p-3">{icon("fa-exclamation-triangle", "text-2xl", self_contained)}</div>
                     </div>
                 </div>
                 <!-- Success Rate -->
@@ -147,101 +416,49 @@ def generate():
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-purple-100 text-sm font-medium mb-1">Success Rate</p>
-                            <h3 class="text-3xl font-bold" x-text="passRate + '%'"></h3>
+                            <h3 class="text-3xl font-bold">{pass_rate}%</h3>
                         </div>
-                        <div class="bg-white bg-opacity-20 rounded-full p-3"><i class="fas fa-chart-pie text-2xl"></i></div>
+                        <div class="bg-white bg-opacity-20 rounded-full p-3">{icon("fa-chart-pie", "text-2xl", self_contained)}</div>
                     </div>
                 </div>
             </div>
 
+            {regressions_section(regressions)}
+
+            {step_timings_section(step_timings)}
+
+            {page_metrics_section(page_metrics)}
+
             <!-- Test List Section -->
             <div class="bg-white dark:bg-gray-800 rounded-xl shadow-lg p-6 mb-4">
-                <div class="flex justify-between items-center mb-6">
+                <div class="flex flex-col md:flex-row md:justify-between md:items-center gap-3 mb-6">
                     <h2 class="text-xl font-bold text-gray-800 dark:text-gray-200">Test Log</h2>
-                    <!-- Filters -->
-                    <div class="flex gap-2">
-                         <button @click="filter = 'all'" :class="filter === 'all' ? 'text-eco-dark dark:text-eco font-bold' : 'text-gray-500 hover:text-gray-300'" class="text-sm transition-colors">All</button>
-                         <span class="text-gray-400">|</span>
-                         <button @click="filter = 'failed'" :class="filter === 'failed' ? 'text-red-500 font-bold' : 'text-gray-500 hover:text-gray-300'" class="text-sm transition-colors">Failed</button>
+                    <div class="flex items-center gap-4">
+                        <!-- Search -->
+                        <input id="search" type="search" placeholder="Search tests..." autocomplete="off"
+                               class="w-full md:w-64 px-3 py-1.5 rounded-md text-sm bg-gray-100 dark:bg-gray-700 text-gray-800 dark:text-gray-200 border border-gray-200 dark:border-gray-600 focus:outline-none">
+                        <!-- Filters -->
+                        <div class="flex gap-2 shrink-0">
+                             <button data-filter="all" class="filter-button text-sm transition-colors">All</button>
+                             <span class="text-gray-400">|</span>
+                             <button data-filter="failed" class="filter-button text-sm transition-colors">Failed</button>
+                        </div>
                     </div>
                 </div>
-                
-                <!-- Desktop View: Table -->
-                <div class="hidden md:block overflow-x-auto">
-                    <table class="min-w-full bg-white dark:bg-gray-800">
-                        <thead class="text-gray-500 dark:text-gray-400 uppercase text-xs leading-normal border-b dark:border-gray-700">
-                            <tr>
-                                <th class="py-3 px-6 text-left">Test Name</th>
-                                <th class="py-3 px-6 text-left">Duration</th>
-                                <th class="py-3 px-6 text-center">Status</th>
-                                <th class="py-3 px-6 text-center">Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody class="text-gray-600 dark:text-gray-300 text-sm font-light">
-                            <template x-for="test in filteredTests" :key="test.uuid">
-                                <tr class="border-b border-gray-200 dark:border-gray-700 hover:bg-gray-50 dark:hover:bg-gray-700 transition">
-                                    <td class="py-3 px-6 text-left font-medium text-gray-800 dark:text-gray-200">
-                                        <div x-text="test.name"></div>
-                                    </td>
-                                    <td class="py-3 px-6 text-left font-mono text-xs" x-text="formatDuration(test.stop - test.start)"></td>
-                                    <td class="py-3 px-6 text-center">
-                                         <span class="py-1 px-3 rounded-full text-xs font-bold uppercase"
-                                              :class="{{
-                                                'passed': 'bg-green-100 text-green-700 dark:bg-green-500/20 dark:text-green-400',
-                                                'failed': 'bg-red-100 text-red-700 dark:bg-red-500/20 dark:text-red-400',
-                                                'broken': 'bg-red-100 text-red-700 dark:bg-red-500/20 dark:text-red-400',
-                                                'skipped': 'bg-gray-100 text-gray-600 dark:bg-gray-700 dark:text-gray-400'
-                                              }}[test.status]" 
-                                              x-text="test.status"></span>
-                                    </td>
-                                    <td class="py-3 px-6 text-center">
-                                        <button 
-                                            @click="openModal(test)"
-                                            class="px-3 py-1.5 rounded-md text-xs font-semibold text-white shadow-sm transition-all focus:outline-none"
-                                            :class="['passed', 'skipped'].includes(test.status) ? 'bg-gray-300 dark:bg-gray-700 cursor-not-allowed opacity-50' : 'bg-blue-600 hover:bg-blue-700 hover:shadow-md'"
-                                            :disabled="['passed', 'skipped'].includes(test.status)">
-                                            View
-                                        </button>
-                                    </td>
-                                </tr>
-                            </template>
-                        </tbody>
-                    </table>
-                </div>
 
-                <!-- Mobile View: Cards -->
-                <div class="md:hidden grid grid-cols-1 gap-4">
-                    <template x-for="test in filteredTests" :key="'card-' + test.uuid">
-                        <div class="bg-gray-50 dark:bg-gray-700 p-4 rounded-lg shadow-sm border border-gray-200 dark:border-gray-600 flex flex-col space-y-3">
-                            <div class="flex justify-between items-start gap-3">
-                                <h3 class="font-bold text-gray-800 dark:text-white text-sm leading-tight break-all flex-1 min-w-0" x-text="test.name"></h3>
-                                <div class="shrink-0">
-                                    <span class="py-1 px-2 rounded text-[10px] font-bold uppercase tracking-wide whitespace-nowrap block"
-                                        :class="{{
-                                            'passed': 'bg-green-100 text-green-700 dark:bg-green-500/20 dark:text-green-300',
-                                            'failed': 'bg-red-100 text-red-700 dark:bg-red-500/20 dark:text-red-300',
-                                            'broken': 'bg-red-100 text-red-700 dark:bg-red-500/20 dark:text-red-300',
-                                            'skipped': 'bg-gray-100 text-gray-600 dark:bg-gray-600 dark:text-gray-300'
-                                        }}[test.status]" 
-                                        x-text="test.status"></span>
-                                </div>
-                            </div>
-                            <div class="flex items-center justify-between text-xs text-gray-500 dark:text-gray-300 pt-2 border-t dark:border-gray-600">
-                                <span class="bg-gray-200 dark:bg-gray-600 px-2 py-1 rounded font-mono" x-text="formatDuration(test.stop - test.start)"></span>
-                                <div>
-                                    <button 
-                                        @click="openModal(test)"
-                                        class="text-blue-500 hover:text-blue-400 font-bold uppercase tracking-wide text-xs"
-                                        :class="['passed', 'skipped'].includes(test.status) ? 'hidden' : ''">
-                                        View Details &rarr;
-                                    </button>
-                                </div>
-                            </div>
-                        </div>
-                    </template>
+                <!-- One virtualized list for desktop and mobile: only the rows in view exist -->
+                <div class="grid grid-cols-[1fr_6rem_4.5rem] md:grid-cols-[1fr_8rem_8rem_7rem] items-center px-3 md:px-6 py-3 text-gray-500 dark:text-gray-400 uppercase text-xs leading-normal border-b dark:border-gray-700">
+                    <div class="text-left">Test Name</div>
+                    <div class="hidden md:block text-left">Duration</div>
+                    <div class="text-center">Status</div>
+                    <div class="text-center">Actions</div>
+                </div>
+                <div id="viewport" class="relative overflow-y-auto max-h-[70vh] text-gray-600 dark:text-gray-300 text-sm font-light">
+                    <div id="spacer"></div>
+                    <div id="rows" class="absolute top-0 left-0 right-0"></div>
                 </div>
                 
-                 <div x-show="filteredTests.length === 0" class="text-center py-6 text-gray-500">No records found.</div>
+                 <div id="empty" hidden class="text-center py-6 text-gray-500">No records found.</div>
             </div>
         </main>
 
@@ -254,92 +471,571 @@ def generate():
         </footer>
         
         <!-- Details Modal -->
-        <div x-show="activeTest" class="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-[60]" x-cloak 
-             x-transition:enter="transition ease-out duration-200"
-             x-transition:enter-start="opacity-0"
-             x-transition:enter-end="opacity-100">
-             
-            <div @click.away="closeModal()" class="bg-white dark:bg-gray-800 rounded-lg shadow-xl p-4 md:p-6 w-11/12 max-w-2xl transform transition-all scale-100 my-4 max-h-[90vh] flex flex-col">
+        <div id="modal" hidden class="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-[60]">
+            <div id="modal-box" class="bg-white dark:bg-gray-800 rounded-lg shadow-xl p-4 md:p-6 w-11/12 max-w-2xl transform transition-all scale-100 my-4 max-h-[90vh] flex flex-col">
                  <div class="flex justify-between items-start mb-4 border-b dark:border-gray-700 pb-4 shrink-0">
-                     <h3 class="text-lg md:text-xl font-bold text-gray-900 dark:text-white break-words pr-4" x-text="activeTest?.name"></h3>
-                     <button @click="closeModal()" class="text-gray-500 hover:text-gray-300 focus:outline-none shrink-0"><i class="fas fa-times text-xl"></i></button>
+                     <h3 id="modal-title" class="text-lg md:text-xl font-bold text-gray-900 dark:text-white break-words pr-4"></h3>
+                     <button data-close class="text-gray-500 hover:text-gray-300 focus:outline-none shrink-0">{icon("fa-times", "text-xl", self_contained)}</button>
                  </div>
                  
                  <div class="space-y-4 overflow-y-auto pr-2 grow">
-                     <template x-if="activeTest && ['failed', 'broken'].includes(activeTest.status)">
-                         <div>
-                            <h4 class="text-red-500 font-bold text-sm mb-2 uppercase tracking-wide">Error Message</h4>
-                            <div class="bg-red-50 dark:bg-red-900/20 border border-red-100 dark:border-red-900/30 p-4 rounded-lg text-red-600 dark:text-red-400 font-mono text-xs whitespace-pre-wrap break-all" x-text="activeTest.statusDetails?.message"></div>
-                            <template x-if="activeTest.statusDetails?.trace">
-                                <div class="mt-4">
-                                     <h4 class="text-gray-500 dark:text-gray-400 font-bold text-sm mb-2 uppercase tracking-wide">Stack Trace</h4>
-                                     <div class="bg-gray-100 dark:bg-gray-900 p-4 rounded-lg border dark:border-gray-700 font-mono text-[10px] text-gray-600 dark:text-gray-400 overflow-y-auto max-h-60 whitespace-pre-wrap break-all" x-text="activeTest.statusDetails?.trace"></div>
-                                </div>
-                            </template>
-                         </div>
-                     </template>
+                     <div>
+                        <h4 class="text-red-500 font-bold text-sm mb-2 uppercase tracking-wide">Error Message</h4>
+                        <div id="modal-message" class="bg-red-50 dark:bg-red-900/20 border border-red-100 dark:border-red-900/30 p-4 rounded-lg text-red-600 dark:text-red-400 font-mono text-xs whitespace-pre-wrap break-all"></div>
+                        <div id="modal-trace-block" hidden class="mt-4">
+                             <h4 class="text-gray-500 dark:text-gray-400 font-bold text-sm mb-2 uppercase tracking-wide">Stack Trace</h4>
+                             <div id="modal-trace" class="bg-gray-100 dark:bg-gray-900 p-4 rounded-lg border dark:border-gray-700 font-mono text-[10px] text-gray-600 dark:text-gray-400 overflow-y-auto max-h-60 whitespace-pre-wrap break-all"></div>
+                        </div>
+                        <div id="modal-browser-traces-block" hidden class="mt-4">
+                             <h4 class="text-gray-500 dark:text-gray-400 font-bold text-sm mb-2 uppercase tracking-wide">Browser Traces</h4>
+                             <p class="text-xs text-gray-500 dark:text-gray-400 mb-2">Load in Chrome DevTools &rarr; Performance &rarr; Load profile.</p>
+                             <div id="modal-browser-traces" class="flex flex-col gap-2 font-mono text-xs"></div>
+                        </div>
+                     </div>
                  </div>
                  <div class="mt-6 flex justify-end shrink-0">
-                     <button @click="closeModal()" class="px-4 py-2 rounded-lg bg-gray-600 hover:bg-gray-700 text-white font-medium shadow-md transition-colors text-sm">Close</button>
+                     <button data-close class="px-4 py-2 rounded-lg bg-gray-600 hover:bg-gray-700 text-white font-medium shadow-md transition-colors text-sm">Close</button>
                  </div>
             </div>
         </div>
 
-        <script>
-            // Vue/Alpine logic for the dashboard
-            function app() {{
-                return {{
-                    tests: {json.dumps(results)},
-                    filter: 'all',
-                    activeTest: null,
-                    
-                    // Calculate statistics
-                    get stats() {{
-                        const total = this.tests.length;
-                        const passed = this.tests.filter(t => t.status === 'passed').length;
-                        const failed = this.tests.filter(t => [ 'failed', 'broken' ].includes(t.status)).length;
-                        return {{ total, passed, failed }};
-                    }},
-                    
-                    // Calculate pass rate percentage
-                    get passRate() {{
-                         if (this.stats.total === 0) return 0;
-                         return Math.round((this.stats.passed / this.stats.total) * 100);
-                    }},
-
-                    // Filter tests based on status
-                    get filteredTests() {{
-                        return this.tests.filter(t => {{
-                            const isFailed = ['failed', 'broken'].includes(t.status);
-                            return this.filter === 'all' || (this.filter === 'failed' && isFailed);
-                        }});
-                    }},
-                    
-                    // Open modal details
-                    openModal(test) {{
-                        if (['passed', 'skipped'].includes(test.status)) return;
-                        this.activeTest = test;
-                    }},
-                    
-                    closeModal() {{
-                        this.activeTest = null;
-                    }},
-                    
-                    // Format duration nicely
-                    formatDuration(ms) {{
-                        if (ms < 1000) return ms + 'ms';
-                        return (ms / 1000).toFixed(2) + 's';
-                    }}
-                }}
-            }}
-        </script>
+        {inline_details}
+        <script>window.REPORT = {script_json(report_data)};</script>
+        <script>{APP_SCRIPT}</script>
     </body>
     </html>
     """
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write(html)
-    print(f"Generated: {OUTPUT_FILE}")
+
+
+# tests that got significantly slower across the latest runs
+def regressions_section(regressions):
+    if regressions is None:
+        return ""
+    if not regressions:
+        rows = '<p class="text-sm text-gray-500">No significant duration regressions across the latest runs.</p>'
+    else:
+        rows = "".join(
+            f"""
+                    <div class="grid grid-cols-[1fr_6rem_4.5rem] md:grid-cols-[1fr_8rem_8rem_7rem] items-center py-3 border-b border-gray-200 dark:border-gray-700 text-sm">
+                        <div class="truncate font-medium text-gray-800 dark:text-gray-200" title="{escape(row['nodeid'])}">{escape(row['nodeid'])}</div>
+                        <div class="hidden md:block font-mono text-xs">{row['base_p50']}s &rarr; {row['head_p50']}s</div>
+                        <div class="text-center font-bold text-red-500">+{row['change']}%</div>
+                        <div class="text-center font-mono text-xs">p={row['p_value']}</div>
+                    </div>"""
+            for row in regressions
+        )
+    return f"""<!-- Duration Regressions -->
+            <div class="bg-white dark:bg-gray-800 rounded-xl shadow-lg p-6 mb-10">
+                <h2 class="text-xl font-bold text-gray-800 dark:text-gray-200 mb-4">Duration Regressions</h2>
+                {rows}
+            </div>"""
+
+
+# where page-object time goes (written by pytest --step-timing)
+def step_timings_section(step_timings):
+    if not step_timings:
+        return ""
+    rows = [
+        [row["method"], row["count"], f"{row['p50']}s", f"{row['p95']}s", f"{row['max']}s"]
+        for row in step_timings
+    ]
+    return metric_table("Page-Object Step Timings", ["Method", "Calls", "p50", "p95", "Max"], rows)
+
+
+# browser timings and web vitals per page and per SPA action (written by pytest --page-metrics)
+def page_metrics_section(page_metrics):
+    if not page_metrics or not (page_metrics["pages"] or page_metrics["actions"]):
+        return ""
+
+    def ms(stats, key="p50"):
+        return f"{stats[key]}ms" if stats else "-"
+
+    pages = [
+        [row["page"], row["count"], ms(row["firstContentfulPaint"]), ms(row["load"]), ms(row["load"], "p95")]
+        for row in page_metrics["pages"]
+    ]
+    actions = [
+        [row["action"], row["count"], row["requests"]["p50"] if row["requests"] else "-",
+         ms(row["elapsed"]), ms(row["elapsed"], "p95")]
+        for row in page_metrics["actions"]
+    ]
+    # p75, the percentile the web vitals thresholds are defined on
+    vitals = [
+        [row["page"], row["count"], ms(row.get("lcp"), "p75"),
+         row["cls"]["p75"] if row.get("cls") else "-", ms(row.get("inp"), "p75")]
+        for row in page_metrics["pages"]
+        if row.get("lcp") or row.get("cls") or row.get("inp")
+    ]
+    sections = []
+    if pages:
+        sections.append(metric_table("Page Loads", ["Page", "Loads", "FCP p50", "Load p50", "Load p95"], pages))
+    if vitals:
+        sections.append(metric_table("Web Vitals", ["Page", "Loads", "LCP p75", "CLS p75", "INP p75"], vitals))
+    if actions:
+        sections.append(metric_table("Page Actions", ["Action", "Runs", "Requests", "p50", "p95"], actions))
+    return "\n\n            ".join(sections)
+
+
+# five-column table card; the 3rd and 5th columns are hidden on small screens
+def metric_table(title, headers, rows):
+    columns = "grid grid-cols-[1fr_4rem_5rem] md:grid-cols-[1fr_5rem_6rem_6rem_6rem] items-center"
+    visibility = ["", "", "hidden md:block ", "", "hidden md:block "]
+    header = "".join(
+        f'<div class="{visibility[index]}{"text-left" if index == 0 else "text-center"}">{escape(text)}</div>'
+        for index, text in enumerate(headers)
+    )
+    body = "".join(
+        f"""
+                    <div class="{columns} py-3 border-b border-gray-200 dark:border-gray-700 text-sm">
+                        <div class="truncate font-medium text-gray-800 dark:text-gray-200" title="{escape(str(row[0]))}">{escape(str(row[0]))}</div>
+                        """
+        + "".join(
+            f'<div class="{visibility[index]}text-center font-mono text-xs">{escape(str(value))}</div>'
+            for index, value in enumerate(row[1:], start=1)
+        )
+        + """
+                    </div>"""
+        for row in rows
+    )
+    return f"""<!-- {title} -->
+            <div class="bg-white dark:bg-gray-800 rounded-xl shadow-lg p-6 mb-10">
+                <h2 class="text-xl font-bold text-gray-800 dark:text-gray-200 mb-4">{escape(title)}</h2>
+                <div class="{columns} pb-4 text-gray-500 dark:text-gray-400 uppercase text-xs border-b dark:border-gray-700">
+                    {header}
+                </div>
+                {body}
+            </div>"""
+
+
+# list rendering, search, filters and the details modal
+APP_SCRIPT = """
+(function () {
+    const report = window.REPORT;
+    const tests = report.tests;            // [name, status, duration ms, details chunk]
+    const index = report.index;
+    const ROW_HEIGHT = report.rowHeight;
+    const OVERSCAN = 10;
+
+    const STATUS_CLASSES = {
+        passed: 'bg-green-100 text-green-700 dark:bg-green-500/20 dark:text-green-400',
+        failed: 'bg-red-100 text-red-700 dark:bg-red-500/20 dark:text-red-400',
+        broken: 'bg-red-100 text-red-700 dark:bg-red-500/20 dark:text-red-400',
+        skipped: 'bg-gray-100 text-gray-600 dark:bg-gray-700 dark:text-gray-400'
+    };
+    const BUTTON_ON = 'bg-blue-600 hover:bg-blue-700 hover:shadow-md';
+    const BUTTON_OFF = 'bg-gray-300 dark:bg-gray-700 cursor-not-allowed opacity-50';
+
+    const viewport = document.getElementById('viewport');
+    const spacer = document.getElementById('spacer');
+    const rows = document.getElementById('rows');
+
+    let filter = 'all';
+    let matches = null;                    // Set of positions, null = no search
+    let visible = [];
+    let frame = 0;
+
+    // Format duration nicely
+    function formatDuration(ms) {
+        if (ms < 1000) return ms + 'ms';
+        return (ms / 1000).toFixed(2) + 's';
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' })[c]);
+    }
+
+    function isFailed(test) {
+        return test[1] === 'failed' || test[1] === 'broken';
+    }
+
+    // first token >= word
+    function lowerBound(tokens, word) {
+        let low = 0, high = tokens.length;
+        while (low < high) {
+            const middle = (low + high) >> 1;
+            if (tokens[middle] < word) low = middle + 1; else high = middle;
+        }
+        return low;
+    }
+
+    // tests whose name has a token starting with every word of the query
+    function search(query) {
+        const words = query.toLowerCase().match(/[a-z0-9]+/g);
+        if (!words) return null;
+        let result = null;
+        for (const word of words) {
+            const hits = new Set();
+            for (let i = lowerBound(index.tokens, word); i < index.tokens.length && index.tokens[i].startsWith(word); i++) {
+                for (const position of index.postings[i]) {
+                    if (result === null || result.has(position)) hits.add(position);
+                }
+            }
+            result = hits;
+            if (result.size === 0) break;
+        }
+        return result;
+    }
+
+    function update() {
+        visible = [];
+        for (let position = 0; position < tests.length; position++) {
+            if (filter === 'failed' && !isFailed(tests[position])) continue;
+            if (matches !== null && !matches.has(position)) continue;
+            visible.push(position);
+        }
+        spacer.style.height = (visible.length * ROW_HEIGHT) + 'px';
+        document.getElementById('empty').hidden = visible.length > 0;
+        viewport.hidden = visible.length === 0;
+        viewport.scrollTop = 0;
+        render();
+    }
+
+    function rowHtml(position) {
+        const test = tests[position];
+        const canOpen = isFailed(test);
+        return '<div class="grid grid-cols-[1fr_6rem_4.5rem] md:grid-cols-[1fr_8rem_8rem_7rem] items-center h-14 px-3 md:px-6 border-b border-gray-200 dark:border-gray-700 hover:bg-gray-50 dark:hover:bg-gray-700 transition">'
+            + '<div class="truncate font-medium text-gray-800 dark:text-gray-200" title="' + escapeHtml(test[0]) + '">' + escapeHtml(test[0]) + '</div>'
+            + '<div class="hidden md:block font-mono text-xs">' + formatDuration(test[2]) + '</div>'
+            + '<div class="text-center"><span class="py-1 px-3 rounded-full text-xs font-bold uppercase ' + STATUS_CLASSES[test[1]] + '">' + escapeHtml(test[1]) + '</span></div>'
+            + '<div class="text-center"><button data-open="' + position + '" class="px-3 py-1.5 rounded-md text-xs font-semibold text-white shadow-sm transition-all focus:outline-none '
+            + (canOpen ? BUTTON_ON : BUTTON_OFF) + '"' + (canOpen ? '' : ' disabled') + '>View</button></div>'
+            + '</div>';
+    }
+
+    // only the rows in view (plus a margin) are in the DOM
+    function render() {
+        frame = 0;
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const count = Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN;
+        rows.style.transform = 'translateY(' + (first * ROW_HEIGHT) + 'px)';
+        rows.innerHTML = visible.slice(first, first + count).map(rowHtml).join('');
+    }
+
+    function setFilter(value) {
+        filter = value;
+        for (const button of document.querySelectorAll('.filter-button')) {
+            const active = button.dataset.filter === filter;
+            button.classList.toggle('font-bold', active);
+            button.classList.toggle('text-red-500', active && filter === 'failed');
+            button.classList.toggle('text-eco-dark', active && filter === 'all');
+            button.classList.toggle('dark:text-eco', active && filter === 'all');
+            button.classList.toggle('text-gray-500', !active);
+            button.classList.toggle('hover:text-gray-300', !active);
+        }
+        update();
+    }
+
+    // ------- details, fetched per chunk on first use -------
+    const chunks = {};
+    const waiting = {};
+
+    window.reportDetails = function (number, details) {
+        chunks[number] = details;
+        (waiting[number] || []).forEach(callback => callback(details));
+        delete waiting[number];
+    };
+
+    function loadChunk(number, callback) {
+        if (chunks[number]) return callback(chunks[number]);
+        if (waiting[number]) return waiting[number].push(callback);
+        const inline = document.getElementById('report-details-' + number);
+        if (inline) {
+            chunks[number] = JSON.parse(inline.textContent);
+            return callback(chunks[number]);
+        }
+        waiting[number] = [callback];
+        const script = document.createElement('script');
+        script.src = report.dataDir + '/details-' + number + '.js';
+        script.onerror = () => window.reportDetails(number, {});
+        document.head.appendChild(script);
+    }
+
+    let activePosition = null;
+
+    function showDetails(details) {
+        document.getElementById('modal-message').textContent = (details && details.message) || 'No details recorded.';
+        const trace = details && details.trace;
+        document.getElementById('modal-trace-block').hidden = !trace;
+        document.getElementById('modal-trace').textContent = trace || '';
+
+        const traces = (details && details.browserTraces) || [];
+        const list = document.getElementById('modal-browser-traces');
+        list.replaceChildren(...traces.map(([label, source]) => {
+            const link = document.createElement('a');
+            link.href = report.resultsDir + '/' + source;
+            link.download = source;
+            link.textContent = label;
+            link.className = 'text-eco-dark dark:text-eco underline break-all';
+            return link;
+        }));
+        document.getElementById('modal-browser-traces-block').hidden = !traces.length;
+    }
+
+    // Open modal details
+    function openModal(position) {
+        const test = tests[position];
+        if (!isFailed(test)) return;
+        activePosition = position;
+        document.getElementById('modal-title').textContent = test[0];
+        document.getElementById('modal').hidden = false;
+        if (test[3] < 0) return showDetails(null);
+        document.getElementById('modal-message').textContent = 'Loading...';
+        document.getElementById('modal-trace-block').hidden = true;
+        document.getElementById('modal-browser-traces-block').hidden = true;
+        loadChunk(test[3], details => {
+            if (activePosition === position) showDetails(details[position]);
+        });
+    }
+
+    function closeModal() {
+        activePosition = null;
+        document.getElementById('modal').hidden = true;
+    }
+
+    viewport.addEventListener('scroll', () => {
+        if (!frame) frame = requestAnimationFrame(render);
+    }, { passive: true });
+    window.addEventListener('resize', render);
+    rows.addEventListener('click', event => {
+        const button = event.target.closest('[data-open]');
+        if (button) openModal(Number(button.dataset.open));
+    });
+    for (const button of document.querySelectorAll('.filter-button')) {
+        button.addEventListener('click', () => setFilter(button.dataset.filter));
+    }
+    document.getElementById('search').addEventListener('input', event => {
+        matches = search(event.target.value);
+        update();
+    });
+    document.getElementById('modal').addEventListener('click', event => {
+        if (event.target.closest('[data-close]') || !event.target.closest('#modal-box')) closeModal();
+    });
+    document.addEventListener('keydown', event => {
+        if (event.key === 'Escape') closeModal();
+    });
+
+    setFilter('all');
+})();
+"""
+
+
+# ------------------------
+#  SELF-CONTAINED MODE
+# ------------------------
+
+# the Tailwind utilities the template and APP_SCRIPT use, compiled ahead of
+# time (Tailwind 3 values, dark mode by class) so the report needs no network
+OFFLINE_CSS = r"""
+*,::before,::after{box-sizing:border-box;border:0 solid #e5e7eb}
+html{line-height:1.5;-webkit-text-size-adjust:100%}
+body{margin:0;line-height:inherit}
+h1,h2,h3,h4,p{margin:0;font-size:inherit;font-weight:inherit}
+button,input{font-family:inherit;font-size:100%;line-height:inherit;color:inherit;margin:0;padding:0}
+button{background-color:transparent;background-image:none;cursor:pointer;text-transform:none}
+button:disabled{cursor:default}
+input::placeholder{color:#9ca3af}
+img,svg{display:block;vertical-align:middle}
+img{max-width:100%;height:auto}
+.icon{width:1em;height:1em;display:inline-block}
+.font-sans{font-family:'Poppins',system-ui,-apple-system,'Segoe UI',Roboto,'Helvetica Neue',Arial,sans-serif}
+.font-mono{font-family:ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,'Liberation Mono','Courier New',monospace}
+
+.block{display:block}.flex{display:flex}.grid{display:grid}.hidden{display:none}
+.relative{position:relative}.absolute{position:absolute}.fixed{position:fixed}
+.inset-0{top:0;right:0;bottom:0;left:0}.top-0{top:0}.left-0{left:0}.right-0{right:0}
+.z-\[60\]{z-index:60}
+.flex-col{flex-direction:column}.flex-1{flex:1 1 0%}.grow{flex-grow:1}.shrink-0{flex-shrink:0}
+.items-center{align-items:center}.items-start{align-items:flex-start}
+.justify-between{justify-content:space-between}.justify-center{justify-content:center}.justify-end{justify-content:flex-end}
+.grid-cols-1{grid-template-columns:repeat(1,minmax(0,1fr))}
+.grid-cols-\[1fr_6rem_4\.5rem\]{grid-template-columns:1fr 6rem 4.5rem}
+.grid-cols-\[1fr_4rem_5rem\]{grid-template-columns:1fr 4rem 5rem}
+.gap-2{gap:.5rem}.gap-3{gap:.75rem}.gap-4{gap:1rem}
+.space-x-6>:not([hidden])~:not([hidden]){margin-left:1.5rem}
+.space-y-4>:not([hidden])~:not([hidden]){margin-top:1rem}
+
+.w-full{width:100%}.w-11\/12{width:91.666667%}.h-14{height:3.5rem}.h-16{height:4rem}.min-h-screen{min-height:100vh}
+.max-w-2xl{max-width:42rem}.max-w-7xl{max-width:80rem}
+.max-h-60{max-height:15rem}.max-h-\[70vh\]{max-height:70vh}.max-h-\[90vh\]{max-height:90vh}
+.overflow-y-auto{overflow-y:auto}
+.truncate{overflow:hidden;text-overflow:ellipsis;white-space:nowrap}
+.whitespace-pre-wrap{white-space:pre-wrap}.break-words{overflow-wrap:break-word}.break-all{word-break:break-all}
+
+.p-3{padding:.75rem}.p-4{padding:1rem}.p-6{padding:1.5rem}
+.px-3{padding-left:.75rem;padding-right:.75rem}.px-4{padding-left:1rem;padding-right:1rem}.px-6{padding-left:1.5rem;padding-right:1.5rem}
+.py-1{padding-top:.25rem;padding-bottom:.25rem}.py-1\.5{padding-top:.375rem;padding-bottom:.375rem}
+.py-2{padding-top:.5rem;padding-bottom:.5rem}.py-3{padding-top:.75rem;padding-bottom:.75rem}
+.py-4{padding-top:1rem;padding-bottom:1rem}.py-6{padding-top:1.5rem;padding-bottom:1.5rem}.py-8{padding-top:2rem;padding-bottom:2rem}
+.pb-4{padding-bottom:1rem}.pr-2{padding-right:.5rem}.pr-4{padding-right:1rem}
+.mx-auto{margin-left:auto;margin-right:auto}.my-4{margin-top:1rem;margin-bottom:1rem}
+.mt-1{margin-top:.25rem}.mt-2{margin-top:.5rem}.mt-4{margin-top:1rem}.mt-6{margin-top:1.5rem}
+.mb-1{margin-bottom:.25rem}.mb-2{margin-bottom:.5rem}.mb-4{margin-bottom:1rem}.mb-6{margin-bottom:1.5rem}
+.mb-8{margin-bottom:2rem}.mb-10{margin-bottom:2.5rem}
+
+.text-\[10px\]{font-size:10px}.text-xs{font-size:.75rem;line-height:1rem}.text-sm{font-size:.875rem;line-height:1.25rem}
+.text-lg{font-size:1.125rem;line-height:1.75rem}.text-xl{font-size:1.25rem;line-height:1.75rem}
+.text-2xl{font-size:1.5rem;line-height:2rem}.text-3xl{font-size:1.875rem;line-height:2.25rem}
+.font-light{font-weight:300}.font-medium{font-weight:500}.font-semibold{font-weight:600}.font-bold{font-weight:700}
+.leading-normal{line-height:1.5}.tracking-wide{letter-spacing:.025em}.uppercase{text-transform:uppercase}
+.text-left{text-align:left}.text-center{text-align:center}.underline{text-decoration-line:underline}
+
+.text-white{color:#fff}.text-\[\#2B2B2B\]{color:#2b2b2b}.text-eco-dark{color:#2b88ba}
+.text-gray-400{color:#9ca3af}.text-gray-500{color:#6b7280}.text-gray-600{color:#4b5563}
+.text-gray-800{color:#1f2937}.text-gray-900{color:#111827}
+.text-blue-100{color:#dbeafe}.text-green-100{color:#dcfce7}.text-green-700{color:#15803d}.text-purple-100{color:#f3e8ff}
+.text-red-100{color:#fee2e2}.text-red-500{color:#ef4444}.text-red-600{color:#dc2626}.text-red-700{color:#b91c1c}
+
+.bg-white{background-color:#fff}.bg-black{background-color:#000}
+.bg-white.bg-opacity-20{background-color:rgb(255 255 255/.2)}.bg-black.bg-opacity-50{background-color:rgb(0 0 0/.5)}
+.bg-\[\#F5F6F8\]{background-color:#f5f6f8}.bg-eco-light{background-color:#e3f2fd}
+.bg-gray-100{background-color:#f3f4f6}.bg-gray-300{background-color:#d1d5db}.bg-gray-600{background-color:#4b5563}
+.bg-blue-600{background-color:#2563eb}.bg-green-100{background-color:#dcfce7}
+.bg-red-50{background-color:#fef2f2}.bg-red-100{background-color:#fee2e2}.bg-red-500{background-color:#ef4444}
+
+.border{border-width:1px}.border-b{border-bottom-width:1px}
+.border-gray-200{border-color:#e5e7eb}.border-red-100{border-color:#fee2e2}
+.rounded-md{border-radius:.375rem}.rounded-lg{border-radius:.5rem}.rounded-xl{border-radius:.75rem}.rounded-full{border-radius:9999px}
+.shadow-sm{box-shadow:0 1px 2px 0 rgb(0 0 0/.05)}
+.shadow-md{box-shadow:0 4px 6px -1px rgb(0 0 0/.1),0 2px 4px -2px rgb(0 0 0/.1)}
+.shadow-lg{box-shadow:0 10px 15px -3px rgb(0 0 0/.1),0 4px 6px -4px rgb(0 0 0/.1)}
+.shadow-xl{box-shadow:0 20px 25px -5px rgb(0 0 0/.1),0 8px 10px -6px rgb(0 0 0/.1)}
+.opacity-50{opacity:.5}.cursor-not-allowed{cursor:not-allowed}
+.focus\:outline-none:focus{outline:2px solid transparent;outline-offset:2px}
+
+.transition{transition-property:color,background-color,border-color,opacity,box-shadow,transform;transition-timing-function:cubic-bezier(.4,0,.2,1);transition-duration:150ms}
+.transition-all{transition-property:all;transition-timing-function:cubic-bezier(.4,0,.2,1);transition-duration:150ms}
+.transition-colors{transition-property:color,background-color,border-color;transition-timing-function:cubic-bezier(.4,0,.2,1);transition-duration:150ms}
+.duration-300{transition-duration:300ms}
+
+.hover\:bg-gray-50:hover{background-color:#f9fafb}.hover\:bg-gray-700:hover{background-color:#374151}
+.hover\:bg-blue-700:hover{background-color:#1d4ed8}.hover\:text-gray-300:hover{color:#d1d5db}
+.hover\:shadow-md:hover{box-shadow:0 4px 6px -1px rgb(0 0 0/.1),0 2px 4px -2px rgb(0 0 0/.1)}
+.hover\:shadow-xl:hover{box-shadow:0 20px 25px -5px rgb(0 0 0/.1),0 8px 10px -6px rgb(0 0 0/.1)}
+.hover\:-translate-y-1:hover{transform:translateY(-.25rem)}
+
+.dark .dark\:block{display:block}.dark .dark\:hidden{display:none}
+.dark .dark\:text-white{color:#fff}.dark .dark\:text-eco{color:#a6e3ff}
+.dark .dark\:text-gray-200{color:#e5e7eb}.dark .dark\:text-gray-300{color:#d1d5db}.dark .dark\:text-gray-400{color:#9ca3af}
+.dark .dark\:text-green-400{color:#4ade80}.dark .dark\:text-red-400{color:#f87171}
+.dark .dark\:bg-\[\#1E1E1E\]{background-color:#1e1e1e}.dark .dark\:bg-\[\#0F1A24\]{background-color:#0f1a24}
+.dark .dark\:bg-gray-700{background-color:#374151}.dark .dark\:bg-gray-800{background-color:#1f2937}.dark .dark\:bg-gray-900{background-color:#111827}
+.dark .dark\:bg-green-500\/20{background-color:rgb(34 197 94/.2)}.dark .dark\:bg-red-500\/20{background-color:rgb(239 68 68/.2)}
+.dark .dark\:bg-red-900\/20{background-color:rgb(127 29 29/.2)}
+.dark .dark\:border-gray-600{border-color:#4b5563}.dark .dark\:border-gray-700{border-color:#374151}
+.dark .dark\:border-red-900\/30{border-color:rgb(127 29 29/.3)}
+.dark .dark\:hover\:bg-gray-700:hover{background-color:#374151}
+
+@media (min-width:640px){.sm\:grid-cols-2{grid-template-columns:repeat(2,minmax(0,1fr))}}
+@media (min-width:768px){
+.md\:block{display:block}.md\:flex{display:flex}.md\:flex-row{flex-direction:row}
+.md\:items-center{align-items:center}.md\:justify-between{justify-content:space-between}
+.md\:grid-cols-3{grid-template-columns:repeat(3,minmax(0,1fr))}
+.md\:grid-cols-\[1fr_8rem_8rem_7rem\]{grid-template-columns:1fr 8rem 8rem 7rem}
+.md\:grid-cols-\[1fr_5rem_6rem_6rem_6rem\]{grid-template-columns:1fr 5rem 6rem 6rem 6rem}
+.md\:gap-6{gap:1.5rem}.md\:p-6{padding:1.5rem}.md\:px-6{padding-left:1.5rem;padding-right:1.5rem}
+.md\:px-10{padding-left:2.5rem;padding-right:2.5rem}.md\:text-xl{font-size:1.25rem;line-height:1.75rem}.md\:w-64{width:16rem}
+}
+@media (min-width:1280px){.xl\:grid-cols-4{grid-template-columns:repeat(4,minmax(0,1fr))}}
+"""
+
+# stand-ins for the Font Awesome icons (24px grid, drawn with currentColor)
+OFFLINE_ICONS = {
+    "fa-clipboard-list": '<rect x="5" y="4" width="14" height="17" rx="2"/><path d="M9 4h6v3H9zM9 11h6M9 15h6"/>',
+    "fa-check-circle": '<circle cx="12" cy="12" r="9"/><path d="M8 12.5l3 3 5-6"/>',
+    "fa-exclamation-triangle": '<path d="M12 3l10 18H2z"/><path d="M12 10v5M12 18v.5"/>',
+    "fa-chart-pie": '<path d="M12 3a9 9 0 1 0 9 9h-9z"/><path d="M15 3.5A9 9 0 0 1 20.5 9H15z"/>',
+    "fa-times": '<path d="M6 6l12 12M18 6L6 18"/>',
+}
+
+
+# Font Awesome tag, or an inline svg in self-contained mode
+def icon(name, size_class, self_contained):
+    if not self_contained:
+        return f'<i class="fas {name} {size_class}"></i>'
+    return (
+        f'<svg class="icon {size_class}" viewBox="0 0 24 24" fill="none" stroke="currentColor" '
+        f'stroke-width="2" stroke-linecap="round" stroke-linejoin="round" aria-hidden="true">'
+        f"{OFFLINE_ICONS[name]}</svg>"
+    )
+
+
+# logo path relative to tests/reports, or the image itself in self-contained mode
+def logo_source(filename, self_contained):
+    relative_path = f"../../public/images/{filename}"
+    if not self_contained:
+        return relative_path
+    try:
+        with open(os.path.join(base_dir, "public", "images", filename), "rb") as file:
+            return f"data:image/png;base64,{base64.b64encode(file.read()).decode('ascii')}"
+    except OSError:
+        return relative_path
+
+
+# ------------------------
+#  BENCHMARK
+# ------------------------
+
+# time a cold build, a warm build and a build after 1% new results on
+# `count` synthetic result files
+
+def benchmark(count=10000):
+    workdir = tempfile.mkdtemp(prefix="dashboard-bench-")
+    results_dir = os.path.join(workdir, "allure-results")
+    os.makedirs(results_dir)
+    try:
+        write_synthetic_results(results_dir, count)
+        output_file = os.path.join(workdir, "report.html")
+        index_file = os.path.join(workdir, "index.json")
+        # only the result files are timed, not the optional sections
+        no_extras = {"history_db": None, "step_timings_file": None, "page_metrics_file": None}
+
+        timings = {}
+        for label in ("cold", "warm"):
+            started = time.perf_counter()
+            generate(results_dir, output_file, index_file, **no_extras)
+            timings[label] = time.perf_counter() - started
+
+        write_synthetic_results(results_dir, max(1, count // 100), offset=count)
+        started = time.perf_counter()
+        generate(results_dir, output_file, index_file, **no_extras)
+        timings["+1%"] = time.perf_counter() - started
+
+        print(f"{count} results: " + ", ".join(f"{label} {seconds:.2f}s" for label, seconds in timings.items()))
+        return timings
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def write_synthetic_results(results_dir, count, offset=0):
+    statuses = ["passed"] * 8 + ["failed", "skipped"]
+    for number in range(offset, offset + count):
+        status = statuses[number % len(statuses)]
+        result = {
+            "uuid": str(uuid.UUID(int=number)),
+            "name": f"test_case_{number}",
+            "fullName": f"test_cases.test_bench.TestBench#test_case_{number}",
+            "status": status,
+            "start": 1700000000000 + number * 1000,
+            "stop": 1700000000000 + number * 1000 + 250 + number % 5000,
+            "statusDetails": {"message": "AssertionError", "trace": "Traceback\n" * 40} if status == "failed" else {},
+            "steps": [{"name": f"step {step}", "status": "passed"} for step in range(10)],
+            "labels": [{"name": "suite", "value": "TestBench"}],
+        }
+        with open(os.path.join(results_dir, f"{result['uuid']}-result.json"), "w", encoding="utf-8") as file:
+            json.dump(result, file)
 
 
 if __name__ == "__main__":
-    generate()
+    parser = argparse.ArgumentParser(description="Build tests/reports/report.html from the allure results")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="time the build on N synthetic results instead")
+    parser.add_argument(
+        "--self-contained",
+        action="store_true",
+        help="a single offline file: inline CSS, icons, logos and failure details, no CDN assets",
+    )
+    arguments = parser.parse_args()
+
+    if arguments.benchmark:
+        benchmark(arguments.benchmark)
+    else:
+        generate(self_contained=arguments.self_contained)
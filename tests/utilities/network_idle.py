@@ -0,0 +1,92 @@
+from selenium.common.exceptions import TimeoutException
+
+from tests.utilities.browser_scripts import add_init_script
+
+# how long the page must stay without requests before it counts as idle
+QUIET_MS = 300
+
+# wraps fetch and XMLHttpRequest so the page keeps a count of requests that
+# have not finished yet (supabase-js uses fetch for every query)
+TRACKER_SCRIPT = """
+(function () {
+    if (window.__networkTracker) return;
+    var tracker = window.__networkTracker = { pending: 0, lastActivity: Date.now() };
+
+    function started() {
+        tracker.pending += 1;
+        tracker.lastActivity = Date.now();
+    }
+    function finished() {
+        tracker.pending = Math.max(0, tracker.pending - 1);
+        tracker.lastActivity = Date.now();
+    }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            started();
+            try {
+                var request = originalFetch.apply(this, arguments);
+            } catch (error) {
+                finished();
+                throw error;
+            }
+            return request.then(
+                function (response) { finished(); return response; },
+                function (error) { finished(); throw error; }
+            );
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished, { once: true });
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (error) {
+            finished();
+            throw error;
+        }
+    };
+})();
+"""
+
+IDLE_SCRIPT = (
+    TRACKER_SCRIPT
+    + """
+var quietMs = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var tracker = window.__networkTracker;
+var started = Date.now();
+
+(function check() {
+    var now = Date.now();
+    if (tracker.pending === 0 && now - tracker.lastActivity >= quietMs) {
+        done(true);
+    } else if (now - started >= timeoutMs) {
+        done(false);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+)
+
+
+# 1: count requests from the very first script of every page
+
+def install_network_tracker(driver):
+    # without preload support the tracker is injected on the first wait and
+    # only sees requests that start after that point
+    return add_init_script(driver, TRACKER_SCRIPT)
+
+
+# 2: wait until no fetch/XHR request is outstanding
+
+def wait_for_network_idle(driver, quiet_ms=QUIET_MS, timeout=20):
+    idle = driver.execute_async_script(IDLE_SCRIPT, quiet_ms, int(timeout * 1000))
+    if not idle:
+        raise TimeoutException(f"Network did not become idle within {timeout}s")
+    return True
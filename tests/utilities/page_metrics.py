@@ -0,0 +1,365 @@
+import functools
+import json
+import os
+import time
+from urllib.parse import urlparse
+
+import allure
+
+from tests.utilities.artifacts import current_nodeid
+from tests.utilities.browser_scripts import add_init_script
+from tests.utilities.network_idle import wait_for_network_idle
+from tests.utilities.run_history import percentile
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# per-page and per-action summary of the last --page-metrics run
+PAGE_METRICS_FILE = os.path.join(base_dir, "tests", "reports", "page_metrics.json")
+
+# page-object methods that change the page without a navigation (SPA actions)
+ACTIONS = {
+    "tests.base_pages.search_page.SearchPage": ["enter_search_term"],
+    "tests.base_pages.filter_page.FilterPage": [
+        "select_status_filter",
+        "set_date_from",
+        "set_date_to",
+        "clear_date_from",
+        "clear_date_to",
+    ],
+    "tests.base_pages.update_status_page.UpdateStatusPage": ["click_edit_button", "click_update_button"],
+    "tests.base_pages.analytics_page.AnalyticsPage": ["click_month_filter", "click_reset_button"],
+}
+
+# the browser keeps 250 resource entries by default, the dashboards load more
+RESOURCE_BUFFER_SIZE = 2000
+
+# after an action, wait this long without requests before it counts as settled
+SETTLE_QUIET_MS = 100
+SETTLE_TIMEOUT = 10
+
+# core web vitals of the current document: LCP, CLS (largest session window)
+# and INP (worst interaction, ignoring one in fifty). Buffered observers, so
+# a copy injected after the page loaded still sees the earlier entries;
+# entry types the browser lacks (layout-shift on firefox) stay null
+VITALS_SCRIPT = """
+(function () {
+    if (window.__webVitals) return;
+    var vitals = window.__webVitals = { lcp: null, lcpElement: null, cls: null, interactions: null };
+
+    function observe(type, callback, options) {
+        try {
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                .observe(Object.assign({ type: type, buffered: true }, options || {}));
+            return true;
+        } catch (error) {
+            return false;
+        }
+    }
+
+    observe('largest-contentful-paint', function (entry) {
+        var element = entry.element;
+        vitals.lcp = Math.round(entry.renderTime || entry.loadTime || entry.startTime);
+        vitals.lcpElement = element ? element.tagName.toLowerCase() + (element.id ? '#' + element.id : '') : null;
+    });
+
+    // shifts less than 1 s apart and within 5 s form one session window
+    var session = { start: 0, last: 0, value: 0 };
+    if (observe('layout-shift', function (entry) {
+        if (entry.hadRecentInput) return;
+        if (!session.value || entry.startTime - session.last > 1000 || entry.startTime - session.start > 5000) {
+            session.start = entry.startTime;
+            session.value = 0;
+        }
+        session.value += entry.value;
+        session.last = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, session.value);
+    })) {
+        vitals.cls = 0;
+    }
+
+    // longest event of each interaction (click, key press, tap)
+    if (observe('event', function (entry) {
+        if (!entry.interactionId) return;
+        var known = vitals.interactions[entry.interactionId];
+        if (!known || entry.duration > known.duration) {
+            vitals.interactions[entry.interactionId] = {
+                start: entry.startTime, duration: Math.round(entry.duration), name: entry.name
+            };
+        }
+    }, { durationThreshold: 16 })) {
+        vitals.interactions = {};
+    }
+
+    vitals.snapshot = function (since) {
+        var inp = null;
+        var count = null;
+        if (vitals.interactions) {
+            var durations = Object.keys(vitals.interactions).map(function (id) {
+                return vitals.interactions[id];
+            }).filter(function (interaction) {
+                return interaction.start >= since;
+            }).map(function (interaction) {
+                return interaction.duration;
+            }).sort(function (a, b) { return b - a; });
+            count = durations.length;
+            inp = count ? durations[Math.min(count - 1, Math.floor(count / 50))] : null;
+        }
+        return {
+            url: location.href,
+            lcp: vitals.lcp,
+            lcpElement: vitals.lcpElement,
+            cls: vitals.cls === null ? null : Math.round(vitals.cls * 10000) / 10000,
+            inp: inp,
+            interactions: count
+        };
+    };
+})();
+"""
+
+# vitals of the page being left (or of the last page of a test)
+VITALS_SNAPSHOT_SCRIPT = VITALS_SCRIPT + "return window.__webVitals.snapshot(0);"
+
+# navigation, paint and resource timing since `since` (ms on the page clock);
+# waits (up to 2 s) for the load event to finish so loadEventEnd is set
+METRICS_SCRIPT = VITALS_SCRIPT + """
+var since = arguments[0];
+var done = arguments[arguments.length - 1];
+var started = Date.now();
+performance.setResourceTimingBufferSize(arguments[1]);
+
+function collect() {
+    var nav = performance.getEntriesByType('navigation')[0];
+    var paints = {};
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        paints[entry.name] = Math.round(entry.startTime);
+    });
+
+    var resources = performance.getEntriesByType('resource').filter(function (entry) {
+        return entry.startTime >= since;
+    });
+    var byType = {};
+    var bytes = 0;
+    resources.forEach(function (entry) {
+        byType[entry.initiatorType] = (byType[entry.initiatorType] || 0) + 1;
+        bytes += entry.transferSize || 0;
+    });
+    var slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; }).slice(0, 5)
+        .map(function (entry) {
+            return { name: entry.name, type: entry.initiatorType, duration: Math.round(entry.duration) };
+        });
+
+    done({
+        url: location.href,
+        now: performance.now(),
+        lastRequest: window.__networkTracker
+            ? Math.round(window.__networkTracker.lastActivity - performance.timeOrigin) : null,
+        navigation: since > 0 || !nav ? null : {
+            type: nav.type,
+            ttfb: Math.round(nav.responseStart - nav.startTime),
+            domContentLoaded: Math.round(nav.domContentLoadedEventEnd),
+            load: nav.loadEventEnd > 0 ? Math.round(nav.loadEventEnd) : null,
+            transferSize: nav.transferSize
+        },
+        paint: since > 0 ? null : {
+            firstPaint: paints['first-paint'],
+            firstContentfulPaint: paints['first-contentful-paint']
+        },
+        resources: { count: resources.length, transferSize: bytes, byType: byType, slowest: slowest },
+        vitals: window.__webVitals.snapshot(since)
+    });
+}
+
+(function check() {
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (since > 0 || !nav || nav.loadEventEnd > 0 || Date.now() - started > 2000) {
+        collect();
+    } else {
+        setTimeout(check, 25);
+    }
+})();
+"""
+
+# page clock before an action, so only the requests it caused are counted
+MARK_SCRIPT = "performance.setResourceTimingBufferSize(arguments[0]); return performance.now();"
+
+# everything measured in this process: one dict per page load or action
+metrics_log = []
+
+
+# 1: measure every driver.get of this browser; the vitals observers are
+#    preloaded into every document (injected on first measurement otherwise)
+
+def install_page_metrics(driver):
+    if getattr(driver, "page_metrics", False):
+        return driver
+    get = driver.get
+    add_init_script(driver, VITALS_SCRIPT)
+
+    def measured_get(url):
+        finish_page(driver)
+        started = time.perf_counter()
+        get(url)
+        driver.page_metrics_entry = record(driver, "load", page_name(url), 0, time.perf_counter() - started)
+
+    driver.get = measured_get
+    driver.page_metrics = True
+    driver.page_metrics_entry = None
+    return driver
+
+
+# CLS and INP keep growing while the page is used: the load entry gets the
+# final values when the browser leaves the page or the test ends
+
+def finish_page(driver):
+    entry = getattr(driver, "page_metrics_entry", None)
+    if entry is None:
+        return None
+    driver.page_metrics_entry = None
+    try:
+        vitals = driver.execute_script(VITALS_SNAPSHOT_SCRIPT)
+    except Exception:
+        return None
+    # a link or form already navigated away; keep what was seen at load
+    if vitals and vitals.pop("url") == entry["url"]:
+        entry["vitals"] = vitals
+    return entry
+
+
+# 2: measure the SPA actions listed in ACTIONS (once per process); `wrap`
+#    puts another wrapper (e.g. browser_trace.traced_action) around them
+
+def instrument_actions(wrap=None):
+    wrap = wrap or measured_action
+    for path, methods in ACTIONS.items():
+        module_name, class_name = path.rsplit(".", 1)
+        cls = getattr(__import__(module_name, fromlist=[class_name]), class_name)
+        for method in methods:
+            setattr(cls, method, wrap(f"{class_name}.{method}", getattr(cls, method)))
+
+
+def measured_action(name, function):
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        try:
+            mark = self.driver.execute_script(MARK_SCRIPT, RESOURCE_BUFFER_SIZE)
+        except Exception:
+            mark = None
+        started = time.perf_counter()
+        result = function(self, *args, **kwargs)
+        if mark is not None:
+            seconds = time.perf_counter() - started
+            # let the requests the action started finish (e.g. a status update's round trip)
+            try:
+                wait_for_network_idle(self.driver, SETTLE_QUIET_MS, SETTLE_TIMEOUT)
+            except Exception:
+                pass
+            record(self.driver, "action", name, mark, seconds)
+        return result
+
+    return wrapper
+
+
+def record(driver, kind, name, since, seconds):
+    try:
+        metrics = driver.execute_async_script(METRICS_SCRIPT, since, RESOURCE_BUFFER_SIZE)
+    except Exception:
+        # an alert, a closed window or a non-html page: nothing to measure
+        return None
+    if not metrics:
+        return None
+    metrics.update({"nodeid": current_nodeid(), "kind": kind, "name": name, "elapsed": round(seconds * 1000)})
+    metrics.pop("now", None)
+    # action start to the end of its last request, on the page clock
+    last_request = metrics.pop("lastRequest", None)
+    if kind == "action":
+        settled = round(last_request - since) if last_request and last_request > since else 0
+        metrics["settled"] = max(metrics["elapsed"], settled)
+    if metrics.get("vitals"):
+        metrics["vitals"].pop("url", None)
+    metrics_log.append(metrics)
+    return metrics
+
+
+def page_name(url):
+    return os.path.basename(urlparse(url).path) or urlparse(url).netloc
+
+
+# ------------------------
+#  REPORT
+# ------------------------
+
+# 1: this test's measurements as a json attachment
+
+def attach_test_metrics(nodeid):
+    entries = [entry for entry in metrics_log if entry["nodeid"] == nodeid]
+    if entries:
+        allure.attach(
+            json.dumps(entries, indent=1), name="page metrics", attachment_type=allure.attachment_type.JSON
+        )
+    return entries
+
+
+# 2: p50/p75/p95 per page and per action over the whole run (p75 is the
+#    percentile the web vitals thresholds are defined on)
+
+def metrics_summary(entries=None):
+    entries = metrics_log if entries is None else entries
+
+    def stats(values, digits=None):
+        values = [value for value in values if value is not None]
+        if not values:
+            return None
+        return {f"p{q}": round(percentile(values, q), digits) for q in (50, 75, 95)}
+
+    pages = {}
+    actions = {}
+    for entry in entries:
+        group = pages if entry["kind"] == "load" else actions
+        group.setdefault(entry["name"], []).append(entry)
+
+    page_rows = []
+    for name, loads in sorted(pages.items()):
+        navigations = [entry["navigation"] or {} for entry in loads]
+        paints = [entry["paint"] or {} for entry in loads]
+        vitals = [entry.get("vitals") or {} for entry in loads]
+        page_rows.append({
+            "page": name,
+            "count": len(loads),
+            "ttfb": stats(nav.get("ttfb") for nav in navigations),
+            "domContentLoaded": stats(nav.get("domContentLoaded") for nav in navigations),
+            "load": stats(nav.get("load") for nav in navigations),
+            "firstContentfulPaint": stats(paint.get("firstContentfulPaint") for paint in paints),
+            "requests": stats(entry["resources"]["count"] for entry in loads),
+            "transferKb": stats(entry["resources"]["transferSize"] / 1024 for entry in loads),
+            "lcp": stats(vital.get("lcp") for vital in vitals),
+            "cls": stats((vital.get("cls") for vital in vitals), 4),
+            "inp": stats(vital.get("inp") for vital in vitals),
+        })
+
+    action_rows = [
+        {
+            "action": name,
+            "count": len(runs),
+            "elapsed": stats(entry["elapsed"] for entry in runs),
+            "settled": stats(entry.get("settled") for entry in runs),
+            "requests": stats(entry["resources"]["count"] for entry in runs),
+            "inp": stats((entry.get("vitals") or {}).get("inp") for entry in runs),
+        }
+        for name, runs in sorted(actions.items())
+    ]
+    return {"pages": page_rows, "actions": action_rows}
+
+
+def write_summary(summary, path=PAGE_METRICS_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=1)
+    return path
+
+
+def read_summary(path=PAGE_METRICS_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
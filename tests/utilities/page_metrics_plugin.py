@@ -0,0 +1,106 @@
+import pytest
+
+from tests.utilities.page_metrics import (
+    attach_test_metrics,
+    finish_page,
+    instrument_actions,
+    metrics_log,
+    metrics_summary,
+    write_summary,
+)
+from tests.utilities.perf_budgets import PERF_BUDGETS_FILE, budget_table, check_budgets, load_budgets
+
+
+# page metrics (installed on every pooled browser by conftest's driver_pool),
+# the budgets checked on them and repeated runs for more samples
+def pytest_addoption(parser):
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        default=False,
+        help="Collect navigation, resource, paint and web vitals timing for every driver.get and page action",
+    )
+    parser.addoption(
+        "--perf-budgets",
+        action="store",
+        nargs="?",
+        const=PERF_BUDGETS_FILE,
+        default=None,
+        help="Fail the run when a page/action median exceeds its budget "
+        "(default file: configurations/perf_budgets.ini)",
+    )
+    parser.addoption(
+        "--perf-repeat",
+        action="store",
+        type=int,
+        default=1,
+        help="Run every test this many times, so budgets and history get several samples",
+    )
+
+
+def pytest_configure(config):
+    # budgets are checked on the page metrics
+    if config.getoption("--perf-budgets"):
+        config.option.page_metrics = True
+        if not hasattr(config, "workerinput"):
+            seed = config.getoption("--seed-complaints") if config.getoption("--backend") == "stub" else None
+            try:
+                config._perf_budgets = load_budgets(config.getoption("--perf-budgets"), seed)
+            except (OSError, ValueError) as error:
+                raise pytest.UsageError(str(error))
+    if config.getoption("--page-metrics"):
+        instrument_actions()
+
+
+# --perf-repeat K: every test K times ([perf1] ... [perfK])
+def pytest_generate_tests(metafunc):
+    repeat = metafunc.config.getoption("--perf-repeat")
+    if repeat > 1:
+        metafunc.fixturenames.append("perf_repeat")
+        metafunc.parametrize("perf_repeat", range(1, repeat + 1), ids=lambda number: f"perf{number}")
+
+
+# browser timings of the test (setup included) as allure attachments
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield
+    if item.config.getoption("--page-metrics"):
+        # final CLS/INP of the page the test ended on
+        finish_page(item.funcargs.get("setup"))
+        attach_test_metrics(item.nodeid)
+
+
+# page metrics of a finished xdist worker
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    metrics_log.extend(getattr(node, "workeroutput", {}).get("page_metrics", []))
+
+
+# the summary is kept on the config for the run history
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["page_metrics"] = metrics_log
+        return
+    config._page_summary = None
+    if config.getoption("--page-metrics"):
+        config._page_summary = metrics_summary()
+        write_summary(config._page_summary)
+    if hasattr(config, "_perf_budgets"):
+        config._perf_checks = check_budgets(config._page_summary, config._perf_budgets)
+        statuses = {check["status"] for check in config._perf_checks}
+        # no budget measured at all: the run selected none of the budgeted pages
+        if "over" in statuses or statuses == {"missing"}:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    checks = getattr(config, "_perf_checks", None)
+    if checks is None:
+        return
+    over = sum(check["status"] == "over" for check in checks)
+    terminalreporter.write_sep("-", f"performance budgets: {over} of {len(checks)} over")
+    if checks and all(check["status"] == "missing" for check in checks):
+        terminalreporter.write_line("no budgeted page or action was measured - check the test selection", red=True)
+    for line in budget_table(checks):
+        terminalreporter.write_line(line)
@@ -0,0 +1,109 @@
+import configparser
+import os
+import re
+
+from tests.utilities.dataset_generator import TIERS
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# committed budgets, checked by pytest --perf-budgets
+PERF_BUDGETS_FILE = os.path.join(base_dir, "tests", "configurations", "perf_budgets.ini")
+
+# metrics of page_metrics.metrics_summary that can have a budget, with units
+PAGE_METRICS = {
+    "ttfb": "ms",
+    "domContentLoaded": "ms",
+    "load": "ms",
+    "firstContentfulPaint": "ms",
+    "lcp": "ms",
+    "cls": "",
+    "inp": "ms",
+    "requests": "",
+    "transferKb": "kB",
+}
+ACTION_METRICS = {"elapsed": "ms", "settled": "ms", "requests": "", "inp": "ms"}
+
+# --perf-repeat id: "[perf3]" alone, or first in a parametrized id ("[perf3-1]")
+REPEAT_ID = re.compile(r"\[perf\d+\]$|(?<=\[)perf\d+-")
+
+
+# 1: read the budgets that apply to this run; sections are
+#    [page <file>] or [action <Class.method>], a third word limits the
+#    section to runs seeded with that dataset tier
+
+def load_budgets(path=PERF_BUDGETS_FILE, seed=None):
+    parser = configparser.RawConfigParser()
+    # metric names are camelCase like the summary keys
+    parser.optionxform = str
+    if not parser.read(path, encoding="utf-8"):
+        raise FileNotFoundError(f"No budget file at {path}")
+
+    budgets = []
+    for section in parser.sections():
+        words = section.split()
+        if len(words) not in (2, 3) or words[0] not in ("page", "action"):
+            raise ValueError(f"{path}: [{section}] should be [page <file>] or [action <Class.method>] (+ tier)")
+        kind, name = words[0], words[1]
+        if len(words) == 3 and dataset_size(words[2]) != dataset_size(seed):
+            continue
+        known = PAGE_METRICS if kind == "page" else ACTION_METRICS
+        for metric, value in parser.items(section):
+            if metric not in known:
+                raise ValueError(f"{path}: [{section}] unknown metric '{metric}' (one of {', '.join(known)})")
+            budgets.append({
+                "kind": kind,
+                "name": name,
+                "tier": words[2] if len(words) == 3 else None,
+                "metric": metric,
+                "budget": float(value),
+            })
+    return budgets
+
+
+def dataset_size(seed):
+    if seed is None:
+        return None
+    return TIERS[seed] if seed in TIERS else int(seed)
+
+
+# 2: medians of the run against the budgets; a budget without samples is
+#    reported as missing, not as a failure (unless every budget is missing,
+#    see page_metrics_plugin)
+
+def check_budgets(summary, budgets):
+    rows = {("page", row["page"]): row for row in summary["pages"]}
+    rows.update({("action", row["action"]): row for row in summary["actions"]})
+
+    checks = []
+    for budget in budgets:
+        row = rows.get((budget["kind"], budget["name"]))
+        stats = row.get(budget["metric"]) if row else None
+        median = stats["p50"] if stats else None
+        if median is None:
+            status = "missing"
+        else:
+            status = "over" if median > budget["budget"] else "ok"
+        checks.append(dict(budget, median=median, samples=row["count"] if row else 0, status=status))
+    return checks
+
+
+def budget_table(checks):
+    lines = [f"{'status':<8} {'budget':>10} {'median':>10} {'diff':>8} {'n':>4}  metric of page/action"]
+    for check in sorted(checks, key=lambda check: (check["status"] != "over", check["kind"], check["name"])):
+        unit = (PAGE_METRICS if check["kind"] == "page" else ACTION_METRICS)[check["metric"]]
+        budget = f"{check['budget']:g}{unit}"
+        if check["median"] is None:
+            median, diff = "-", "-"
+        else:
+            median = f"{check['median']:g}{unit}"
+            diff = f"{(check['median'] / check['budget'] - 1) * 100:+.0f}%" if check["budget"] else "-"
+        target = check["name"] + (f" ({check['tier']})" if check["tier"] else "")
+        lines.append(
+            f"{check['status']:<8} {budget:>10} {median:>10} {diff:>8} {check['samples']:>4}  {check['metric']} of {target}"
+        )
+    return lines
+
+
+# the same test under every --perf-repeat id, so its samples stay together
+def base_nodeid(nodeid):
+    return REPEAT_ID.sub("", nodeid)
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ElementTree
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# timings of every benchmark run and the comparison
+BENCHMARK_FILE = os.path.join(base_dir, "tests", "reports", "pool_benchmark.json")
+
+# a fresh browser per test (the behaviour before the driver pool) against
+# the pool with its default --max-driver-uses
+MODES = {
+    "fresh": ["--max-driver-uses=1"],
+    "pooled": [],
+}
+
+
+# ------------------------
+#  RUNS
+# ------------------------
+
+# 1: one run of the suite; wall time of the whole pytest process (browser
+#    start-up included) and the junit counts of what ran
+
+def run_suite(mode, suite, pytest_args):
+    with tempfile.TemporaryDirectory() as directory:
+        junit = os.path.join(directory, "junit.xml")
+        command = [
+            sys.executable, "-m", "pytest", "-c", os.path.join("tests", "pytest.ini"), *suite,
+            *MODES[mode], *pytest_args, "--no-history", "-p", "no:cacheprovider", "-q", f"--junitxml={junit}",
+        ]
+        started = time.perf_counter()
+        exit_code = subprocess.call(command, cwd=base_dir)
+        seconds = time.perf_counter() - started
+        counts = junit_counts(junit)
+    return dict(counts, mode=mode, seconds=round(seconds, 2), exit_code=exit_code)
+
+
+def junit_counts(path):
+    counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "test_seconds": 0.0}
+    if not os.path.exists(path):
+        return counts
+    for suite in ElementTree.parse(path).getroot().iter("testsuite"):
+        for name in ("tests", "failures", "errors", "skipped"):
+            counts[name] += int(suite.get(name, 0))
+        counts["test_seconds"] += float(suite.get("time", 0))
+    counts["test_seconds"] = round(counts["test_seconds"], 2)
+    return counts
+
+
+# 2: the modes take turns (fresh, pooled, pooled, fresh, ...) so a machine
+#    that warms up or slows down over the benchmark affects both alike
+
+def benchmark(rounds, suite, pytest_args):
+    runs = []
+    for number in range(rounds):
+        order = list(MODES) if number % 2 == 0 else list(reversed(MODES))
+        for mode in order:
+            print(f"round {number + 1}/{rounds}: {mode}", flush=True)
+            runs.append(dict(run_suite(mode, suite, pytest_args), round=number + 1))
+    return runs
+
+
+def compare(runs):
+    table = {}
+    for mode in MODES:
+        seconds = [run["seconds"] for run in runs if run["mode"] == mode]
+        table[mode] = {
+            "runs": len(seconds),
+            "median": round(statistics.median(seconds), 2),
+            "min": min(seconds),
+            "max": max(seconds),
+            "tests": max(run["tests"] for run in runs if run["mode"] == mode),
+            "failed": sum(run["failures"] + run["errors"] for run in runs if run["mode"] == mode),
+        }
+    table["speedup"] = round(table["fresh"]["median"] / max(table["pooled"]["median"], 1e-9), 2)
+    return table
+
+
+# ------------------------
+#  COMMAND LINE
+# ------------------------
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Time the test suite with a fresh browser per test (--max-driver-uses=1) "
+        "against the default driver pool",
+        epilog="Arguments after -- go to pytest, e.g. -- -n 4 --base-url=local --backend=stub",
+    )
+    parser.add_argument("suite", nargs="*", default=[os.path.join("tests", "test_cases")])
+    parser.add_argument("--rounds", type=int, default=3, help="runs of each mode")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headed", action="store_true", help="show the browsers (default: --headless)")
+    parser.add_argument("--output", default=BENCHMARK_FILE)
+    options, pytest_args = parser.parse_known_args(arguments)
+    pytest_args = [argument for argument in pytest_args if argument != "--"]
+    pytest_args += [f"--browser={options.browser}"] + ([] if options.headed else ["--headless"])
+
+    runs = benchmark(options.rounds, options.suite, pytest_args)
+    table = compare(runs)
+
+    os.makedirs(os.path.dirname(os.path.abspath(options.output)), exist_ok=True)
+    with open(options.output, "w", encoding="utf-8") as file:
+        json.dump({"suite": options.suite, "pytest_args": pytest_args, "runs": runs, "comparison": table}, file, indent=2)
+
+    print()
+    print(f"{'mode':<8} {'median':>9} {'min':>9} {'max':>9} {'tests':>6} {'failed':>7}")
+    for mode in MODES:
+        row = table[mode]
+        print(f"{mode:<8} {row['median']:>8}s {row['min']:>8}s {row['max']:>8}s {row['tests']:>6} {row['failed']:>7}")
+    print(f"pooled browsers: {table['speedup']}x faster than a fresh browser per test (median wall time)")
+    if any(run["tests"] == 0 for run in runs):
+        print("warning: a run collected no tests - check the suite and the pytest arguments")
+    print(f"timings written to {options.output}")
+
+
+if __name__ == "__main__":
+    # python tests/utilities/pool_benchmark.py [suite ...] [--rounds N] [-- pytest arguments]
+    main()
@@ -9,22 +9,39 @@ config.read(config_path)
 
 
 class ReadConfig:
+    # pages are served from here instead of the deployed site when set
+    base_url = None
+
+    @staticmethod
+    def set_base_url(url):
+        ReadConfig.base_url = url.rstrip("/") if url else None
+
+    # move a deployed site url onto the base url (same path below the site root)
+    @staticmethod
+    def rebase(url):
+        if not ReadConfig.base_url:
+            return url
+        site_root = config.get("environment", "site_root").rstrip("/")
+        if url.startswith(site_root):
+            return ReadConfig.base_url + url[len(site_root):]
+        return url
+
     # fetch the variables
     @staticmethod
     def get_login_page_url():
         # section name + key
         url = config.get("admin login information", "login_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_dashboard_page_url():
         url = config.get("admin login information", "dashboard_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_analytics_page_url():
         url = config.get("admin login information", "analytics_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_email():
@@ -56,7 +73,7 @@ class ReadConfig:
     @staticmethod
     def get_search_page_url():
         url = config.get("search information", "search_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_single_keyword():
@@ -121,12 +138,12 @@ class ReadConfig:
     @staticmethod
     def get_reset_password_page_url():
         url = config.get("password reset information", "reset_password_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_change_password_page_url():
         url = config.get("password reset information", "change_password_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_valid_reset_email():
@@ -146,7 +163,7 @@ class ReadConfig:
     @staticmethod
     def get_all_complaints_page_url():
         url = config.get("update status information", "all_complaints_page_url")
-        return url
+        return ReadConfig.rebase(url)
 
     @staticmethod
     def get_status_update_reason():
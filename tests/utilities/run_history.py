@@ -0,0 +1,378 @@
+import argparse
+import json
+import math
+import os
+import sqlite3
+import statistics
+import time
+from contextlib import closing
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# every run's per-test durations and statuses
+HISTORY_DB = os.path.join(base_dir, "tests", "reports", "run_history.db")
+
+# runs on each side of a regression check
+REGRESSION_WINDOW = 5
+
+# a regression must be significant and at least this much slower (median)
+REGRESSION_ALPHA = 0.05
+REGRESSION_MIN_RATIO = 1.10
+
+# samples each side needs before the test is tried
+MIN_SAMPLES = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    finished REAL NOT NULL,
+    label TEXT,
+    environment TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (nodeid, run_id);
+CREATE INDEX IF NOT EXISTS results_by_run ON results (run_id);
+CREATE TABLE IF NOT EXISTS page_vitals (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    page TEXT NOT NULL,
+    loads INTEGER NOT NULL,
+    lcp REAL,
+    cls REAL,
+    inp REAL
+);
+CREATE INDEX IF NOT EXISTS page_vitals_by_page ON page_vitals (page, run_id);
+"""
+
+# web vitals stored per page and run (p75 of the run's loads)
+VITALS = ["lcp", "cls", "inp"]
+
+
+class RunHistory:
+    # sqlite store of test runs; one row per test execution (a run may hold
+    # several samples of one test)
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+
+    def connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(SCHEMA)
+        return connection
+
+    # 1: store a finished run; results are (nodeid, status, seconds) tuples,
+    #    pages the "pages" rows of page_metrics.metrics_summary (--page-metrics)
+
+    def record_run(self, results, environment, started, finished=None, label=None, pages=None):
+        with closing(self.connect()) as connection, connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started, finished, label, environment) VALUES (?, ?, ?, ?)",
+                (started, finished or time.time(), label, json.dumps(environment, sort_keys=True)),
+            )
+            run_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT INTO results (run_id, nodeid, status, duration) VALUES (?, ?, ?, ?)",
+                [(run_id, nodeid, status, duration) for nodeid, status, duration in results],
+            )
+            connection.executemany(
+                "INSERT INTO page_vitals (run_id, page, loads, lcp, cls, inp) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, page["page"], page["count"], *((page.get(name) or {}).get("p75") for name in VITALS))
+                    for page in pages or []
+                ],
+            )
+        return run_id
+
+    # 2: latest runs, newest first
+
+    def runs(self, limit=20):
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                """
+                SELECT runs.id, runs.started, runs.finished, runs.label, runs.environment,
+                       COUNT(results.nodeid), SUM(results.status = 'passed')
+                FROM runs LEFT JOIN results ON results.run_id = runs.id
+                GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        return [
+            {
+                "id": run_id,
+                "started": started,
+                "seconds": round(finished - started, 1),
+                "label": label,
+                "environment": json.loads(environment),
+                "tests": tests,
+                "passed": passed or 0,
+            }
+            for run_id, started, finished, label, environment, tests, passed in rows
+        ]
+
+    def run_ids(self, last=None):
+        with closing(self.connect()) as connection:
+            ids = [row[0] for row in connection.execute("SELECT id FROM runs ORDER BY id")]
+        return ids[-last:] if last else ids
+
+    # 3: slowest tests by median over the given runs (default: the latest one)
+
+    def slowest(self, run_ids=None, limit=10):
+        samples = self.samples(run_ids or self.run_ids(1))
+        table = [summarize(nodeid, durations) for nodeid, durations in samples.items()]
+        table.sort(key=lambda row: -row["p50"])
+        return table[:limit]
+
+    # 4: p50/p95 per run for the tests whose nodeid contains `pattern`
+
+    def trend(self, pattern="", last=10):
+        run_ids = self.run_ids(last)
+        trend = {}
+        for run_id in run_ids:
+            for nodeid, durations in self.samples([run_id], pattern).items():
+                trend.setdefault(nodeid, []).append(dict(summarize(nodeid, durations), run=run_id))
+        return trend
+
+    # 5: p75 web vitals per run for the pages whose name contains `pattern`
+
+    def vitals(self, pattern="", last=10):
+        run_ids = self.run_ids(last)
+        if not run_ids:
+            return {}
+        placeholders = ",".join("?" * len(run_ids))
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                f"""
+                SELECT page, run_id, loads, lcp, cls, inp FROM page_vitals
+                WHERE run_id IN ({placeholders}) AND page LIKE ? ORDER BY page, run_id
+                """,
+                [*run_ids, f"%{pattern}%"],
+            ).fetchall()
+        vitals = {}
+        for page, run_id, loads, *values in rows:
+            vitals.setdefault(page, []).append(dict(zip(VITALS, values), run=run_id, loads=loads))
+        return vitals
+
+    # 6: tests significantly slower in `head` runs than in `base` runs
+    #    (one-sided Mann-Whitney U on the passed durations)
+
+    def regressions(self, base_ids=None, head_ids=None, alpha=REGRESSION_ALPHA, min_ratio=REGRESSION_MIN_RATIO):
+        if base_ids is None or head_ids is None:
+            base_ids, head_ids = self.default_windows()
+        base = self.samples(base_ids, status="passed")
+        head = self.samples(head_ids, status="passed")
+
+        found = []
+        for nodeid in sorted(set(base) & set(head)):
+            before, after = base[nodeid], head[nodeid]
+            if len(before) < MIN_SAMPLES or len(after) < MIN_SAMPLES:
+                continue
+            ratio = statistics.median(after) / max(statistics.median(before), 1e-9)
+            if ratio < min_ratio:
+                continue
+            p_value = mann_whitney_greater(after, before)
+            if p_value <= alpha:
+                found.append({
+                    "nodeid": nodeid,
+                    "base_p50": round(statistics.median(before), 3),
+                    "head_p50": round(statistics.median(after), 3),
+                    "change": round((ratio - 1) * 100, 1),
+                    "p_value": round(p_value, 4),
+                    "samples": [len(before), len(after)],
+                })
+        found.sort(key=lambda row: -row["change"])
+        return found
+
+    # the latest REGRESSION_WINDOW runs against the ones before them; a run
+    # holding repeated samples (perf mode) is compared with the run before it
+    def default_windows(self):
+        run_ids = self.run_ids()
+        if len(run_ids) >= 2 * REGRESSION_WINDOW:
+            return run_ids[-2 * REGRESSION_WINDOW:-REGRESSION_WINDOW], run_ids[-REGRESSION_WINDOW:]
+        return run_ids[-2:-1], run_ids[-1:]
+
+    # nodeid -> durations in the given runs
+    def samples(self, run_ids, pattern="", status=None):
+        if not run_ids:
+            return {}
+        placeholders = ",".join("?" * len(run_ids))
+        query = f"SELECT nodeid, duration FROM results WHERE run_id IN ({placeholders}) AND nodeid LIKE ?"
+        parameters = [*run_ids, f"%{pattern}%"]
+        if status:
+            query += " AND status = ?"
+            parameters.append(status)
+        samples = {}
+        with closing(self.connect()) as connection:
+            for nodeid, duration in connection.execute(query, parameters):
+                samples.setdefault(nodeid, []).append(duration)
+        return samples
+
+
+# ------------------------
+#  STATISTICS
+# ------------------------
+
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(nodeid, durations):
+    return {
+        "nodeid": nodeid,
+        "count": len(durations),
+        "p50": round(percentile(durations, 50), 3),
+        "p95": round(percentile(durations, 95), 3),
+        "max": round(max(durations), 3),
+    }
+
+
+# p-value of "x tends to be larger than y"; exact for small samples without
+# ties, normal approximation with tie correction otherwise
+def mann_whitney_greater(x, y):
+    n1, n2 = len(x), len(y)
+    ranked = sorted([(value, 0) for value in x] + [(value, 1) for value in y])
+    ranks = [0.0] * len(ranked)
+    ties = []
+    start = 0
+    while start < len(ranked):
+        end = start
+        while end + 1 < len(ranked) and ranked[end + 1][0] == ranked[start][0]:
+            end += 1
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+        if end > start:
+            ties.append(end - start + 1)
+        start = end + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    if not ties and n1 + n2 <= 30:
+        # counts[k] = ways to get U = k, built up one observation at a time
+        counts = u_distribution(n1, n2)
+        return sum(counts[int(u):]) / sum(counts)
+
+    total = n1 + n2
+    mean = n1 * n2 / 2
+    tie_term = sum(t ** 3 - t for t in ties) / (total * (total - 1))
+    deviation = math.sqrt(n1 * n2 / 12 * ((total + 1) - tie_term))
+    if deviation == 0:
+        return 1.0
+    z = (u - mean - 0.5) / deviation
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def u_distribution(n1, n2):
+    # frequencies of U for every split of n1 + n2 distinct values
+    table = {(0, 0): [1]}
+    for i in range(n1 + 1):
+        for j in range(n2 + 1):
+            if i == 0 and j == 0:
+                continue
+            counts = [0] * (i * j + 1)
+            if i > 0:
+                # the largest value is an x: it beats all j y's
+                for u, ways in enumerate(table[(i - 1, j)]):
+                    counts[u + j] += ways
+            if j > 0:
+                for u, ways in enumerate(table[(i, j - 1)]):
+                    counts[u] += ways
+            table[(i, j)] = counts
+    return table[(n1, n2)]
+
+
+# ------------------------
+#  COMMAND LINE
+# ------------------------
+
+def parse_runs(text, history):
+    # "12", "10-14" or "last:5"
+    if text.startswith("last:"):
+        return history.run_ids(int(text[5:]))
+    if "-" in text:
+        first, last = (int(part) for part in text.split("-", 1))
+        return list(range(first, last + 1))
+    return [int(text)]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Query the test run history")
+    parser.add_argument("--db", default=HISTORY_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("runs", help="latest runs").add_argument("--limit", type=int, default=20)
+
+    slowest = commands.add_parser("slowest", help="slowest tests by median")
+    slowest.add_argument("--runs", default="last:1", help='run ids: "12", "10-14" or "last:N"')
+    slowest.add_argument("--limit", type=int, default=10)
+
+    trend = commands.add_parser("trend", help="p50/p95 per run")
+    trend.add_argument("pattern", nargs="?", default="", help="part of the nodeid")
+    trend.add_argument("--last", type=int, default=10)
+
+    vitals = commands.add_parser("vitals", help="p75 LCP/CLS/INP per page and run (--page-metrics runs)")
+    vitals.add_argument("pattern", nargs="?", default="", help="part of the page name")
+    vitals.add_argument("--last", type=int, default=10)
+
+    regressions = commands.add_parser("regressions", help="significantly slower tests")
+    regressions.add_argument("--base", help="run ids before (default: the window before --head)")
+    regressions.add_argument("--head", help="run ids after (default: the latest window)")
+    regressions.add_argument("--alpha", type=float, default=REGRESSION_ALPHA)
+
+    options = parser.parse_args(arguments)
+    history = RunHistory(options.db)
+
+    if options.command == "runs":
+        for run in history.runs(options.limit):
+            started = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started"]))
+            environment = ", ".join(f"{key}={value}" for key, value in run["environment"].items())
+            print(f"#{run['id']:<5} {started}  {run['seconds']:>8}s  {run['passed']}/{run['tests']} passed  {environment}")
+
+    elif options.command == "slowest":
+        print(f"{'p50':>9} {'p95':>9} {'max':>9} {'n':>4}  test")
+        for row in history.slowest(parse_runs(options.runs, history), options.limit):
+            print(f"{row['p50']:>8}s {row['p95']:>8}s {row['max']:>8}s {row['count']:>4}  {row['nodeid']}")
+
+    elif options.command == "trend":
+        for nodeid, points in history.trend(options.pattern, options.last).items():
+            print(nodeid)
+            for point in points:
+                print(f"    run #{point['run']:<5} p50 {point['p50']:>8}s  p95 {point['p95']:>8}s  n={point['count']}")
+
+    elif options.command == "vitals":
+        for page, points in history.vitals(options.pattern, options.last).items():
+            print(page)
+            for point in points:
+                lcp, cls, inp = (point[name] if point[name] is not None else "-" for name in VITALS)
+                print(f"    run #{point['run']:<5} LCP {lcp:>7}ms  CLS {cls:>7}  INP {inp:>6}ms  loads={point['loads']}")
+
+    elif options.command == "regressions":
+        base = parse_runs(options.base, history) if options.base else None
+        head = parse_runs(options.head, history) if options.head else None
+        if (base is None) != (head is None):
+            parser.error("give both --base and --head, or neither")
+        found = history.regressions(base, head, options.alpha)
+        if not found:
+            print("No significant duration regressions.")
+        for row in found:
+            print(
+                f"+{row['change']:>6}%  {row['base_p50']:>8}s -> {row['head_p50']:>8}s  "
+                f"p={row['p_value']:<7} n={row['samples'][0]}/{row['samples'][1]}  {row['nodeid']}"
+            )
+
+
+if __name__ == "__main__":
+    # python -m tests.utilities.run_history runs|slowest|trend|vitals|regressions
+    main()
@@ -0,0 +1,99 @@
+import os
+import platform
+import subprocess
+import time
+
+import pytest
+
+from tests.utilities.perf_budgets import base_nodeid
+from tests.utilities.read_properties import ReadConfig
+from tests.utilities.run_history import HISTORY_DB, RunHistory
+
+# (nodeid, status, seconds) per finished test, for the run history
+test_results = []
+
+# status and seconds so far of the tests still running
+running_tests = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--history-db",
+        action="store",
+        default=HISTORY_DB,
+        help="SQLite file every run's test durations and statuses are added to",
+    )
+    parser.addoption(
+        "--no-history",
+        action="store_true",
+        default=False,
+        help="Do not add this run to the run history",
+    )
+    parser.addoption(
+        "--run-label",
+        action="store",
+        default=None,
+        help="Name stored with this run in the run history",
+    )
+
+
+def pytest_configure(config):
+    config._run_started = time.time()
+
+
+def pytest_runtest_logreport(report):
+    # allure's naming: a failing test is "failed", a failing fixture "broken"
+    status, seconds = running_tests.get(report.nodeid, ("passed", 0.0))
+    if report.failed:
+        status = "failed" if report.when == "call" else "broken"
+    elif report.skipped and status == "passed":
+        status = "skipped"
+    running_tests[report.nodeid] = (status, seconds + report.duration)
+
+    if report.when == "teardown":
+        status, seconds = running_tests.pop(report.nodeid)
+        test_results.append((base_nodeid(report.nodeid), status, seconds))
+
+
+# last, so the page metrics summary of the run is ready
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") or not test_results or config.getoption("--no-history"):
+        return
+    page_summary = getattr(config, "_page_summary", None)
+    RunHistory(config.getoption("--history-db")).record_run(
+        test_results,
+        run_environment(config),
+        started=config._run_started,
+        label=config.getoption("--run-label"),
+        pages=page_summary["pages"] if page_summary else None,
+    )
+
+
+# what a run in the history was run against
+def run_environment(config):
+    numprocesses = getattr(config.option, "numprocesses", None)
+    return {
+        "browser": config.getoption("--browser"),
+        "headless": config.getoption("--headless"),
+        "base_url": ReadConfig.base_url or "deployed",
+        "backend": config.getoption("--backend"),
+        "workers": numprocesses or 1,
+        "repeat": config.getoption("--perf-repeat"),
+        "net_profile": config.getoption("--net-profile"),
+        "cpu_throttle": config.getoption("--cpu-throttle"),
+        "commit": git_commit(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except Exception:
+        return None
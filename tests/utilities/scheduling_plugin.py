@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from tests.utilities.duration_scheduler import LongestFirstScheduling, save_history
+from tests.utilities.perf_budgets import base_nodeid
+
+# seconds per test in this run (setup + call + teardown), saved for the next schedule
+test_durations = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--dist-durations",
+        action="store_true",
+        default=False,
+        help="With -n, hand out the longest tests first using the durations of earlier runs",
+    )
+
+
+# longest-first scheduling across xdist workers
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption("--dist-durations"):
+        config._duration_scheduler = LongestFirstScheduling(config, log)
+        return config._duration_scheduler
+    return None
+
+
+def pytest_runtest_logreport(report):
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput") or not test_durations:
+        return
+    # each --perf-repeat run is a sample of the plain nodeid, the one a
+    # normal run schedules by
+    samples = {}
+    for nodeid, seconds in test_durations.items():
+        samples.setdefault(base_nodeid(nodeid), []).append(seconds)
+    save_history(samples)
+
+
+# estimated makespan of the duration schedule against xdist's default
+def pytest_terminal_summary(terminalreporter, config):
+    scheduler = getattr(config, "_duration_scheduler", None)
+    if scheduler is None or scheduler.report is None:
+        return
+    report = scheduler.report
+    saved = report["load"] - report["longest_first"]
+    terminalreporter.write_sep("-", "duration scheduler")
+    terminalreporter.write_line(
+        f"{report['tests']} tests on {report['workers']} workers, "
+        f"{report['with_history']} with history"
+    )
+    terminalreporter.write_line(
+        f"estimated makespan: {report['longest_first']}s longest-first vs "
+        f"{report['load']}s with --dist load ({saved:+.1f}s)"
+    )
+    terminalreporter.write_line(
+        f"measured: {time.monotonic() - scheduler.started:.1f}s from first hand-out to end"
+    )
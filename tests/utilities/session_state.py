@@ -0,0 +1,78 @@
+import json
+import os
+import re
+import time
+
+# key that src/supabaseClient.js uses for the auth session in sessionStorage
+SESSION_STORAGE_KEY = "supabase.auth.token"
+
+# saved sessions live next to the other test artifacts (ignored by git)
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATE_DIR = os.path.join(base_dir, "tests", ".auth")
+
+# treat a token as expired a little early so it cannot lapse mid-test
+EXPIRY_MARGIN_SECONDS = 300
+
+
+class SessionState:
+    # logged-in browser state captured once and replayed into new tests
+
+    def __init__(self, email):
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", email)
+        self.path = os.path.join(STATE_DIR, f"{safe_name}.json")
+
+    # 1: read the saved state if it is still valid
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("expires_at", 0) - EXPIRY_MARGIN_SECONDS <= time.time():
+            return None
+        return state.get("storage")
+
+    # 2: write the state atomically (several workers may log in at once)
+
+    def save(self, storage):
+        os.makedirs(STATE_DIR, exist_ok=True)
+        state = {"expires_at": self.expires_at(storage), "storage": storage}
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temp_path, self.path)
+
+    # 3: expiry (epoch seconds) of the supabase access token
+
+    @staticmethod
+    def expires_at(storage):
+        try:
+            return json.loads(storage[SESSION_STORAGE_KEY])["expires_at"]
+        except (KeyError, TypeError, ValueError):
+            return 0
+
+    # 4: read the session from a logged-in browser
+
+    @staticmethod
+    def capture(driver):
+        value = driver.execute_script(
+            "return window.sessionStorage.getItem(arguments[0]);",
+            SESSION_STORAGE_KEY,
+        )
+        return {SESSION_STORAGE_KEY: value} if value else None
+
+    # 5: put the session into a browser (must already be on the app origin)
+
+    @staticmethod
+    def inject(driver, storage):
+        driver.execute_script(
+            """
+            var items = arguments[0];
+            for (var key in items) {
+                window.sessionStorage.setItem(key, items[key]);
+            }
+        """,
+            storage,
+        )
@@ -0,0 +1,222 @@
+import io
+import os
+import threading
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from tests.utilities.supabase_stub import PROJECT_URL
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TESTS_DIR = os.path.join(base_dir, "tests")
+
+# folders searched in order for every request: the vite build (dist/src/*.html
+# with bundled assets), then public/ (served at the site root by vite, e.g.
+# /images), then the app sources in the checkout (src/ as-is)
+DOCUMENT_ROOTS = [
+    os.path.join(base_dir, "dist"),
+    os.path.join(base_dir, "public"),
+    base_dir,
+]
+
+# all that is served from the checkout itself: these folders and the html
+# files at its top. Never tests/ (config.ini holds the admin password,
+# tests/.auth the saved session tokens)
+SOURCE_DIRS = ["src"]
+
+# browsers may reuse files for this long without asking again
+CACHE_MAX_AGE = 3600
+
+# longest request line accepted (http.server stops at 64 KB). The complaints
+# page looks its users up with id=in.(...) in the url: ~390 KB at 100k
+MAX_REQUEST_LINE = 4 * 1024 * 1024
+
+
+class StaticRequestHandler(SimpleHTTPRequestHandler):
+    # keep-alive: one connection serves all the files of a page
+    protocol_version = "HTTP/1.1"
+
+    # windows can map .js to text/plain, which breaks module scripts
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".js": "text/javascript",
+        ".mjs": "text/javascript",
+        ".css": "text/css",
+        ".svg": "image/svg+xml",
+        ".json": "application/json",
+    }
+
+    roots = DOCUMENT_ROOTS
+
+    # optional api stand-in (SupabaseStub) answering /rest/v1 and /auth/v1,
+    # and the text replaced in served pages to point the app at it
+    backend = None
+    rewrites = {}
+
+    # 1: look the path up in every document root; None if no root has it or
+    #    it may not be served
+
+    def translate_path(self, path):
+        for root in self.roots:
+            if not os.path.isdir(root):
+                continue
+            self.directory = root
+            candidate = super().translate_path(path)
+            if os.path.exists(candidate) and self.is_public(root, candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def is_public(root, path):
+        real_path = os.path.realpath(path)
+        tests_dir = os.path.realpath(TESTS_DIR)
+        if real_path == tests_dir or real_path.startswith(tests_dir + os.sep):
+            return False
+        repo = os.path.realpath(base_dir)
+        if os.path.realpath(root) != repo:
+            return True
+        relative = os.path.relpath(real_path, repo)
+        top = relative.split(os.sep)[0]
+        if top in SOURCE_DIRS:
+            return True
+        return relative == top and top.endswith(".html")
+
+    # 2: api requests go to the backend, everything else is a file
+
+    def is_backend_request(self):
+        # send_error can run before parse_request has set path (414, a
+        # malformed request line), and end_headers asks this too
+        path = getattr(self, "path", "")
+        return self.backend is not None and path.startswith(("/rest/v1/", "/auth/v1/"))
+
+    def send_backend(self):
+        path, _, query = self.path.partition("?")
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        status, headers, content = self.backend.handle(self.command, path, query, self.headers, body)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    def do_GET(self):
+        if self.is_backend_request():
+            return self.send_backend()
+        super().do_GET()
+
+    def do_HEAD(self):
+        if self.is_backend_request():
+            return self.send_backend()
+        super().do_HEAD()
+
+    def do_POST(self):
+        if self.is_backend_request():
+            return self.send_backend()
+        self.send_error(405)
+
+    do_PATCH = do_POST
+    do_DELETE = do_POST
+
+    # 3: pages and scripts with rewritten text (not cached as 304s)
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if path is None:
+            self.send_error(404, "File not found")
+            return None
+        if not self.rewrites or not path.endswith((".js", ".html")) or not os.path.isfile(path):
+            return super().send_head()
+
+        with open(path, "rb") as file:
+            content = file.read()
+        for old, new in self.rewrites.items():
+            content = content.replace(old, new)
+
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Last-Modified", formatdate(os.path.getmtime(path), usegmt=True))
+        self.end_headers()
+        return io.BytesIO(content)
+
+    # 4: caching headers for files (If-Modified-Since is answered by the base class)
+
+    def end_headers(self):
+        if self.is_backend_request():
+            self.send_header("Cache-Control", "no-store")
+        else:
+            self.send_header("Cache-Control", f"public, max-age={CACHE_MAX_AGE}")
+        super().end_headers()
+
+    # 5: http.server's request loop, with MAX_REQUEST_LINE as the limit
+
+    def handle_one_request(self):
+        try:
+            self.raw_requestline = self.rfile.readline(MAX_REQUEST_LINE + 1)
+            if len(self.raw_requestline) > MAX_REQUEST_LINE:
+                self.requestline = self.request_version = self.command = ""
+                self.send_error(HTTPStatus.REQUEST_URI_TOO_LONG)
+                return
+            if not self.raw_requestline:
+                self.close_connection = True
+                return
+            if not self.parse_request():
+                return
+            method = getattr(self, f"do_{self.command}", None)
+            if method is None:
+                self.send_error(HTTPStatus.NOT_IMPLEMENTED, f"Unsupported method ({self.command!r})")
+                return
+            method()
+            self.wfile.flush()
+        except TimeoutError as error:
+            self.log_error("Request timed out: %r", error)
+            self.close_connection = True
+
+    # keep the pytest output clean
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticServer:
+    # serves the app from this checkout on a free localhost port
+
+    def __init__(self, host="127.0.0.1", port=0, roots=None, backend=None):
+        self.httpd = ThreadingHTTPServer((host, port), StaticRequestHandler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+        # per-server handler settings
+        settings = {"roots": roots or DOCUMENT_ROOTS}
+        if backend is not None:
+            # the app then calls its api on this server (same origin, no CORS)
+            settings["backend"] = backend
+            settings["rewrites"] = {PROJECT_URL.encode("utf-8"): self.url.encode("utf-8")}
+        self.httpd.RequestHandlerClass = type(
+            "StaticRequestHandler", (StaticRequestHandler,), settings
+        )
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # 1: serve in a background thread
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    # 2: stop serving and free the port
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
@@ -0,0 +1,115 @@
+import functools
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import time
+
+import allure
+
+from tests.utilities.run_history import percentile
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# latency table of the last run with --step-timing, read by generate_dashboard
+STEP_TIMINGS_FILE = os.path.join(base_dir, "tests", "reports", "step_timings.json")
+
+# "FilterPage.select_status_filter" -> seconds of every call in this process
+step_durations = {}
+
+
+# 1: record the wall time of every call as an allure step
+
+def timed_step(name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            with allure.step(name):
+                return function(*args, **kwargs)
+        finally:
+            step_durations.setdefault(name, []).append(time.perf_counter() - started)
+
+    wrapper.timed_step = True
+    return wrapper
+
+
+# 2: wrap the public methods of every class defined in tests/base_pages
+#    (called once per process, only when --step-timing is given)
+
+def instrument_pages(package_name="tests.base_pages"):
+    package = importlib.import_module(package_name)
+    instrumented = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package_name}.{module_info.name}")
+        for cls in vars(module).values():
+            if inspect.isclass(cls) and cls.__module__ == module.__name__:
+                instrumented.extend(instrument_class(cls))
+    return instrumented
+
+
+def instrument_class(cls):
+    names = []
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith("_"):
+            continue
+        name = f"{cls.__name__}.{attribute}"
+        if isinstance(value, (staticmethod, classmethod)):
+            if getattr(value.__func__, "timed_step", False):
+                continue
+            setattr(cls, attribute, type(value)(timed_step(name, value.__func__)))
+        elif inspect.isfunction(value):
+            if getattr(value, "timed_step", False):
+                continue
+            setattr(cls, attribute, timed_step(name, value))
+        else:
+            continue
+        names.append(name)
+    return names
+
+
+# ------------------------
+#  LATENCY TABLE
+# ------------------------
+
+# 1: add another process's samples (xdist workers send theirs at the end)
+
+def merge_durations(durations):
+    for name, samples in durations.items():
+        step_durations.setdefault(name, []).extend(samples)
+
+
+# 2: count, p50, p95, max and total per method, most total time first
+
+def latency_table(durations=None):
+    durations = step_durations if durations is None else durations
+    table = [
+        {
+            "method": name,
+            "count": len(samples),
+            "p50": round(percentile(samples, 50), 3),
+            "p95": round(percentile(samples, 95), 3),
+            "max": round(max(samples), 3),
+            "total": round(sum(samples), 3),
+        }
+        for name, samples in durations.items()
+        if samples
+    ]
+    table.sort(key=lambda row: -row["total"])
+    return table
+
+
+def write_table(table, path=STEP_TIMINGS_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"generated": time.time(), "methods": table}, file, indent=1)
+    return path
+
+
+def read_table(path=STEP_TIMINGS_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)["methods"]
+    except (OSError, ValueError, KeyError):
+        return None
@@ -0,0 +1,53 @@
+import pytest
+
+from tests.utilities.step_timing import (
+    instrument_pages,
+    latency_table,
+    merge_durations,
+    step_durations,
+    write_table,
+)
+
+# rows listed in the terminal summaries of --step-timing and
+# --profile-webdriver (all go to the json files)
+STEP_TABLE_LINES = 15
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--step-timing",
+        action="store_true",
+        default=False,
+        help="Time every page-object method call (allure steps + latency table at the end)",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--step-timing"):
+        instrument_pages()
+
+
+# step timings of a finished xdist worker
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    merge_durations(getattr(node, "workeroutput", {}).get("step_durations", {}))
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput"):
+        # page-object timings travel to the controller with the worker
+        session.config.workeroutput["step_durations"] = step_durations
+    elif session.config.getoption("--step-timing"):
+        write_table(latency_table())
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--step-timing") or hasattr(config, "workerinput"):
+        return
+    terminalreporter.write_sep("-", "page-object step timings (slowest total first)")
+    terminalreporter.write_line(f"{'count':>6} {'p50':>8} {'p95':>8} {'max':>8} {'total':>9}  method")
+    for row in latency_table()[:STEP_TABLE_LINES]:
+        terminalreporter.write_line(
+            f"{row['count']:>6} {row['p50']:>7}s {row['p95']:>7}s {row['max']:>7}s "
+            f"{row['total']:>8}s  {row['method']}"
+        )
@@ -0,0 +1,439 @@
+import base64
+import csv
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl
+
+from tests.utilities.dataset_generator import DatasetGenerator
+
+# hosted project the app talks to (src/supabaseClient.js); the static server
+# points it at the stub instead
+PROJECT_URL = "https://jxkbluyzqgmljvpgmrot.supabase.co"
+
+# tables the admin pages read or write, with their primary key
+TABLES = {
+    "complaint": "complaintid",
+    "users": "id",
+    "category": "categoryid",
+    "admin": "id",
+    "notifications": "id",
+    "admin_notifications": "id",
+    "complaintattachment": "id",
+    "academiccomplaint": "complaintid",
+    "administrativecomplaint": "complaintid",
+    "facilitycomplaint": "complaintid",
+    "othercomplaint": "complaintid",
+    "studentbehaviorcomplaint": "complaintid",
+    "technicalcomplaint": "complaintid",
+}
+
+# issued tokens stay valid for this long (seconds)
+TOKEN_LIFETIME = 3600
+TOKEN_SECRET = b"supabase-stub"
+
+
+class StubError(Exception):
+    # an error response in the shape supabase-js expects
+
+    def __init__(self, status, body):
+        super().__init__(body.get("message") or body.get("msg"))
+        self.status = status
+        self.body = body
+
+
+class SupabaseStub:
+    # in-memory PostgREST + GoTrue subset, enough for the admin pages
+
+    def __init__(self, admin_email, admin_password):
+        self.admin_email = admin_email
+        self.admin_password = admin_password
+        self.lock = threading.Lock()
+        self.tables = {name: [] for name in TABLES}
+        # email -> (password, user id)
+        self.accounts = {}
+        # refresh token -> user id
+        self.refresh_tokens = {}
+
+    # ------------------------
+    #  SEEDING
+    # ------------------------
+
+    # 1: replace all data with a generated dataset of the given size
+
+    def seed(self, complaints=100, seed=0):
+        return self.load(DatasetGenerator(seed).rows(complaints))
+
+    # 2: replace all data with (table, row) pairs, e.g. from read_dataset()
+
+    def load(self, rows):
+        with self.lock:
+            self.tables = {name: [] for name in TABLES}
+            self.accounts = {}
+            self.refresh_tokens = {}
+
+            for table, row in rows:
+                self.tables[table].append(row)
+
+            # the configured admin logs in with the configured password
+            for admin in self.tables["admin"]:
+                if admin.get("email") and admin["email"].lower() == self.admin_email.lower():
+                    self.accounts[self.admin_email.lower()] = (self.admin_password, admin["id"])
+
+        return len(self.tables["complaint"])
+
+    # ------------------------
+    #  REQUEST HANDLING
+    # ------------------------
+
+    # 1: answer one request, returns (status, headers, body bytes)
+
+    def handle(self, method, path, query, headers, body):
+        try:
+            if path.startswith("/auth/v1/"):
+                status, payload, extra = self.handle_auth(method, path[len("/auth/v1/"):], query, headers, body)
+            elif path.startswith("/rest/v1/"):
+                status, payload, extra = self.handle_rest(method, path[len("/rest/v1/"):], query, headers, body)
+            else:
+                raise StubError(404, {"message": f"Unknown path {path}"})
+        except StubError as error:
+            status, payload, extra = error.status, error.body, {}
+
+        response_headers = {"Content-Type": "application/json; charset=utf-8", **extra}
+        if payload is None or method == "HEAD":
+            return status, response_headers, b""
+        return status, response_headers, json.dumps(payload).encode("utf-8")
+
+    # ------------------------
+    #  AUTH (gotrue)
+    # ------------------------
+
+    def handle_auth(self, method, endpoint, query, headers, body):
+        params = dict(parse_qsl(query))
+        data = json.loads(body or b"{}")
+
+        if endpoint == "token" and method == "POST":
+            grant_type = params.get("grant_type")
+            if grant_type == "password":
+                account = self.accounts.get(str(data.get("email", "")).lower())
+                if account is None or account[0] != data.get("password"):
+                    raise StubError(400, {
+                        "code": 400,
+                        "error_code": "invalid_credentials",
+                        "msg": "Invalid login credentials",
+                    })
+                return 200, self.new_session(account[1], data["email"]), {}
+            if grant_type == "refresh_token":
+                # a refresh token is used once; load() may replace the dict meanwhile
+                with self.lock:
+                    user_id = self.refresh_tokens.pop(data.get("refresh_token"), None)
+                if user_id is None:
+                    raise StubError(400, {
+                        "code": 400,
+                        "error_code": "refresh_token_not_found",
+                        "msg": "Invalid Refresh Token: Refresh Token Not Found",
+                    })
+                return 200, self.new_session(user_id, self.email_of(user_id)), {}
+            raise StubError(400, {"code": 400, "error_code": "validation_failed", "msg": "Unsupported grant type"})
+
+        if endpoint == "user" and method == "GET":
+            user_id = self.user_from_token(headers.get("Authorization", ""))
+            if user_id is None:
+                raise StubError(401, {"code": 401, "error_code": "bad_jwt", "msg": "Invalid JWT"})
+            return 200, self.user_object(user_id, self.email_of(user_id)), {}
+
+        if endpoint == "logout" and method == "POST":
+            return 204, None, {}
+
+        raise StubError(404, {"code": 404, "msg": f"Unknown auth endpoint {endpoint}"})
+
+    def new_session(self, user_id, email):
+        now = int(time.time())
+        refresh_token = uuid.uuid4().hex
+        with self.lock:
+            self.refresh_tokens[refresh_token] = user_id
+        claims = {
+            "sub": user_id,
+            "email": email,
+            "role": "authenticated",
+            "aud": "authenticated",
+            "iat": now,
+            "exp": now + TOKEN_LIFETIME,
+            "session_id": str(uuid.uuid4()),
+        }
+        return {
+            "access_token": self.encode_token(claims),
+            "token_type": "bearer",
+            "expires_in": TOKEN_LIFETIME,
+            "expires_at": now + TOKEN_LIFETIME,
+            "refresh_token": refresh_token,
+            "user": self.user_object(user_id, email),
+        }
+
+    @staticmethod
+    def user_object(user_id, email):
+        created = "2025-01-01T00:00:00Z"
+        return {
+            "id": user_id,
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "email_confirmed_at": created,
+            "app_metadata": {"provider": "email", "providers": ["email"]},
+            "user_metadata": {},
+            "identities": [],
+            "created_at": created,
+            "updated_at": created,
+        }
+
+    def email_of(self, user_id):
+        for email, (_, account_id) in self.accounts.items():
+            if account_id == user_id:
+                return email
+        return None
+
+    # tokens are real (HS256) JWTs so supabase-js can decode them
+    @staticmethod
+    def encode_token(claims):
+        def part(data):
+            raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+        signing_input = f"{part({'alg': 'HS256', 'typ': 'JWT'})}.{part(claims)}"
+        signature = hmac.new(TOKEN_SECRET, signing_input.encode("ascii"), hashlib.sha256).digest()
+        return f"{signing_input}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode('ascii')}"
+
+    @staticmethod
+    def user_from_token(authorization):
+        try:
+            token = authorization.split(" ", 1)[1]
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        except (IndexError, ValueError):
+            return None
+        if claims.get("exp", 0) <= time.time():
+            return None
+        return claims.get("sub")
+
+    # ------------------------
+    #  REST (postgrest)
+    # ------------------------
+
+    def handle_rest(self, method, table, query, headers, body):
+        if table not in self.tables:
+            raise StubError(404, {
+                "code": "PGRST205",
+                "message": f"Could not find the table 'public.{table}' in the schema cache",
+            })
+
+        params = parse_qsl(query, keep_blank_values=True)
+        prefer = headers.get("Prefer", "")
+        single = "vnd.pgrst.object" in headers.get("Accept", "")
+
+        select = "*"
+        order = None
+        limit = None
+        offset = 0
+        filters = []
+        for key, value in params:
+            if key == "select":
+                select = value
+            elif key == "order":
+                order = value
+            elif key == "limit":
+                limit = int(value)
+            elif key == "offset":
+                offset = int(value)
+            elif key not in ("columns", "on_conflict"):
+                filters.append(self.parse_filter(key, value))
+
+        with self.lock:
+            rows = self.tables[table]
+
+            if method in ("GET", "HEAD"):
+                matched = [row for row in rows if self.matches(row, filters)]
+                total = len(matched)
+                if order:
+                    matched = self.sort(matched, order)
+                matched = matched[offset:offset + limit if limit is not None else None]
+                result = [self.project(row, select) for row in matched]
+                status = 200
+
+            elif method == "POST":
+                new_rows = json.loads(body or b"[]")
+                if isinstance(new_rows, dict):
+                    new_rows = [new_rows]
+                for row in new_rows:
+                    row.setdefault(TABLES[table], str(uuid.uuid4()))
+                    row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+                    rows.append(row)
+                result = [self.project(row, select) for row in new_rows]
+                total = len(result)
+                status = 201
+
+            elif method == "PATCH":
+                changes = json.loads(body or b"{}")
+                result = []
+                for row in rows:
+                    if self.matches(row, filters):
+                        row.update(changes)
+                        result.append(self.project(row, select))
+                total = len(result)
+                status = 200
+
+            elif method == "DELETE":
+                removed = [row for row in rows if self.matches(row, filters)]
+                self.tables[table] = [row for row in rows if not self.matches(row, filters)]
+                result = [self.project(row, select) for row in removed]
+                total = len(result)
+                status = 200
+
+            else:
+                raise StubError(405, {"message": f"Method {method} not allowed"})
+
+        extra = {}
+        if "count=" in prefer:
+            last = offset + len(result) - 1
+            extra["Content-Range"] = f"{offset}-{last}/{total}" if result else f"*/{total}"
+
+        # writes only return rows when asked to
+        if method not in ("GET", "HEAD") and "return=representation" not in prefer:
+            return 204 if method != "POST" else 201, None, extra
+
+        if single:
+            if len(result) != 1:
+                raise StubError(406, {
+                    "code": "PGRST116",
+                    "details": f"The result contains {len(result)} rows",
+                    "hint": None,
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                })
+            return status, result[0], extra
+
+        return status, result, extra
+
+    # 2: postgrest filters (column=operator.value), parsed once per request:
+    #    an in.(...) list can hold every user id of the 100k tier
+
+    @staticmethod
+    def parse_filter(column, expression):
+        negate = expression.startswith("not.")
+        if negate:
+            expression = expression[4:]
+        operator, _, value = expression.partition(".")
+        if operator == "in":
+            value = frozenset(next(csv.reader([value.strip("()")], skipinitialspace=True), []))
+        return column, negate, operator, value
+
+    def matches(self, row, filters):
+        for column, negate, operator, value in filters:
+            if self.compare(row.get(column), operator, value) == negate:
+                return False
+        return True
+
+    @staticmethod
+    def compare(stored, operator, value):
+        if operator == "is":
+            return stored is None if value == "null" else str(stored).lower() == value
+        if operator == "in":
+            return SupabaseStub.as_text(stored) in value
+        if operator in ("like", "ilike"):
+            pattern = value.replace("*", "%")
+            text = SupabaseStub.as_text(stored)
+            if operator == "ilike":
+                pattern, text = pattern.lower(), text.lower()
+            return SupabaseStub.like(text, pattern)
+
+        if stored is None:
+            return False
+        if isinstance(stored, bool):
+            target = value == "true"
+        elif isinstance(stored, (int, float)):
+            target = float(value)
+        else:
+            target = value
+
+        if operator == "eq":
+            return stored == target
+        if operator == "neq":
+            return stored != target
+        if operator == "gt":
+            return stored > target
+        if operator == "gte":
+            return stored >= target
+        if operator == "lt":
+            return stored < target
+        if operator == "lte":
+            return stored <= target
+        raise StubError(400, {"code": "PGRST100", "message": f"Unsupported operator {operator}"})
+
+    @staticmethod
+    def as_text(value):
+        if value is None:
+            return "null"
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    @staticmethod
+    def like(text, pattern):
+        # % is the only wildcard the app uses
+        regex = ".*".join(re.escape(part) for part in pattern.split("%"))
+        return re.fullmatch(regex, text, re.DOTALL) is not None
+
+    # 3: order=column.desc.nullslast,column2
+
+    @staticmethod
+    def sort(rows, order):
+        for term in reversed(order.split(",")):
+            column, *modifiers = term.split(".")
+            descending = "desc" in modifiers
+            nulls_first = "nullsfirst" in modifiers or (descending and "nullslast" not in modifiers)
+            present = [row for row in rows if row.get(column) is not None]
+            missing = [row for row in rows if row.get(column) is None]
+            present.sort(key=lambda row: row[column], reverse=descending)
+            rows = missing + present if nulls_first else present + missing
+        return rows
+
+    # 4: select=col1, col2, relation(...)
+
+    @staticmethod
+    def project(row, select):
+        columns = SupabaseStub.split_select(select)
+        if columns == ["*"]:
+            return dict(row)
+
+        result = {}
+        for column in columns:
+            if column == "*":
+                result.update(row)
+            elif "(" in column:
+                # embedded relations are not modelled
+                name = column.split("(", 1)[0].split(":")[0].strip()
+                result[name] = None
+            else:
+                alias, _, source = column.rpartition(":")
+                result[alias or source] = row.get(source)
+        return result
+
+    @staticmethod
+    def split_select(select):
+        columns, depth, current = [], 0, ""
+        for char in select:
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            if char == "," and depth == 0:
+                columns.append(current.strip())
+                current = ""
+            else:
+                current += char
+        if current.strip():
+            columns.append(current.strip())
+        return [" ".join(column.split()) for column in columns]
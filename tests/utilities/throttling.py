@@ -0,0 +1,43 @@
+import os
+
+# chrome devtools network presets (throughput in bytes/s, latency in ms)
+NET_PROFILES = {
+    "slow3g": {"latency": 2000, "downloadThroughput": 50000, "uploadThroughput": 50000},
+    "fast3g": {"latency": 563, "downloadThroughput": 180000, "uploadThroughput": 84375},
+    "4g": {"latency": 165, "downloadThroughput": 1125000, "uploadThroughput": 187500},
+    # busy campus access point: decent bandwidth, slow and uneven round trips
+    "campus-wifi": {"latency": 80, "downloadThroughput": 625000, "uploadThroughput": 250000},
+}
+
+
+# 1: slow down this browser's network and cpu through the devtools
+#    protocol (chrome only; the settings belong to the tab, so windows the
+#    test opens itself run unthrottled)
+
+def apply_throttling(driver, net_profile=None, cpu_throttle=None):
+    if net_profile:
+        conditions = NET_PROFILES[net_profile]
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", dict(conditions, offline=False))
+    if cpu_throttle and cpu_throttle > 1:
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": cpu_throttle})
+    return driver
+
+
+# 2: what a run was throttled with, for metadata and the run history
+
+def throttling_label(net_profile=None, cpu_throttle=None):
+    network = net_profile or "none"
+    cpu = f"{cpu_throttle:g}x" if cpu_throttle and cpu_throttle > 1 else "none"
+    return {"Network profile": network, "CPU throttle": cpu}
+
+
+# 3: environment.properties shown on the allure overview page
+
+def write_allure_environment(results_dir, environment):
+    os.makedirs(results_dir, exist_ok=True)
+    with open(os.path.join(results_dir, "environment.properties"), "w", encoding="utf-8") as file:
+        for key, value in environment.items():
+            # an unescaped space ends a key in a properties file
+            name = key.replace(" ", "\\ ")
+            file.write(f"{name}={value}\n")
@@ -0,0 +1,56 @@
+import pytest
+from pytest_metadata.plugin import metadata_key
+
+from tests.utilities.read_properties import ReadConfig
+from tests.utilities.throttling import NET_PROFILES, throttling_label, write_allure_environment
+
+
+# the throttling itself is applied when conftest's launch_driver starts chrome
+def pytest_addoption(parser):
+    parser.addoption(
+        "--net-profile",
+        action="store",
+        default=None,
+        choices=sorted(NET_PROFILES),
+        help="Emulate a slower network in chrome (devtools presets plus campus-wifi)",
+    )
+    parser.addoption(
+        "--cpu-throttle",
+        action="store",
+        type=float,
+        default=None,
+        help="Slow chrome's cpu down by this factor (e.g. 4 for a low-end laptop)",
+    )
+
+
+def pytest_configure(config):
+    net_profile = config.getoption("--net-profile")
+    cpu_throttle = config.getoption("--cpu-throttle")
+    if net_profile or cpu_throttle:
+        if config.getoption("--browser") != "chrome":
+            raise pytest.UsageError("--net-profile and --cpu-throttle need --browser chrome")
+        if cpu_throttle is not None and cpu_throttle < 1:
+            raise pytest.UsageError("--cpu-throttle is a slowdown factor of 1 or more")
+    config.stash[metadata_key].update(throttling_label(net_profile, cpu_throttle))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        return
+    # only for runs that produced results (not --collect-only or empty runs)
+    ran = session.testscollected and not config.option.collectonly
+    if ran and config.option.allure_report_dir:
+        write_allure_environment(config.option.allure_report_dir, allure_environment(config))
+
+
+# allure overview "environment" widget
+def allure_environment(config):
+    environment = {
+        "Browser": config.getoption("--browser"),
+        "Headless": config.getoption("--headless"),
+        "Base URL": ReadConfig.base_url or "deployed",
+        "Backend": config.getoption("--backend"),
+    }
+    environment.update(throttling_label(config.getoption("--net-profile"), config.getoption("--cpu-throttle")))
+    return environment
@@ -0,0 +1,76 @@
+from selenium.common.exceptions import TimeoutException
+
+# how long an element must stay unchanged before it counts as settled
+QUIET_MS = 150
+
+# text the complaints table shows while supabase data is still loading
+TABLE_LOADING_TEXT = "Loading complaints"
+
+# runs inside the page: a MutationObserver records the last change to the
+# element and the callback fires once it has been quiet for long enough
+SETTLED_SCRIPT = """
+var elementId = arguments[0];
+var loadingText = arguments[1];
+var quietMs = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+var started = Date.now();
+var lastChange = started;
+var observer = null;
+var observed = null;
+
+function isReady(element) {
+    if (!loadingText) return true;
+    return element.childElementCount > 0
+        && element.textContent.indexOf(loadingText) === -1;
+}
+
+function finish(result) {
+    if (observer) observer.disconnect();
+    done(result);
+}
+
+(function check() {
+    var element = document.getElementById(elementId);
+
+    // the element can be replaced by a re-render, observe the current one
+    if (element && element !== observed) {
+        if (observer) observer.disconnect();
+        observer = new MutationObserver(function () { lastChange = Date.now(); });
+        observer.observe(element, {
+            childList: true, subtree: true, characterData: true, attributes: true
+        });
+        observed = element;
+        lastChange = Date.now();
+    }
+
+    var now = Date.now();
+    if (element && now - lastChange >= quietMs && isReady(element)) {
+        finish(true);
+    } else if (now - started >= timeoutMs) {
+        finish(false);
+    } else {
+        setTimeout(check, Math.min(50, quietMs));
+    }
+})();
+"""
+
+
+# 1: wait until an element has stopped changing
+
+def wait_for_settled(driver, element_id, loading_text=None, quiet_ms=QUIET_MS, timeout=20):
+    settled = driver.execute_async_script(
+        SETTLED_SCRIPT, element_id, loading_text, quiet_ms, int(timeout * 1000)
+    )
+    if not settled:
+        raise TimeoutException(f"#{element_id} did not settle within {timeout}s")
+    return True
+
+
+# 2: wait until the complaints table has rendered its rows
+
+def wait_for_table_ready(driver, table_body_id="complaintsTableBody", timeout=20):
+    return wait_for_settled(
+        driver, table_body_id, loading_text=TABLE_LOADING_TEXT, timeout=timeout
+    )
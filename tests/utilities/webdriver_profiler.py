@@ -0,0 +1,151 @@
+import json
+import os
+import sys
+import time
+
+from tests.utilities.artifacts import current_nodeid
+
+base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TESTS_DIR = os.path.join(base_dir, "tests")
+PAGES_DIR = os.path.join(TESTS_DIR, "base_pages")
+
+# result of the last --profile-webdriver run
+PROFILE_FILE = os.path.join(base_dir, "tests", "reports", "webdriver_profile.json")
+
+# commands after which earlier element lookups are stale anyway
+NAVIGATION_COMMANDS = {"get", "refresh", "goBack", "goForward", "switchToWindow", "switchToFrame", "newWindow"}
+FIND_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+
+# this process's counters (xdist workers send theirs to the controller):
+#   tests:   nodeid -> {"commands", "seconds", "by_command": {command: count}}
+#   callers: "caller|command" -> {"count", "seconds", "duplicate_finds"}
+profile = {"tests": {}, "callers": {}}
+
+# lookups of the running test since its last navigation
+seen_finds = {}
+
+
+# 1: route every command of this driver through the profiler
+
+def install_command_profiler(driver):
+    executor = driver.command_executor
+    if getattr(executor, "profiled", False):
+        return driver
+    execute = executor.execute
+
+    def profiled_execute(command, params):
+        started = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            record(command, params, time.perf_counter() - started)
+
+    executor.execute = profiled_execute
+    executor.profiled = True
+    return driver
+
+
+def record(command, params, seconds):
+    nodeid = current_nodeid() or "session"
+    caller = caller_name()
+
+    test = profile["tests"].setdefault(nodeid, {"commands": 0, "seconds": 0.0, "by_command": {}})
+    test["commands"] += 1
+    test["seconds"] += seconds
+    test["by_command"][command] = test["by_command"].get(command, 0) + 1
+
+    entry = profile["callers"].setdefault(f"{caller}|{command}", {"count": 0, "seconds": 0.0, "duplicate_finds": 0})
+    entry["count"] += 1
+    entry["seconds"] += seconds
+
+    # the same lookup again before the page changed could have been reused
+    if nodeid not in seen_finds:
+        seen_finds.clear()
+    seen = seen_finds.setdefault(nodeid, set())
+    if command in NAVIGATION_COMMANDS:
+        seen.clear()
+    elif command in FIND_COMMANDS:
+        params = params or {}
+        key = (command, params.get("id"), params.get("using"), params.get("value"))
+        if key in seen:
+            entry["duplicate_finds"] += 1
+        seen.add(key)
+
+
+# 2: the page-object method that issued the command (innermost frame in
+#    tests/base_pages), else the innermost frame of our own code
+
+def caller_name():
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        path = frame.f_code.co_filename
+        if path.startswith(TESTS_DIR) and not path.endswith("webdriver_profiler.py"):
+            name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+            if path.startswith(PAGES_DIR):
+                return name
+            if fallback is None:
+                fallback = f"{os.path.splitext(os.path.basename(path))[0]}.{name}"
+        frame = frame.f_back
+    return fallback or "selenium"
+
+
+# ------------------------
+#  REPORT
+# ------------------------
+
+# 1: add a worker's counters to this process's
+
+def merge_profile(other):
+    for nodeid, test in other.get("tests", {}).items():
+        target = profile["tests"].setdefault(nodeid, {"commands": 0, "seconds": 0.0, "by_command": {}})
+        target["commands"] += test["commands"]
+        target["seconds"] += test["seconds"]
+        for command, count in test["by_command"].items():
+            target["by_command"][command] = target["by_command"].get(command, 0) + count
+    for key, entry in other.get("callers", {}).items():
+        target = profile["callers"].setdefault(key, {"count": 0, "seconds": 0.0, "duplicate_finds": 0})
+        for field in target:
+            target[field] += entry[field]
+
+
+# 2: per-test command counts and the callers with the most round trips
+
+def profile_summary():
+    tests = [
+        {
+            "nodeid": nodeid,
+            "commands": test["commands"],
+            "seconds": round(test["seconds"], 3),
+            "by_command": dict(sorted(test["by_command"].items(), key=lambda item: -item[1])),
+        }
+        for nodeid, test in profile["tests"].items()
+    ]
+    tests.sort(key=lambda test: -test["commands"])
+
+    callers = []
+    for key, entry in profile["callers"].items():
+        caller, command = key.rsplit("|", 1)
+        callers.append({
+            "caller": caller,
+            "command": command,
+            "count": entry["count"],
+            "seconds": round(entry["seconds"], 3),
+            "mean_ms": round(entry["seconds"] / entry["count"] * 1000, 2),
+            "duplicate_finds": entry["duplicate_finds"],
+        })
+    callers.sort(key=lambda entry: -entry["count"])
+
+    return {
+        "commands": sum(test["commands"] for test in tests),
+        "seconds": round(sum(test["seconds"] for test in tests), 3),
+        "tests": tests,
+        "callers": callers,
+    }
+
+
+def write_profile(summary, path=PROFILE_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=1)
+    return path
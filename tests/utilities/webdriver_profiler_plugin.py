@@ -0,0 +1,47 @@
+import pytest
+
+from tests.utilities.step_timing_plugin import STEP_TABLE_LINES
+from tests.utilities.webdriver_profiler import merge_profile, profile, profile_summary, write_profile
+
+
+# the profiler itself is installed on every pooled browser (conftest's driver_pool)
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-webdriver",
+        action="store_true",
+        default=False,
+        help="Record every WebDriver command with its duration and calling page-object method",
+    )
+
+
+# command counts of a finished xdist worker
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    merge_profile(getattr(node, "workeroutput", {}).get("webdriver_profile", {}))
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["webdriver_profile"] = profile
+    elif session.config.getoption("--profile-webdriver"):
+        session.config._webdriver_profile = profile_summary()
+        write_profile(session.config._webdriver_profile)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = getattr(config, "_webdriver_profile", None)
+    if summary is None:
+        return
+    terminalreporter.write_sep("-", "webdriver commands")
+    terminalreporter.write_line(
+        f"{summary['commands']} commands in {summary['seconds']}s over {len(summary['tests'])} tests"
+    )
+    terminalreporter.write_line(f"{'calls':>7} {'mean':>9} {'repeat finds':>13}  caller -> command")
+    for entry in summary["callers"][:STEP_TABLE_LINES]:
+        terminalreporter.write_line(
+            f"{entry['count']:>7} {entry['mean_ms']:>7}ms {entry['duplicate_finds']:>13}  "
+            f"{entry['caller']} -> {entry['command']}"
+        )
+    terminalreporter.write_line("most commands per test:")
+    for test in summary["tests"][:5]:
+        terminalreporter.write_line(f"{test['commands']:>7}  {test['nodeid']}")